@@ -0,0 +1,407 @@
+"""
+Admission Control: Per-Skill and Per-Tenant Rate and Concurrency Limits
+
+Decides whether a task may start now, must wait, or is refused, before
+any worker time is spent on it. Built into AgentOrchestrator via
+``AgentOrchestrator(registry, admission=AdmissionController(...))``.
+
+Single Responsibility: This module ONLY grants and returns execution
+permits. It never executes skills.
+
+Limits:
+- Token bucket: sustained rate_per_second with bursts up to burst
+- Concurrency cap: at most max_concurrency permits held at once
+- Applied per skill and per tenant (``context.metadata[tenant_key]``);
+  a task must satisfy both
+
+Backpressure:
+    Tasks over a limit wait in a bounded queue (max_queue waiters) for
+    up to queue_timeout_s. A full queue, an expired wait, or a token wait
+    that cannot finish before the timeout is rejected immediately with
+    ResultStatus.REJECTED and a ``retry_after_ms`` hint.
+
+Usage:
+    admission = AdmissionController(
+        skill_limits={"llm_call": Limit(rate_per_second=20, max_concurrency=4)},
+        default_tenant_limit=Limit(rate_per_second=5, burst=10),
+        max_queue=100,
+        queue_timeout_s=2.0
+    )
+    orchestrator = AgentOrchestrator(registry, admission=admission)
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+from .protocols import AgentContext
+
+
+# ============================================================================
+# Logging Configuration
+# ============================================================================
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Domain Models
+# ============================================================================
+
+@dataclass(frozen=True)
+class Limit:
+    """
+    Limits for one skill or tenant. None disables that dimension.
+
+    burst defaults to max(1, rate_per_second).
+    """
+    rate_per_second: float | None = None
+    burst: float | None = None
+    max_concurrency: int | None = None
+
+    def __post_init__(self):
+        if self.rate_per_second is not None and self.rate_per_second <= 0:
+            raise ValueError(
+                f"rate_per_second must be > 0, got {self.rate_per_second}"
+            )
+        if self.burst is not None and self.burst < 1:
+            raise ValueError(f"burst must be >= 1, got {self.burst}")
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be >= 1, got {self.max_concurrency}"
+            )
+
+
+@dataclass(frozen=True)
+class AdmissionStats:
+    """Point-in-time admission counters."""
+    admitted: int
+    queued: int
+    rejected: int
+    waiting: int
+    in_flight: int
+
+
+class AdmissionRejected(Exception):
+    """Raised by AdmissionController.acquire when a task is refused."""
+
+    def __init__(self, reason: str, retry_after_s: float | None = None):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after_s = retry_after_s
+
+
+# ============================================================================
+# Token Bucket
+# ============================================================================
+
+class TokenBucket:
+    """
+    Classic token bucket: refills at rate tokens/s up to capacity.
+
+    Time is passed in explicitly (time.monotonic() seconds), which keeps
+    the bucket deterministic and cheap. Not thread-safe on its own;
+    AdmissionController serializes access.
+    """
+
+    __slots__ = ("rate", "capacity", "tokens", "updated_at")
+
+    def __init__(self, rate: float, capacity: float, now: float | None = None):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic() if now is None else now
+
+    def wait_time(self, now: float, tokens: float = 1.0) -> float:
+        """Seconds until tokens are available (0.0 if available now)."""
+        self._refill(now)
+        missing = tokens - self.tokens
+        return missing / self.rate if missing > 0 else 0.0
+
+    def take(self, now: float, tokens: float = 1.0) -> bool:
+        """Consume tokens if available."""
+        self._refill(now)
+        if self.tokens < tokens:
+            return False
+        self.tokens -= tokens
+        return True
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+
+class _Gate:
+    """Rate and concurrency state for one skill or tenant."""
+
+    __slots__ = ("label", "bucket", "max_concurrency", "in_flight")
+
+    def __init__(self, label: str, limit: Limit):
+        self.label = label
+        self.bucket = (
+            TokenBucket(
+                limit.rate_per_second,
+                limit.burst or max(1.0, limit.rate_per_second)
+            )
+            if limit.rate_per_second is not None else None
+        )
+        self.max_concurrency = limit.max_concurrency
+        self.in_flight = 0
+
+    def wait_time(self, now: float) -> float | None:
+        """0.0: open; > 0: seconds until a token; None: at concurrency cap."""
+        if (self.max_concurrency is not None
+                and self.in_flight >= self.max_concurrency):
+            return None
+        return self.bucket.wait_time(now) if self.bucket else 0.0
+
+
+# ============================================================================
+# Permits
+# ============================================================================
+
+class Permit:
+    """
+    Right to run one task. Release exactly once (idempotent).
+
+    Usable as a context manager.
+    """
+
+    __slots__ = ("_controller", "_gates", "_released")
+
+    def __init__(self, controller: "AdmissionController", gates: tuple[_Gate, ...]):
+        self._controller = controller
+        self._gates = gates
+        self._released = False
+
+    def release(self) -> None:
+        if not self._released:
+            self._released = True
+            self._controller._release(self._gates)
+
+    def __enter__(self) -> "Permit":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+
+# ============================================================================
+# Admission Controller
+# ============================================================================
+
+class AdmissionController:
+    """
+    Grants permits under per-skill and per-tenant limits.
+
+    Design Principles:
+    - Fail fast under overload: bounded waiting, then explicit rejection
+    - Atomic: a permit takes tokens and concurrency slots from the skill
+      and tenant gates together, or from neither
+    - Thread-safe: one lock and condition; waiters are woken on every
+      release and re-check their limits (no strict FIFO guarantee)
+    """
+
+    def __init__(
+        self,
+        skill_limits: Mapping[str, Limit] | None = None,
+        tenant_limits: Mapping[str, Limit] | None = None,
+        default_skill_limit: Limit | None = None,
+        default_tenant_limit: Limit | None = None,
+        tenant_key: str = "tenant",
+        max_queue: int = 100,
+        queue_timeout_s: float = 1.0
+    ):
+        """
+        Args:
+            skill_limits: Limits by skill name
+            tenant_limits: Limits by tenant id
+            default_skill_limit: Limit for skills not in skill_limits
+            default_tenant_limit: Limit for tenants not in tenant_limits
+                                  (each tenant gets its own bucket)
+            tenant_key: context.metadata key holding the tenant id;
+                        tasks without it are only skill-limited
+            max_queue: Maximum tasks waiting at once (0: never wait)
+            queue_timeout_s: Maximum time a task waits for admission
+        """
+        if max_queue < 0:
+            raise ValueError(f"max_queue must be >= 0, got {max_queue}")
+        if queue_timeout_s < 0:
+            raise ValueError(
+                f"queue_timeout_s must be >= 0, got {queue_timeout_s}"
+            )
+
+        self.skill_limits = dict(skill_limits or {})
+        self.tenant_limits = dict(tenant_limits or {})
+        self.default_skill_limit = default_skill_limit
+        self.default_tenant_limit = default_tenant_limit
+        self.tenant_key = tenant_key
+        self.max_queue = max_queue
+        self.queue_timeout_s = queue_timeout_s
+
+        self._condition = threading.Condition()
+        self._skill_gates: dict[str, _Gate] = {}
+        self._tenant_gates: dict[Any, _Gate] = {}
+        self._waiting = 0
+        self._in_flight = 0
+        self._admitted = 0
+        self._queued = 0
+        self._rejected = 0
+
+    # ========================================================================
+    # Public API
+    # ========================================================================
+
+    def try_acquire(
+        self,
+        skill_name: str,
+        context: AgentContext
+    ) -> Permit | None:
+        """Take a permit if one is available right now, else None."""
+        with self._condition:
+            gates = self._gates_for(skill_name, context)
+            now = time.monotonic()
+            if self._wait_time(gates, now) == 0.0:
+                return self._grant(gates, now)
+            return None
+
+    def acquire(
+        self,
+        skill_name: str,
+        context: AgentContext,
+        timeout_s: float | None = None
+    ) -> Permit:
+        """
+        Take a permit, waiting in the bounded queue if necessary.
+
+        Args:
+            skill_name: Skill about to run
+            context: Its context (tenant is read from metadata)
+            timeout_s: Override queue_timeout_s for this call
+
+        Raises:
+            AdmissionRejected: Queue full, or no permit within the timeout
+        """
+        timeout_s = self.queue_timeout_s if timeout_s is None else timeout_s
+
+        with self._condition:
+            gates = self._gates_for(skill_name, context)
+            now = time.monotonic()
+            wait = self._wait_time(gates, now)
+
+            if wait == 0.0:
+                return self._grant(gates, now)
+
+            if self._waiting >= self.max_queue:
+                self._rejected += 1
+                raise AdmissionRejected(
+                    f"admission queue full ({self.max_queue} waiting)",
+                    retry_after_s=wait
+                )
+
+            deadline = now + timeout_s
+            self._waiting += 1
+            self._queued += 1
+            try:
+                while True:
+                    remaining = deadline - now
+                    if wait is not None and wait > remaining:
+                        # A token cannot arrive in time: refuse now
+                        self._rejected += 1
+                        raise AdmissionRejected(
+                            f"rate limit: no capacity within {timeout_s:g}s",
+                            retry_after_s=wait
+                        )
+                    if remaining <= 0:
+                        self._rejected += 1
+                        raise AdmissionRejected(
+                            f"concurrency limit: no slot within {timeout_s:g}s"
+                        )
+
+                    self._condition.wait(
+                        remaining if wait is None else wait
+                    )
+                    now = time.monotonic()
+                    wait = self._wait_time(gates, now)
+                    if wait == 0.0:
+                        return self._grant(gates, now)
+            finally:
+                self._waiting -= 1
+
+    def stats(self) -> AdmissionStats:
+        """Snapshot admission counters."""
+        with self._condition:
+            return AdmissionStats(
+                admitted=self._admitted,
+                queued=self._queued,
+                rejected=self._rejected,
+                waiting=self._waiting,
+                in_flight=self._in_flight
+            )
+
+    # ========================================================================
+    # Implementation (Private, lock held unless noted)
+    # ========================================================================
+
+    def _gates_for(
+        self,
+        skill_name: str,
+        context: AgentContext
+    ) -> tuple[_Gate, ...]:
+        gates = []
+
+        gate = self._skill_gates.get(skill_name)
+        if gate is None:
+            limit = self.skill_limits.get(skill_name, self.default_skill_limit)
+            if limit is not None:
+                gate = self._skill_gates[skill_name] = _Gate(
+                    f"skill:{skill_name}", limit
+                )
+        if gate is not None:
+            gates.append(gate)
+
+        tenant = context.metadata.get(self.tenant_key)
+        if tenant is not None:
+            gate = self._tenant_gates.get(tenant)
+            if gate is None:
+                limit = self.tenant_limits.get(tenant, self.default_tenant_limit)
+                if limit is not None:
+                    gate = self._tenant_gates[tenant] = _Gate(
+                        f"tenant:{tenant}", limit
+                    )
+            if gate is not None:
+                gates.append(gate)
+
+        return tuple(gates)
+
+    @staticmethod
+    def _wait_time(gates: tuple[_Gate, ...], now: float) -> float | None:
+        """Longest wait across gates; None if any is at its concurrency cap."""
+        longest = 0.0
+        for gate in gates:
+            wait = gate.wait_time(now)
+            if wait is None:
+                return None
+            longest = max(longest, wait)
+        return longest
+
+    def _grant(self, gates: tuple[_Gate, ...], now: float) -> Permit:
+        for gate in gates:
+            if gate.bucket is not None:
+                gate.bucket.take(now)
+            gate.in_flight += 1
+        self._in_flight += 1
+        self._admitted += 1
+        return Permit(self, gates)
+
+    def _release(self, gates: tuple[_Gate, ...]) -> None:
+        """Return concurrency slots (acquires the lock)."""
+        with self._condition:
+            for gate in gates:
+                gate.in_flight -= 1
+            self._in_flight -= 1
+            self._condition.notify_all()
@@ -0,0 +1,321 @@
+"""
+Batch Runner: Stream JSONL Tasks Through the Orchestrator
+
+Reads one task per line, executes it through AgentOrchestrator with
+bounded concurrency, and writes one result per line as soon as it can.
+Inputs of any size run in constant memory: only the tasks inside the
+in-flight window (plus one read-ahead chunk) are ever held.
+
+Single Responsibility: This module ONLY streams lines in and results out.
+Execution semantics (error containment, middleware, limits) are the
+orchestrator's; encoding and boundary validation are codec.py's.
+
+Line Format:
+    Input:  {"skill": "analyze_data", "context": {"task": "stats", ...}}
+            (context is optional and defaults to {"task": skill};
+            blank lines are skipped)
+    Output: {"index": 0, "skill": "analyze_data", "result": {...}}
+            index is the task's position among the input tasks, so
+            as-completed output can be matched back to its input
+
+Ordering:
+- Ordered (default): results are written in input order. A slow task
+  holds back later results, so the window also bounds the reorder
+  buffer; reading pauses while it is full.
+- As completed (--unordered): results are written the moment they
+  finish; the window only bounds tasks in flight.
+
+Invalid Lines:
+    Lines that are not valid JSON or not a valid task produce a FAILURE
+    result for that index instead of aborting the run.
+
+Usage:
+    python -m core.batch_runner skills/ tasks.jsonl -o results.jsonl
+    cat tasks.jsonl | python -m core.batch_runner skills/ - --unordered
+
+    with open("tasks.jsonl", "rb") as source, open("out.jsonl", "wb") as sink:
+        stats = asyncio.run(run_jsonl(orchestrator, source, sink))
+"""
+
+import argparse
+import asyncio
+import itertools
+import logging
+import os
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO
+
+from .codec import JSON_BACKEND, dumps, loads, result_to_dict, task_from_dict
+from .orchestrator import AgentOrchestrator
+from .protocols import AgentContext, AgentResult, ResultStatus
+from .registry import SkillRegistry
+
+
+# ============================================================================
+# Logging Configuration
+# ============================================================================
+
+logger = logging.getLogger(__name__)
+
+
+# Lines read per trip to the reader thread
+_READ_CHUNK_LINES = 256
+
+# (input index, skill name or None for an invalid line, result)
+Outcome = tuple[int, str | None, AgentResult]
+
+
+# ============================================================================
+# Domain Models
+# ============================================================================
+
+@dataclass(frozen=True)
+class RunnerStats:
+    """Counters for one run (invalid lines also count as failed)."""
+    tasks: int
+    succeeded: int
+    failed: int
+    invalid: int
+    elapsed_s: float
+
+    @property
+    def throughput(self) -> float:
+        """Tasks per second."""
+        return self.tasks / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+async def run_jsonl(
+    orchestrator: AgentOrchestrator,
+    source: BinaryIO,
+    sink: BinaryIO,
+    concurrency: int = 32,
+    ordered: bool = True,
+    window: int | None = None
+) -> RunnerStats:
+    """
+    Execute every task line in source and write result lines to sink.
+
+    Args:
+        orchestrator: Executes the tasks (execute_task_async)
+        source: Binary stream of JSONL tasks
+        sink: Binary stream for JSONL results (flushed as results land)
+        concurrency: Tasks executing at once
+        ordered: Write results in input order (else as completed)
+        window: Tasks read but not yet written (default: 4 * concurrency
+                when ordered, concurrency otherwise); bounds memory
+
+    Returns:
+        RunnerStats for the run
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+    if window is None:
+        window = concurrency * 4 if ordered else concurrency
+    if window < concurrency:
+        raise ValueError(f"window ({window}) must be >= concurrency ({concurrency})")
+
+    start = time.perf_counter()
+    slots = asyncio.Semaphore(concurrency)
+    counts = {"tasks": 0, "succeeded": 0, "failed": 0, "invalid": 0}
+
+    async def execute(index: int, skill_name: str, context: AgentContext) -> Outcome:
+        async with slots:
+            result = await orchestrator.execute_task_async(skill_name, context)
+        return index, skill_name, result
+
+    def start_task(index: int, line_number: int, line: bytes) -> asyncio.Future:
+        try:
+            skill_name, context = task_from_dict(loads(line))
+        except ValueError as e:
+            counts["invalid"] += 1
+            task = asyncio.get_running_loop().create_future()
+            task.set_result((index, None, _invalid_result(line_number, e)))
+            return task
+        return asyncio.ensure_future(execute(index, skill_name, context))
+
+    def write(task: asyncio.Future) -> None:
+        index, skill_name, result = task.result()
+        counts["tasks"] += 1
+        if result.status == ResultStatus.SUCCESS:
+            counts["succeeded"] += 1
+        else:
+            counts["failed"] += 1
+        sink.write(dumps({
+            "index": index,
+            "skill": skill_name,
+            "result": result_to_dict(result),
+        }) + b"\n")
+
+    if ordered:
+        pending: deque[asyncio.Future] = deque()
+
+        async def drain() -> None:
+            # Wait for the head, then write every result ready behind it
+            await asyncio.wait((pending[0],))
+            while pending and pending[0].done():
+                write(pending.popleft())
+            sink.flush()
+    else:
+        pending: set[asyncio.Future] = set()
+
+        async def drain() -> None:
+            done, _ = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                pending.remove(task)
+                write(task)
+            sink.flush()
+
+    add = pending.append if ordered else pending.add
+    index = 0
+    try:
+        async for line_number, line in _read_lines(source, window):
+            while len(pending) >= window:
+                await drain()
+            add(start_task(index, line_number, line))
+            index += 1
+
+        while pending:
+            await drain()
+    finally:
+        for task in pending:
+            task.cancel()
+
+    return RunnerStats(elapsed_s=time.perf_counter() - start, **counts)
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+async def _read_lines(
+    source: BinaryIO,
+    window: int
+) -> AsyncIterator[tuple[int, bytes]]:
+    """
+    Non-blank lines with their 1-based line numbers.
+
+    Reads happen in chunks on a worker thread, so a slow pipe never
+    blocks the event loop and the thread hop is amortized.
+    """
+    chunk_size = min(_READ_CHUNK_LINES, window)
+    numbered = enumerate(source, start=1)
+    while True:
+        chunk = await asyncio.to_thread(
+            lambda: list(itertools.islice(numbered, chunk_size))
+        )
+        if not chunk:
+            return
+        for line_number, line in chunk:
+            line = line.strip()
+            if line:
+                yield line_number, line
+
+
+def _invalid_result(line_number: int, error: Exception) -> AgentResult:
+    return AgentResult.trusted(
+        status=ResultStatus.FAILURE,
+        message=f"Invalid task on line {line_number}: {error}",
+        error_details={
+            "line": line_number,
+            "exception_type": type(error).__name__,
+        },
+    )
+
+
+# ============================================================================
+# Command Line
+# ============================================================================
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m core.batch_runner",
+        description="Run JSONL tasks through the orchestrator, "
+                    "writing JSONL results."
+    )
+    parser.add_argument("skills_dir", type=Path, help="Skills directory")
+    parser.add_argument(
+        "input",
+        nargs="?",
+        default="-",
+        help="Task file, or - for stdin (default: -)"
+    )
+    parser.add_argument(
+        "-o", "--output",
+        default="-",
+        help="Result file, or - for stdout (default: -)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=32,
+        help="Tasks executing at once (default: 32)"
+    )
+    parser.add_argument(
+        "--window",
+        type=int,
+        help="Tasks held in memory (default: 4x concurrency when ordered, "
+             "concurrency when unordered)"
+    )
+    parser.add_argument(
+        "--unordered",
+        action="store_true",
+        help="Write results as they complete instead of in input order"
+    )
+    parser.add_argument(
+        "--log-tasks",
+        action="store_true",
+        help="Log every execution (off by default for throughput)"
+    )
+    args = parser.parse_args(argv)
+
+    # Logs go to stderr so they never mix with results on stdout
+    logging.basicConfig(
+        level=os.environ.get("LOG_LEVEL", "WARNING"),
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+        stream=sys.stderr
+    )
+
+    registry = SkillRegistry(args.skills_dir)
+    orchestrator = AgentOrchestrator(registry, enable_logging=args.log_tasks)
+
+    source = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+    sink = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    try:
+        stats = asyncio.run(run_jsonl(
+            orchestrator,
+            source,
+            sink,
+            concurrency=args.concurrency,
+            ordered=not args.unordered,
+            window=args.window
+        ))
+    except ValueError as e:
+        parser.error(str(e))
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+        if sink is not sys.stdout.buffer:
+            sink.close()
+
+    print(
+        f"✓ {stats.tasks} tasks ({stats.succeeded} succeeded, "
+        f"{stats.failed} failed, {stats.invalid} invalid) in "
+        f"{stats.elapsed_s:.2f}s ({stats.throughput:,.0f} tasks/s, "
+        f"json={JSON_BACKEND})",
+        file=sys.stderr
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,319 @@
+"""
+Micro-Batching: Collect Concurrent Requests into execute_many Calls
+
+Skills implementing BatchAgentSkill (``execute_many(contexts)``) amortize
+per-call overhead across many requests. A MicroBatcher queues concurrent
+requests for one such skill and dispatches them together once
+max_batch_size requests are waiting or the oldest has waited
+max_wait_ms, whichever comes first.
+
+Single Responsibility: This module ONLY groups requests and fans the
+results back out. Error containment, timeouts, admission and middleware
+stay per request in AgentOrchestrator, which submits to the batcher
+from the innermost layer of its execution plan.
+
+Adaptive Batch Size:
+    While max_concurrent_batches batches are already running, requests
+    keep queueing, so batches grow with load and stay small (low
+    latency) when traffic is light.
+
+Cancellation:
+    Requests whose future was cancelled before dispatch (a caller timed
+    out or was cancelled) are dropped from the batch.
+
+Exported Events (MetricsRegistry, per skill):
+    batches, batched_items
+    Mean batch size = batched_items / batches.
+
+Usage:
+    # skills/embed.py
+    def execute_many(contexts: list[AgentContext]) -> list[AgentResult]:
+        vectors = model.encode([c.parameters["text"] for c in contexts])
+        return [AgentResult(status=ResultStatus.SUCCESS, data=v, message="ok")
+                for v in vectors]
+
+    orchestrator = AgentOrchestrator(
+        registry,
+        batching=BatchPolicy(max_batch_size=64, max_wait_ms=2.0)
+    )
+"""
+
+import asyncio
+import dataclasses
+import inspect
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Mapping
+
+from .protocols import AgentContext, AgentResult, BatchSkillFunc
+
+if TYPE_CHECKING:
+    from .metrics import MetricsRegistry
+
+
+# ============================================================================
+# Logging Configuration
+# ============================================================================
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Domain Models
+# ============================================================================
+
+@dataclass(frozen=True)
+class BatchPolicy:
+    """
+    Micro-batch limits.
+
+    Skills can narrow them through SkillMetadata ("max_batch_size",
+    "max_wait_ms"); see for_skill().
+    """
+    max_batch_size: int = 32
+    max_wait_ms: float = 2.0
+    max_concurrent_batches: int = 1
+
+    def __post_init__(self):
+        if self.max_batch_size < 1:
+            raise ValueError(
+                f"max_batch_size must be >= 1, got {self.max_batch_size}"
+            )
+        if self.max_wait_ms < 0:
+            raise ValueError(f"max_wait_ms must be >= 0, got {self.max_wait_ms}")
+        if self.max_concurrent_batches < 1:
+            raise ValueError(
+                f"max_concurrent_batches must be >= 1, "
+                f"got {self.max_concurrent_batches}"
+            )
+
+    def for_skill(self, metadata: Mapping[str, Any]) -> "BatchPolicy":
+        """This policy with a skill's declared batch limits applied."""
+        overrides = {
+            key: metadata[key]
+            for key in ("max_batch_size", "max_wait_ms")
+            if key in metadata
+        }
+        return dataclasses.replace(self, **overrides) if overrides else self
+
+
+@dataclass(frozen=True)
+class BatchStats:
+    """Point-in-time batching counters for one skill."""
+    batches: int
+    items: int
+    full_batches: int
+    largest_batch: int
+    queued: int
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.items / self.batches if self.batches else 0.0
+
+
+# ============================================================================
+# Micro-Batcher
+# ============================================================================
+
+class MicroBatcher:
+    """
+    Groups concurrent requests for one batch skill.
+
+    Thread-safe. The collector thread (a daemon) and the batch workers are
+    started on first use, so an unused batcher costs nothing.
+
+    Futures resolve to whatever execute_many returned for the context (not
+    validated here), or raise the exception that failed the whole batch.
+    """
+
+    def __init__(
+        self,
+        skill_name: str,
+        execute_many: BatchSkillFunc,
+        policy: BatchPolicy = BatchPolicy(),
+        metrics: "MetricsRegistry | None" = None
+    ):
+        """
+        Args:
+            skill_name: Skill being batched (for logs and metrics)
+            execute_many: The skill's batch function (sync or async)
+            policy: Batch size, wait and concurrency limits
+            metrics: Optional sink for "batches"/"batched_items" events
+        """
+        self.skill_name = skill_name
+        self.execute_many = execute_many
+        self.policy = policy
+        self._metrics = metrics
+        self._max_wait_s = policy.max_wait_ms / 1000
+
+        self._queue: deque[tuple[AgentContext, Future, float]] = deque()
+        self._cond = threading.Condition()
+        self._slots = threading.Semaphore(policy.max_concurrent_batches)
+        self._collector: threading.Thread | None = None
+        self._workers: ThreadPoolExecutor | None = None
+        self._closed = False
+
+        self._batches = 0
+        self._items = 0
+        self._full_batches = 0
+        self._largest_batch = 0
+
+    # ========================================================================
+    # Public API
+    # ========================================================================
+
+    def submit(self, context: AgentContext) -> Future:
+        """
+        Queue one request.
+
+        Returns:
+            Future resolving to this context's result; cancel it to drop
+            the request if its batch has not been dispatched yet
+
+        Raises:
+            RuntimeError: The batcher is closed
+        """
+        future: Future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError(f"Batcher for {self.skill_name} is closed")
+            self._queue.append((context, future, time.monotonic()))
+            if self._collector is None:
+                self._start()
+            if len(self._queue) == 1 or len(self._queue) >= self.policy.max_batch_size:
+                self._cond.notify()
+        return future
+
+    async def submit_async(self, context: AgentContext) -> AgentResult:
+        """
+        Queue one request and await its result without holding a thread.
+
+        Cancelling the awaiting task drops a request not yet dispatched.
+        """
+        return await asyncio.wrap_future(self.submit(context))
+
+    def stats(self) -> BatchStats:
+        """Snapshot batching counters."""
+        with self._cond:
+            return BatchStats(
+                batches=self._batches,
+                items=self._items,
+                full_batches=self._full_batches,
+                largest_batch=self._largest_batch,
+                queued=len(self._queue)
+            )
+
+    def close(self) -> None:
+        """
+        Stop accepting requests. Queued requests are still dispatched.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+
+    # ========================================================================
+    # Implementation (Private)
+    # ========================================================================
+
+    def _start(self) -> None:
+        self._workers = ThreadPoolExecutor(
+            max_workers=self.policy.max_concurrent_batches,
+            thread_name_prefix=f"batch-{self.skill_name}"
+        )
+        self._collector = threading.Thread(
+            target=self._collect,
+            name=f"batcher-{self.skill_name}",
+            daemon=True
+        )
+        self._collector.start()
+
+    def _collect(self) -> None:
+        """Form batches until closed and drained."""
+        max_batch_size = self.policy.max_batch_size
+
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    break
+
+            # Requests keep queueing while all batch slots are busy
+            self._slots.acquire()
+
+            with self._cond:
+                flush_at = self._queue[0][2] + self._max_wait_s
+                while len(self._queue) < max_batch_size and not self._closed:
+                    remaining = flush_at - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                count = min(len(self._queue), max_batch_size)
+                taken = [self._queue.popleft() for _ in range(count)]
+
+            # Drop requests whose callers gave up while queued
+            batch = [
+                (context, future) for context, future, _ in taken
+                if future.set_running_or_notify_cancel()
+            ]
+            if not batch:
+                self._slots.release()
+                continue
+
+            self._workers.submit(self._run, batch)
+
+        self._workers.shutdown(wait=False)
+
+    def _run(self, batch: list[tuple[AgentContext, Future]]) -> None:
+        """Execute one batch and resolve its futures."""
+        try:
+            contexts = [context for context, _ in batch]
+            try:
+                results = self.execute_many(contexts)
+                if inspect.isawaitable(results):
+                    results = asyncio.run(_await(results))
+                results = list(results)
+                if len(results) != len(batch):
+                    raise ValueError(
+                        f"execute_many returned {len(results)} results "
+                        f"for {len(batch)} contexts"
+                    )
+            except Exception as e:
+                # Each caller's result carries the traceback
+                logger.error(
+                    f"✗ Batch of {len(batch)} failed for {self.skill_name}: {e}"
+                )
+                for _, future in batch:
+                    future.set_exception(e)
+            else:
+                for (_, future), result in zip(batch, results):
+                    future.set_result(result)
+        finally:
+            self._slots.release()
+            self._record(len(batch))
+
+    def _record(self, size: int) -> None:
+        with self._cond:
+            self._batches += 1
+            self._items += size
+            self._largest_batch = max(self._largest_batch, size)
+            if size >= self.policy.max_batch_size:
+                self._full_batches += 1
+
+        if self._metrics is not None:
+            self._metrics.increment(self.skill_name, "batches")
+            self._metrics.increment(self.skill_name, "batched_items", size)
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+async def _await(awaitable: Any) -> Any:
+    """Adapt any awaitable into a coroutine for asyncio.run()."""
+    return await awaitable
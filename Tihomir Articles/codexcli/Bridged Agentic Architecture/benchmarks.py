@@ -0,0 +1,670 @@
+"""
+Benchmarks: Orchestrator, Registry, and Decorator Overhead Suite
+
+Reproducible measurements of the framework's own cost, run against
+throwaway skills directories so that only orchestration is measured.
+
+Suites:
+- registry:   SkillRegistry discovery time and get_skill lookup time
+              against skill count
+- dispatch:   execute_task overhead against middleware depth
+- decorators: per-call cost of each decorator in decorators.py
+- batch:      throughput of every batch execution mode on an I/O-bound
+              skill
+- models:     validated vs trusted (AgentResult.trusted,
+              AgentContext.trusted) construction, and context
+              derivation (model_copy vs derive), against payload size
+
+Statistics:
+    Every measurement runs warmup rounds first (discarded: imports,
+    first-call plan compilation, pool start-up), then N timed repeats.
+    Medians are compared against baselines; mean, stdev, min and max are
+    reported alongside.
+
+Usage:
+    python -m core.benchmarks                          # all suites
+    python -m core.benchmarks --suite dispatch --quick
+    python -m core.benchmarks --json results.json
+    python -m core.benchmarks --baseline baseline.json --threshold 0.10
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import textwrap
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+from . import decorators
+from .executors import ProcessPoolBatchExecutor, ThreadPoolBatchExecutor
+from .orchestrator import AgentOrchestrator
+from .protocols import AgentContext, AgentResult, ResultStatus
+from .registry import SkillRegistry
+from .scheduler import PriorityScheduler
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+NOOP_SKILL_SOURCE = textwrap.dedent(f'''
+    from {__package__}.protocols import AgentContext, AgentResult, ResultStatus
+
+    def execute(context: AgentContext) -> AgentResult:
+        return AgentResult(status=ResultStatus.SUCCESS, message="ok")
+''')
+
+SLEEP_SKILL_SOURCE = textwrap.dedent(f'''
+    import time
+    from {__package__}.protocols import AgentContext, AgentResult, ResultStatus
+
+    def execute(context: AgentContext) -> AgentResult:
+        time.sleep(context.parameters.get("sleep_s", 0.001))
+        return AgentResult(status=ResultStatus.SUCCESS, message="ok")
+''')
+
+ASYNC_SLEEP_SKILL_SOURCE = textwrap.dedent(f'''
+    import asyncio
+    from {__package__}.protocols import AgentContext, AgentResult, ResultStatus
+
+    async def execute(context: AgentContext) -> AgentResult:
+        await asyncio.sleep(context.parameters.get("sleep_s", 0.001))
+        return AgentResult(status=ResultStatus.SUCCESS, message="ok")
+''')
+
+
+def _passthrough_middleware(
+    context: AgentContext,
+    next_handler: Callable
+) -> AgentResult:
+    return next_handler(context)
+
+
+def _noop_skill(context: AgentContext) -> AgentResult:
+    return AgentResult(status=ResultStatus.SUCCESS, message="ok")
+
+
+def make_noop_registry(skills_dir: Path, count: int = 1) -> SkillRegistry:
+    """
+    Write no-op skills into skills_dir and discover them.
+
+    The first skill is named "noop", the rest "noop_<i>".
+    """
+    write_skills(skills_dir, NOOP_SKILL_SOURCE, count)
+    return SkillRegistry(skills_dir)
+
+
+def write_skills(skills_dir: Path, source: str, count: int) -> list[str]:
+    """Write count copies of a skill module; return their names."""
+    names = ["noop"] + [f"noop_{i}" for i in range(1, count)]
+    for name in names:
+        (skills_dir / f"{name}.py").write_text(source)
+    return names
+
+
+# ============================================================================
+# Measurement
+# ============================================================================
+
+@dataclass
+class BenchResult:
+    """
+    Warmup-adjusted statistics for one benchmark configuration.
+
+    samples holds one value per timed repeat, in ``unit``.
+    higher_is_better tells baseline comparison which way is a regression.
+    """
+    suite: str
+    name: str
+    params: dict[str, Any]
+    unit: str
+    samples: list[float]
+    higher_is_better: bool = False
+    warmup: int = 0
+
+    @property
+    def key(self) -> str:
+        """Stable identity used to match results against a baseline."""
+        params = ",".join(f"{k}={v}" for k, v in sorted(self.params.items()))
+        return f"{self.suite}/{self.name}[{params}]"
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.samples)
+
+    @property
+    def stdev(self) -> float:
+        return statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            **asdict(self),
+            "key": self.key,
+            "median": self.median,
+            "mean": self.mean,
+            "stdev": self.stdev,
+            "min": min(self.samples),
+            "max": max(self.samples),
+        }
+
+
+@dataclass
+class BenchConfig:
+    """Repeat counts; quick() trades precision for a fast smoke run."""
+    iterations: int = 20_000
+    repeats: int = 7
+    warmup: int = 2
+    batch_size: int = 200
+
+    @classmethod
+    def quick(cls) -> "BenchConfig":
+        return cls(iterations=2_000, repeats=3, warmup=1, batch_size=50)
+
+
+def sample(
+    fn: Callable[[], float],
+    repeats: int,
+    warmup: int
+) -> list[float]:
+    """Run fn warmup times (discarded), then return repeats samples."""
+    for _ in range(warmup):
+        fn()
+    return [fn() for _ in range(repeats)]
+
+
+def ns_per_call_sampler(
+    fn: Callable[[], object],
+    iterations: int
+) -> Callable[[], float]:
+    """Build a sampler that returns mean nanoseconds per call of fn."""
+    def run() -> float:
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            fn()
+        return (time.perf_counter_ns() - start) / iterations
+    return run
+
+
+# ============================================================================
+# Suites
+# ============================================================================
+
+def bench_registry(
+    config: BenchConfig,
+    skill_counts: tuple[int, ...] = (10, 100, 500)
+) -> list[BenchResult]:
+    """
+    Discovery time and lookup cost against the number of skill modules.
+
+    Discovery imports every module, so it is expected to grow linearly;
+    get_skill should stay flat (dict lookup).
+    """
+    results = []
+
+    for count in skill_counts:
+        with tempfile.TemporaryDirectory() as tmp:
+            skills_dir = Path(tmp)
+            names = write_skills(skills_dir, NOOP_SKILL_SOURCE, count)
+
+            def discover() -> float:
+                start = time.perf_counter_ns()
+                SkillRegistry(skills_dir)
+                return (time.perf_counter_ns() - start) / 1e6
+
+            results.append(BenchResult(
+                suite="registry",
+                name="discovery",
+                params={"skills": count},
+                unit="ms",
+                samples=sample(discover, config.repeats, config.warmup),
+                warmup=config.warmup
+            ))
+
+            registry = SkillRegistry(skills_dir)
+            target = names[-1]
+            results.append(BenchResult(
+                suite="registry",
+                name="get_skill",
+                params={"skills": count},
+                unit="ns/call",
+                samples=sample(
+                    ns_per_call_sampler(
+                        lambda: registry.get_skill(target), config.iterations
+                    ),
+                    config.repeats,
+                    config.warmup
+                ),
+                warmup=config.warmup
+            ))
+
+    return results
+
+
+def bench_dispatch(
+    config: BenchConfig,
+    depths: tuple[int, ...] = (0, 1, 2, 4, 8, 16)
+) -> list[BenchResult]:
+    """
+    execute_task cost against middleware depth.
+
+    Includes a "direct" row (calling the skill function) as the floor,
+    and covers both the fast path and the timed/logged path.
+    """
+    context = AgentContext(task="noop")
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        registry = make_noop_registry(Path(tmp))
+        skill = registry.get_skill("noop")
+
+        results.append(BenchResult(
+            suite="dispatch",
+            name="direct",
+            params={},
+            unit="ns/call",
+            samples=sample(
+                ns_per_call_sampler(lambda: skill(context), config.iterations),
+                config.repeats,
+                config.warmup
+            ),
+            warmup=config.warmup
+        ))
+
+        for timing in (False, True):
+            for depth in depths:
+                orchestrator = AgentOrchestrator(
+                    registry,
+                    enable_timing=timing,
+                    enable_logging=False
+                )
+                for _ in range(depth):
+                    orchestrator.add_middleware(_passthrough_middleware)
+
+                results.append(BenchResult(
+                    suite="dispatch",
+                    name="execute_task",
+                    params={"depth": depth, "timing": timing},
+                    unit="ns/call",
+                    samples=sample(
+                        ns_per_call_sampler(
+                            lambda: orchestrator.execute_task("noop", context),
+                            config.iterations
+                        ),
+                        config.repeats,
+                        config.warmup
+                    ),
+                    warmup=config.warmup
+                ))
+
+    return results
+
+
+def bench_decorators(config: BenchConfig) -> list[BenchResult]:
+    """
+    Per-call cost of each decorator wrapped around a no-op skill.
+
+    cached is measured on the hit path and retry on the success path
+    (the common cases); subtract the "undecorated" row for overhead.
+    """
+    context = AgentContext(task="noop", parameters={"dataset": [1, 2, 3]})
+
+    variants: dict[str, Callable] = {
+        "undecorated": _noop_skill,
+        "validate_context": decorators.validate_context(_noop_skill),
+        "timed": decorators.timed(_noop_skill),
+        "logged": decorators.logged(_noop_skill),
+        "cached_hit": decorators.cached(ttl_seconds=3600)(_noop_skill),
+        "retry_success": decorators.retry(max_attempts=3)(_noop_skill),
+        "require_params": decorators.require_params("dataset")(_noop_skill),
+        "enrich_metadata": decorators.enrich_metadata(version="1")(_noop_skill),
+        "standard_skill_decorators": (
+            decorators.standard_skill_decorators(_noop_skill)
+        ),
+    }
+
+    results = []
+    for name, fn in variants.items():
+        results.append(BenchResult(
+            suite="decorators",
+            name=name,
+            params={},
+            unit="ns/call",
+            samples=sample(
+                ns_per_call_sampler(lambda: fn(context), config.iterations),
+                config.repeats,
+                config.warmup
+            ),
+            warmup=config.warmup
+        ))
+
+    return results
+
+
+def bench_batch(
+    config: BenchConfig,
+    sleep_s: float = 0.001,
+    workers: int = 8
+) -> list[BenchResult]:
+    """
+    Batch throughput (tasks/s) of every execution mode.
+
+    Uses a skill that sleeps sleep_s, i.e. an idealized I/O-bound
+    workload; CPU-bound skills only scale with ProcessPoolBatchExecutor.
+    """
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        skills_dir = Path(tmp)
+        (skills_dir / "sleeper.py").write_text(SLEEP_SKILL_SOURCE)
+        (skills_dir / "async_sleeper.py").write_text(ASYNC_SLEEP_SKILL_SOURCE)
+
+        registry = SkillRegistry(skills_dir)
+        orchestrator = AgentOrchestrator(
+            registry, enable_timing=False, enable_logging=False
+        )
+
+        def tasks(skill_name: str) -> list[tuple[str, AgentContext]]:
+            return [
+                (skill_name,
+                 AgentContext(task="bench", parameters={"sleep_s": sleep_s}))
+                for _ in range(config.batch_size)
+            ]
+
+        def throughput(run: Callable[[], list[AgentResult]]) -> Callable[[], float]:
+            def measure() -> float:
+                start = time.perf_counter()
+                run()
+                return config.batch_size / (time.perf_counter() - start)
+            return measure
+
+        thread_executor = ThreadPoolBatchExecutor(max_workers=workers)
+        process_executor = ProcessPoolBatchExecutor(max_workers=workers)
+        scheduler = PriorityScheduler(orchestrator, workers=workers)
+
+        modes: dict[str, Callable[[], list[AgentResult]]] = {
+            "sequential": lambda: orchestrator.execute_batch(tasks("sleeper")),
+            "thread_pool": lambda: orchestrator.execute_batch(
+                tasks("sleeper"), executor=thread_executor
+            ),
+            "process_pool": lambda: orchestrator.execute_batch(
+                tasks("sleeper"), executor=process_executor
+            ),
+            "priority_scheduler": lambda: orchestrator.execute_batch(
+                tasks("sleeper"), executor=scheduler
+            ),
+            "asyncio_sync_skill": lambda: asyncio.run(
+                orchestrator.execute_batch_async(
+                    tasks("sleeper"), max_concurrency=workers
+                )
+            ),
+            "asyncio_async_skill": lambda: asyncio.run(
+                orchestrator.execute_batch_async(
+                    tasks("async_sleeper"), max_concurrency=workers
+                )
+            ),
+        }
+
+        try:
+            for mode, run in modes.items():
+                results.append(BenchResult(
+                    suite="batch",
+                    name=mode,
+                    params={
+                        "tasks": config.batch_size,
+                        "workers": 1 if mode == "sequential" else workers,
+                    },
+                    unit="tasks/s",
+                    samples=sample(
+                        throughput(run), config.repeats, config.warmup
+                    ),
+                    higher_is_better=True,
+                    warmup=config.warmup
+                ))
+        finally:
+            thread_executor.shutdown()
+            process_executor.shutdown()
+            scheduler.shutdown()
+
+    return results
+
+
+def bench_models(
+    config: BenchConfig,
+    payload_sizes: tuple[int, ...] = (0, 10, 1000)
+) -> list[BenchResult]:
+    """
+    Validated vs trusted construction of results and contexts.
+
+    Validation copies and checks the parameters/metadata dicts, so its
+    cost grows with payload size; trusted construction stays flat.
+    Derivation adds one metadata key, as enriching middleware does.
+    """
+    results = []
+
+    for size in payload_sizes:
+        payload = {f"key_{i}": i for i in range(size)}
+        parent = AgentContext(task="noop", parameters=payload)
+        # Keep large payloads from dominating the suite's runtime
+        iterations = max(100, config.iterations // (1 + size // 100))
+
+        variants: dict[str, Callable[[], object]] = {
+            "result_validated": lambda: AgentResult(
+                status=ResultStatus.SUCCESS, message="ok", metadata=payload
+            ),
+            "result_trusted": lambda: AgentResult.trusted(
+                ResultStatus.SUCCESS, "ok", metadata=payload
+            ),
+            "context_validated": lambda: AgentContext(
+                task="noop", parameters=payload
+            ),
+            "context_trusted": lambda: AgentContext.trusted(
+                "noop", parameters=payload
+            ),
+            "context_model_copy": lambda: parent.model_copy(update={
+                "metadata": {**parent.metadata, "tenant": "acme"}
+            }),
+            "context_derive": lambda: parent.derive(
+                metadata={"tenant": "acme"}
+            ),
+        }
+
+        for name, fn in variants.items():
+            results.append(BenchResult(
+                suite="models",
+                name=name,
+                params={"payload": size},
+                unit="ns/call",
+                samples=sample(
+                    ns_per_call_sampler(fn, iterations),
+                    config.repeats,
+                    config.warmup
+                ),
+                warmup=config.warmup
+            ))
+
+    return results
+
+
+SUITES: dict[str, Callable[[BenchConfig], list[BenchResult]]] = {
+    "registry": bench_registry,
+    "dispatch": bench_dispatch,
+    "decorators": bench_decorators,
+    "batch": bench_batch,
+    "models": bench_models,
+}
+
+
+# ============================================================================
+# Reporting and Baselines
+# ============================================================================
+
+@dataclass
+class Regression:
+    """A result whose median moved the wrong way past the threshold."""
+    key: str
+    baseline: float
+    current: float
+    change: float  # relative, signed in the "worse" direction
+
+
+def run_suites(
+    names: list[str],
+    config: BenchConfig
+) -> list[BenchResult]:
+    """Run the named suites in order."""
+    results = []
+    for name in names:
+        print(f"▶ Running {name} suite...", file=sys.stderr)
+        results.extend(SUITES[name](config))
+    return results
+
+
+def results_to_json(
+    results: list[BenchResult],
+    config: BenchConfig
+) -> dict[str, Any]:
+    """Serializable report with environment metadata."""
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "config": asdict(config),
+        },
+        "results": [r.to_dict() for r in results],
+    }
+
+
+def compare_to_baseline(
+    results: list[BenchResult],
+    baseline: dict[str, Any],
+    threshold: float
+) -> list[Regression]:
+    """
+    Compare medians against a stored report.
+
+    A regression is a median that is worse than the baseline by more
+    than threshold (relative), in the direction given by
+    higher_is_better. Results missing from the baseline are ignored.
+    """
+    previous = {r["key"]: r for r in baseline.get("results", [])}
+    regressions = []
+
+    for result in results:
+        base = previous.get(result.key)
+        if base is None or not base["median"]:
+            continue
+
+        change = (result.median - base["median"]) / base["median"]
+        if result.higher_is_better:
+            change = -change
+
+        if change > threshold:
+            regressions.append(Regression(
+                key=result.key,
+                baseline=base["median"],
+                current=result.median,
+                change=change
+            ))
+
+    return regressions
+
+
+def format_table(results: list[BenchResult]) -> str:
+    """Human-readable summary, one line per result."""
+    lines = [
+        f"{'benchmark':<58} {'median':>12} {'stdev':>10} {'unit':<8}"
+    ]
+    for r in results:
+        lines.append(
+            f"{r.key:<58} {r.median:>12.1f} {r.stdev:>10.1f} {r.unit:<8}"
+        )
+    return "\n".join(lines)
+
+
+# ============================================================================
+# CLI Entry Point
+# ============================================================================
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m core.benchmarks",
+        description="Benchmark orchestrator, registry and decorator overhead."
+    )
+    parser.add_argument(
+        "--suite",
+        action="append",
+        choices=list(SUITES),
+        help="Suite to run (repeatable; default: all)"
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Fewer iterations and repeats (smoke run)"
+    )
+    parser.add_argument("--repeats", type=int, help="Timed repeats per benchmark")
+    parser.add_argument("--warmup", type=int, help="Discarded warmup rounds")
+    parser.add_argument("--json", type=Path, help="Write results to this file")
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Compare against a previous --json report"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative median change flagged as regression (default: 0.10)"
+    )
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.INFO)
+
+    config = BenchConfig.quick() if args.quick else BenchConfig()
+    if args.repeats is not None:
+        config.repeats = args.repeats
+    if args.warmup is not None:
+        config.warmup = args.warmup
+
+    results = run_suites(args.suite or list(SUITES), config)
+    print(format_table(results))
+
+    if args.json:
+        args.json.write_text(
+            json.dumps(results_to_json(results, config), indent=2)
+        )
+        print(f"\n💾 Results written to {args.json}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+
+        if regressions:
+            print(f"\n✗ {len(regressions)} regression(s) "
+                  f"beyond {args.threshold:.0%}:")
+            for reg in regressions:
+                print(f"  {reg.key}: {reg.baseline:.1f} → "
+                      f"{reg.current:.1f} ({reg.change:+.1%})")
+            return 1
+
+        print(f"\n✓ No regressions beyond {args.threshold:.0%}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,317 @@
+"""
+Result Cache: Bounded, Thread-Safe LRU/TTL Storage for AgentResult
+
+Shared backing store for caching_middleware (orchestrator.py) and the
+@cached decorator (decorators.py), so both entry points get the same
+eviction, expiry, and accounting behaviour.
+
+Single Responsibility: This module ONLY stores and evicts results.
+Deciding what to cache (success only) and how to key it is left to the
+callers.
+
+Usage:
+    from core.cache import ResultCache
+
+    cache = ResultCache(max_entries=10_000, ttl_seconds=300)
+    orchestrator.add_middleware(caching_middleware(cache))
+
+    print(cache.stats())
+"""
+
+import logging
+import pickle
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, Protocol, runtime_checkable
+
+from .protocols import AgentContext, AgentResult
+
+
+# ============================================================================
+# Logging Configuration
+# ============================================================================
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Cache Keys
+# ============================================================================
+
+def default_cache_key(
+    context: AgentContext,
+    exclude: Iterable[str] = ()
+) -> str:
+    """
+    Default cache key: task name plus canonical parameter digest.
+    
+    Delegates to AgentContext.cache_key, which memoizes the digest on
+    the (immutable) context.
+    """
+    return context.cache_key(exclude)
+
+
+# ============================================================================
+# Backend Protocol
+# ============================================================================
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """
+    Structural contract for result stores used by caching_middleware
+    and @cached.
+
+    Implemented by ResultCache (in-process) and SQLiteResultCache
+    (disk_cache.py, shared across processes). Implementations must
+    return a result the caller may mutate, or None on miss.
+    """
+
+    def get(self, key: str) -> AgentResult | None:
+        ...
+
+    def put(self, key: str, result: AgentResult) -> None:
+        ...
+
+
+# ============================================================================
+# Domain Models
+# ============================================================================
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Point-in-time cache counters.
+
+    Hit ratio = hits / (hits + misses). Expired entries count as misses
+    and as expirations, not as evictions.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    size_bytes: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _CacheEntry:
+    result: AgentResult
+    stored_at: float     # time.monotonic(), for TTL
+    cached_at: str       # wall clock ISO timestamp, for reporting
+    size_bytes: int
+
+
+# ============================================================================
+# Result Cache
+# ============================================================================
+
+class ResultCache:
+    """
+    Bounded LRU cache of AgentResult with optional TTL and byte budget.
+
+    Design Principles:
+    - SRP: Storage and eviction only
+    - Copy on read and write: callers may freely mutate result metadata
+      (the orchestrator adds timing to every result) without corrupting
+      the cached entry. ``data`` is shared, not deep-copied—treat cached
+      payloads as read-only.
+
+    Eviction:
+    - Least recently used first, whenever max_entries or max_bytes is
+      exceeded
+    - Expired entries are dropped lazily on lookup
+
+    Thread Safety:
+        All operations take a single lock; safe for use from thread pools
+        and PriorityScheduler workers.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = 1024,
+        max_bytes: int | None = None,
+        ttl_seconds: float | None = None
+    ):
+        """
+        Args:
+            max_entries: Maximum number of cached results (None: unbounded)
+            max_bytes: Approximate memory budget for cached results.
+                       Sizes are estimated from the serialized result, so
+                       enabling this adds a serialization per store.
+            ttl_seconds: Entry lifetime (None: entries never expire)
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1, got {max_bytes}")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be > 0, got {ttl_seconds}")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    # ========================================================================
+    # Public API
+    # ========================================================================
+
+    def get(self, key: str) -> AgentResult | None:
+        """
+        Look up a cached result.
+
+        Returns:
+            A copy of the cached result with ``metadata["cached_at"]``
+            set, or None on miss/expiry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            if self._is_expired(entry):
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            result = _detach(entry.result)
+
+        result.metadata["cached_at"] = entry.cached_at
+        return result
+
+    def put(self, key: str, result: AgentResult) -> None:
+        """
+        Store a copy of result, evicting LRU entries to stay within bounds.
+
+        Results larger than max_bytes on their own are not cached.
+        """
+        stored = _detach(result)
+        size = _estimate_size(stored) if self.max_bytes is not None else 0
+
+        if self.max_bytes is not None and size > self.max_bytes:
+            logger.debug(f"⊝ Result too large to cache ({size} bytes): {key}")
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = _CacheEntry(
+                result=stored,
+                stored_at=time.monotonic(),
+                cached_at=datetime.now().isoformat(),
+                size_bytes=size
+            )
+            self._size_bytes += size
+            self._evict_over_capacity()
+
+    def invalidate(self, key: str) -> bool:
+        """
+        Remove a single entry.
+
+        Returns:
+            True if an entry was removed
+        """
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+
+    def clear(self) -> None:
+        """Remove all entries. Counters are preserved."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def stats(self) -> CacheStats:
+        """Snapshot hit/miss/eviction counters and current occupancy."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._is_expired(entry)
+
+    # ========================================================================
+    # Implementation (Private, lock held)
+    # ========================================================================
+
+    def _is_expired(self, entry: _CacheEntry) -> bool:
+        return (
+            self.ttl_seconds is not None
+            and time.monotonic() - entry.stored_at >= self.ttl_seconds
+        )
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._size_bytes -= entry.size_bytes
+
+    def _evict_over_capacity(self) -> None:
+        while self._entries and (
+            (self.max_entries is not None
+             and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None
+                and self._size_bytes > self.max_bytes)
+        ):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self._evictions += 1
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def _detach(result: AgentResult) -> AgentResult:
+    """
+    Shallow-copy a result with its own metadata dict.
+
+    Enough to keep per-caller metadata edits out of the cache without
+    deep-copying potentially large data payloads.
+    """
+    return result.model_copy(update={"metadata": dict(result.metadata)})
+
+
+def _estimate_size(result: AgentResult) -> int:
+    """Approximate in-memory footprint of a result, in bytes."""
+    try:
+        return len(result.model_dump_json())
+    except Exception:
+        pass
+    try:
+        return len(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(result.data) + sys.getsizeof(result.metadata)
@@ -0,0 +1,242 @@
+"""
+Request Coalescing: Single-Flight Execution of Identical Invocations
+
+When several callers request the same skill with the same parameters at
+the same time, only the first (the leader) executes; the others wait for
+the leader's result. This closes the gap caches leave open—results are
+stored only after completion, so a burst of identical requests (e.g.
+right after a TTL expiry) would otherwise all miss and all execute.
+
+Single Responsibility: This module ONLY deduplicates concurrent work.
+It never stores results beyond the lifetime of the in-flight call.
+
+Followers:
+- Wait at most their own timeout (the orchestrator passes the caller's
+  remaining deadline), then give up with TimeoutError; the leader keeps
+  running for everyone else.
+- If the leader is cancelled (or interrupted by any other
+  BaseException), followers retry: one of them becomes the new leader.
+
+Usage:
+    orchestrator = AgentOrchestrator(registry, coalesce_requests=True)
+    ...
+    print(orchestrator.single_flight.stats())
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import CancelledError, Future
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from .protocols import AgentResult
+
+
+# ============================================================================
+# Logging Configuration
+# ============================================================================
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Domain Models
+# ============================================================================
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    """Point-in-time coalescing counters."""
+    executions: int
+    coalesced: int
+    in_flight: int
+
+
+# ============================================================================
+# Single Flight
+# ============================================================================
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls that share a key.
+
+    Works across threads (do) and coroutines (do_async); both share one
+    in-flight table, so a thread-pool caller and an asyncio caller with
+    the same key also coalesce.
+
+    Followers receive a copy of the leader's result (own metadata dict)
+    marked with ``metadata["coalesced"] = True``. If the leader raises an
+    Exception, every follower sees the same exception.
+    """
+
+    def __init__(self):
+        self._calls: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._executions = 0
+        self._coalesced = 0
+
+    # ========================================================================
+    # Public API
+    # ========================================================================
+
+    def do(
+        self,
+        key: str,
+        fn: Callable[[], AgentResult],
+        timeout: float | None = None
+    ) -> AgentResult:
+        """
+        Run fn, or wait for an identical in-flight call to finish.
+
+        Args:
+            key: Identity of the call (skill name + canonical parameters)
+            fn: Zero-argument callable producing the result
+            timeout: Longest a follower waits, in seconds (None: no
+                     limit); a leader is not limited here
+
+        Returns:
+            The leader's result (followers get a marked copy)
+
+        Raises:
+            TimeoutError: A follower's timeout expired first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                break
+            try:
+                return _mark_coalesced(future.result(timeout=_left(deadline)))
+            except CancelledError:
+                continue  # Leader was cancelled: retry, maybe as leader
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._settle(key, future, exception=e)
+            raise
+
+        self._settle(key, future, result=result)
+        return result
+
+    async def do_async(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[AgentResult]],
+        timeout: float | None = None
+    ) -> AgentResult:
+        """
+        Async variant of do(): await fn, or an identical in-flight call.
+
+        Cancelling a follower never cancels the shared call.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                break
+            await asyncio.wait_for(_wait_done(future), _left(deadline))
+            if not future.cancelled():
+                return _mark_coalesced(future.result())
+
+        try:
+            result = await fn()
+        except BaseException as e:
+            self._settle(key, future, exception=e)
+            raise
+
+        self._settle(key, future, result=result)
+        return result
+
+    def stats(self) -> SingleFlightStats:
+        """Snapshot executions, coalesced calls, and in-flight keys."""
+        with self._lock:
+            return SingleFlightStats(
+                executions=self._executions,
+                coalesced=self._coalesced,
+                in_flight=len(self._calls)
+            )
+
+    # ========================================================================
+    # Implementation (Private)
+    # ========================================================================
+
+    def _join(self, key: str) -> tuple[Future, bool]:
+        """Return (future, is_leader) for key, registering a new call."""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self._coalesced += 1
+                logger.debug(f"⇉ Coalesced with in-flight call: {key}")
+                return future, False
+
+            future = Future()
+            self._calls[key] = future
+            self._executions += 1
+            return future, True
+
+    def _settle(
+        self,
+        key: str,
+        future: Future,
+        result: AgentResult | None = None,
+        exception: BaseException | None = None
+    ) -> None:
+        """Publish the leader's outcome and retire the key."""
+        with self._lock:
+            self._calls.pop(key, None)
+
+        if exception is not None and not isinstance(exception, Exception):
+            # Cancellation or interpreter exit belongs to the leader's
+            # caller alone; followers see a cancelled call and retry
+            future.cancel()
+        elif exception is not None:
+            future.set_exception(exception)
+        else:
+            # Publish a snapshot: the leader keeps mutating its own copy
+            # (e.g. timing metadata) while followers read this one
+            future.set_result(
+                result.model_copy(update={"metadata": dict(result.metadata)})
+            )
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def _left(deadline: float | None) -> float | None:
+    """Seconds until a monotonic deadline (None: no deadline)."""
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+async def _wait_done(future: Future) -> None:
+    """
+    Wait for a concurrent future to finish.
+
+    Unlike asyncio.wrap_future, cancelling the waiter leaves the shared
+    future alone.
+    """
+    loop = asyncio.get_running_loop()
+    done = loop.create_future()
+
+    def wake(_: Future) -> None:
+        try:
+            loop.call_soon_threadsafe(_set_done, done)
+        except RuntimeError:
+            pass  # The waiting loop has already closed
+
+    future.add_done_callback(wake)
+    await done
+
+
+def _set_done(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def _mark_coalesced(result: AgentResult) -> AgentResult:
+    """Give a follower its own copy of the shared result."""
+    shared = result.model_copy(update={"metadata": dict(result.metadata)})
+    shared.metadata["coalesced"] = True
+    return shared
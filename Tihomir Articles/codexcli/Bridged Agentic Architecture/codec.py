@@ -0,0 +1,243 @@
+"""
+Codec: Fast JSON Encoding and Length-Prefixed Framing
+
+Shared wire format for the orchestrator server (server.py) and the
+JSONL batch runner (batch_runner.py).
+
+Single Responsibility: This module ONLY converts between Python objects,
+bytes and frames. It knows nothing about sockets or skills beyond how
+AgentContext and AgentResult cross the boundary.
+
+JSON:
+    orjson when installed (several times faster, emits bytes directly),
+    otherwise the standard library json with compact separators. Both
+    produce UTF-8 bytes and accept pydantic models, sets, paths and
+    other values via the same fallback serializer.
+
+Frames:
+    4-byte big-endian payload length, then a JSON payload. Frames larger
+    than max_frame_bytes are refused before any payload is read, so a
+    corrupt or hostile length cannot exhaust memory.
+
+Boundary Validation:
+    Contexts arriving from the wire are fully validated
+    (AgentContext.model_validate). Results are serialized field by field
+    without model_dump, since they were validated when constructed.
+"""
+
+import asyncio
+import json
+import struct
+from enum import Enum
+from pathlib import PurePath
+from typing import Any
+
+from pydantic import BaseModel
+
+from .protocols import AgentContext, AgentResult
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+FRAME_HEADER = struct.Struct("!I")
+
+DEFAULT_MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+# Name of the active JSON backend, for logs and diagnostics
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+
+class FrameTooLarge(ValueError):
+    """A frame header announced a payload above the configured limit."""
+
+
+# ============================================================================
+# JSON
+# ============================================================================
+
+def _default(value: Any) -> Any:
+    """Serialize values neither JSON backend handles natively."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (PurePath, bytes)):
+        return str(value)
+    if hasattr(value, "tolist"):  # NumPy arrays and scalars
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def dumps(value: Any) -> bytes:
+        """Encode to compact UTF-8 JSON bytes."""
+        return orjson.dumps(value, default=_default, option=_ORJSON_OPTIONS)
+
+    def loads(data: bytes | bytearray | memoryview | str) -> Any:
+        """Decode JSON bytes or text."""
+        return orjson.loads(data)
+
+else:
+    _encoder = json.JSONEncoder(
+        separators=(",", ":"), ensure_ascii=False, default=_default
+    )
+
+    def dumps(value: Any) -> bytes:
+        """Encode to compact UTF-8 JSON bytes."""
+        return _encoder.encode(value).encode("utf-8")
+
+    def loads(data: bytes | bytearray | memoryview | str) -> Any:
+        """Decode JSON bytes or text."""
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return json.loads(data)
+
+
+# ============================================================================
+# Domain Conversion
+# ============================================================================
+
+def result_to_dict(result: AgentResult) -> dict[str, Any]:
+    """Plain-dict form of a result (including extra fields)."""
+    encoded = {
+        "status": result.status.value,
+        "data": result.data,
+        "message": result.message,
+        "metadata": result.metadata,
+        "error_details": result.error_details,
+    }
+    if result.__pydantic_extra__:
+        encoded.update(result.__pydantic_extra__)
+    return encoded
+
+
+def result_from_dict(data: dict[str, Any]) -> AgentResult:
+    """Validate a result received from the wire."""
+    return AgentResult.model_validate(data)
+
+
+def context_to_dict(context: AgentContext) -> dict[str, Any]:
+    """Plain-dict form of a context."""
+    encoded = {
+        "task": context.task,
+        "parameters": context.parameters,
+        "metadata": context.metadata,
+        "priority": context.priority.value,
+    }
+    if context.deadline is not None:
+        encoded["deadline"] = context.deadline
+    return encoded
+
+
+def context_from_dict(data: dict[str, Any]) -> AgentContext:
+    """Validate a context received from the wire."""
+    return AgentContext.model_validate(data)
+
+
+def task_from_dict(data: Any) -> tuple[str, AgentContext]:
+    """
+    Validate a {"skill": ..., "context": {...}} task.
+
+    The context is optional and defaults to {"task": skill}.
+
+    Raises:
+        ValueError: Malformed task (pydantic.ValidationError for an
+                    invalid context, which is a ValueError too)
+    """
+    if not isinstance(data, dict) or not isinstance(data.get("skill"), str):
+        raise ValueError('Expected {"skill": str, "context": {...}}')
+
+    skill_name = data["skill"]
+    context = data.get("context") or {"task": skill_name}
+    return skill_name, context_from_dict(context)
+
+
+# ============================================================================
+# Framing
+# ============================================================================
+
+def encode_frame(value: Any) -> bytes:
+    """Length-prefixed JSON frame."""
+    payload = dumps(value)
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+async def read_frame(
+    reader: asyncio.StreamReader,
+    max_frame_bytes: int = DEFAULT_MAX_FRAME_BYTES
+) -> Any | None:
+    """
+    Read and decode one frame.
+
+    Returns:
+        The decoded value, or None on a clean end of stream
+
+    Raises:
+        FrameTooLarge: Announced payload exceeds max_frame_bytes
+        asyncio.IncompleteReadError: Stream ended mid-frame
+    """
+    try:
+        header = await reader.readexactly(FRAME_HEADER.size)
+    except asyncio.IncompleteReadError as e:
+        if not e.partial:
+            return None
+        raise
+
+    (size,) = FRAME_HEADER.unpack(header)
+    if size > max_frame_bytes:
+        raise FrameTooLarge(
+            f"Frame of {size} bytes exceeds limit of {max_frame_bytes}"
+        )
+    return loads(await reader.readexactly(size))
+
+
+def read_frame_blocking(
+    sock,
+    max_frame_bytes: int = DEFAULT_MAX_FRAME_BYTES
+) -> Any | None:
+    """
+    Blocking-socket counterpart of read_frame.
+
+    Returns:
+        The decoded value, or None on a clean end of stream
+    """
+    header = _recv_exactly(sock, FRAME_HEADER.size)
+    if header is None:
+        return None
+
+    (size,) = FRAME_HEADER.unpack(header)
+    if size > max_frame_bytes:
+        raise FrameTooLarge(
+            f"Frame of {size} bytes exceeds limit of {max_frame_bytes}"
+        )
+
+    payload = _recv_exactly(sock, size)
+    if payload is None:
+        raise ConnectionError("Connection closed mid-frame")
+    return loads(payload)
+
+
+def _recv_exactly(sock, size: int) -> bytearray | None:
+    """Receive exactly size bytes; None if the peer closed before any."""
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if count == 0:
+            if received == 0:
+                return None
+            raise ConnectionError("Connection closed mid-frame")
+        received += count
+    return buffer
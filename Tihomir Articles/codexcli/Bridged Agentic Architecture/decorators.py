@@ -20,11 +20,18 @@ Usage:
 
 from typing import Callable, TypeVar, Any, cast, ParamSpec
 from functools import wraps
+import asyncio
+import inspect
 import time
 import logging
-from datetime import datetime, timedelta
+import warnings
+from datetime import datetime
 
+from .cache import CacheBackend, ResultCache
+from .metrics import default_registry
 from .protocols import AgentContext, AgentResult, ResultStatus
+from .retries import RetryBudget, RetryDecision, RetryPolicy
+from .tracing import child_span
 
 
 # ============================================================================
@@ -70,52 +77,53 @@ def validate_context(func: F) -> F:
     
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> AgentResult:
-        # Extract context from arguments
-        context = None
-        if args:
-            context = args[0]
-        elif 'context' in kwargs:
-            context = kwargs['context']
-        
-        # Validate context exists
-        if context is None:
-            return AgentResult(
-                status=ResultStatus.FAILURE,
-                data=None,
-                message="Context is required but was None",
-                error_details={
-                    "decorator": "validate_context",
-                    "function": func.__name__
-                }
-            )
-        
-        # Validate context type
-        if not isinstance(context, AgentContext):
-            return AgentResult(
-                status=ResultStatus.FAILURE,
-                data=None,
-                message=f"Expected AgentContext, got {type(context).__name__}",
-                error_details={
-                    "decorator": "validate_context",
-                    "function": func.__name__,
-                    "received_type": type(context).__name__
-                }
-            )
-        
-        # Validate required fields
-        if not context.task:
-            return AgentResult(
-                status=ResultStatus.FAILURE,
-                data=None,
-                message="Context.task is required but empty",
-                error_details={
-                    "decorator": "validate_context",
-                    "function": func.__name__
-                }
-            )
-        
-        # Context is valid, proceed with execution
-        return func(*args, **kwargs)
+        with child_span("decorator:validate_context"):
+            # Extract context from arguments
+            context = None
+            if args:
+                context = args[0]
+            elif 'context' in kwargs:
+                context = kwargs['context']
+            
+            # Validate context exists
+            if context is None:
+                return AgentResult.trusted(
+                    status=ResultStatus.FAILURE,
+                    data=None,
+                    message="Context is required but was None",
+                    error_details={
+                        "decorator": "validate_context",
+                        "function": func.__name__
+                    }
+                )
+            
+            # Validate context type
+            if not isinstance(context, AgentContext):
+                return AgentResult.trusted(
+                    status=ResultStatus.FAILURE,
+                    data=None,
+                    message=f"Expected AgentContext, got {type(context).__name__}",
+                    error_details={
+                        "decorator": "validate_context",
+                        "function": func.__name__,
+                        "received_type": type(context).__name__
+                    }
+                )
+            
+            # Validate required fields
+            if not context.task:
+                return AgentResult.trusted(
+                    status=ResultStatus.FAILURE,
+                    data=None,
+                    message="Context.task is required but empty",
+                    error_details={
+                        "decorator": "validate_context",
+                        "function": func.__name__
+                    }
+                )
+            
+            # Context is valid, proceed with execution
+            return func(*args, **kwargs)
     
     return cast(F, wrapper)
 
@@ -125,7 +133,9 @@ def timed(func: F) -> F:
     Decorator that measures execution time and adds to result metadata.
     
     Automatically adds 'execution_time_ms' and 'execution_timestamp'
-    to the AgentResult metadata.
+    to the AgentResult metadata, and records the call in
+    metrics.default_registry (source="timed"), labelled by the skill
+    module's name.
     
     Example:
         @timed
@@ -136,22 +146,29 @@ def timed(func: F) -> F:
         # Result will have metadata['execution_time_ms']
     """
     
+    # Skill modules are loaded under their file stem, i.e. the skill name
+    skill_name = func.__module__.rsplit(".", 1)[-1]
+    
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> AgentResult:
-        start = time.perf_counter()
-        start_timestamp = datetime.now().isoformat()
-        
-        result = func(*args, **kwargs)
-        
-        elapsed_ms = (time.perf_counter() - start) * 1000
-        
-        # Add timing metadata to result
-        if isinstance(result, AgentResult):
-            result.metadata["execution_time_ms"] = elapsed_ms
-            result.metadata["execution_timestamp"] = start_timestamp
-            result.metadata["decorated_by"] = "timed"
-        
-        return result
+        with child_span("decorator:timed"):
+            start = time.perf_counter()
+            start_timestamp = datetime.now().isoformat()
+            
+            result = func(*args, **kwargs)
+            
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            
+            # Add timing metadata to result
+            if isinstance(result, AgentResult):
+                result.metadata["execution_time_ms"] = elapsed_ms
+                result.metadata["execution_timestamp"] = start_timestamp
+                result.metadata["decorated_by"] = "timed"
+                default_registry.observe_execution(
+                    skill_name, result.status.value, elapsed_ms, source="timed"
+                )
+            
+            return result
     
     return cast(F, wrapper)
 
@@ -173,47 +190,65 @@ def logged(func: F) -> F:
     
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> AgentResult:
-        # Extract context for logging
-        context = args[0] if args else kwargs.get('context')
-        task_name = context.task if isinstance(context, AgentContext) else "unknown"
-        
-        logger.info(
-            f"→ Entering {func.__name__}",
-            extra={"task": task_name, "function": func.__name__}
-        )
-        
-        start = time.perf_counter()
-        result = func(*args, **kwargs)
-        elapsed_ms = (time.perf_counter() - start) * 1000
-        
-        if isinstance(result, AgentResult):
-            log_level = logging.INFO if result.success else logging.ERROR
-            logger.log(
-                log_level,
-                f"← Exiting {func.__name__}: {result.status.value}",
-                extra={
-                    "task": task_name,
-                    "function": func.__name__,
-                    "status": result.status.value,
-                    "message": result.message,
-                    "execution_time_ms": elapsed_ms
-                }
+        with child_span("decorator:logged"):
+            # Extract context for logging
+            context = args[0] if args else kwargs.get('context')
+            task_name = context.task if isinstance(context, AgentContext) else "unknown"
+            
+            logger.info(
+                f"→ Entering {func.__name__}",
+                extra={"task": task_name, "function": func.__name__}
             )
-        
-        return result
+            
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            
+            if isinstance(result, AgentResult):
+                log_level = logging.INFO if result.success else logging.ERROR
+                logger.log(
+                    log_level,
+                    f"← Exiting {func.__name__}: {result.status.value}",
+                    extra={
+                        "task": task_name,
+                        "function": func.__name__,
+                        "status": result.status.value,
+                        "message": result.message,
+                        "execution_time_ms": elapsed_ms
+                    }
+                )
+            
+            return result
     
     return cast(F, wrapper)
 
 
-def cached(ttl_seconds: int = 300) -> Callable[[F], F]:
+def cached(
+    ttl_seconds: int = 300,
+    max_entries: int | None = 1024,
+    max_bytes: int | None = None,
+    cache: CacheBackend | None = None,
+    exclude_params: tuple[str, ...] = ()
+) -> Callable[[F], F]:
     """
     Decorator factory that caches AgentResult based on context parameters.
     
-    Caches results for the specified TTL (time-to-live). Cache key is
-    generated from context.task and context.parameters.
+    Caches results for the specified TTL (time-to-live) in a bounded,
+    thread-safe ResultCache (LRU eviction). Cache key is generated from
+    context.task and a canonical digest of context.parameters.
     
     Args:
-        ttl_seconds: How long to cache results (default: 300 seconds)
+        ttl_seconds: How long to cache results (default: 300 seconds).
+                     0 (deprecated) caches nothing, as before.
+        max_entries: Maximum cached results before LRU eviction
+        max_bytes: Optional approximate memory budget
+        cache: Share an existing CacheBackend (e.g. with caching_middleware,
+               or a SQLiteResultCache across processes); overrides the
+               sizing arguments above
+        exclude_params: Parameter names ignored when building the key
+    
+    The cache is exposed as ``execute.cache`` for stats inspection (None
+    when caching is disabled).
     
     Example:
         @cached(ttl_seconds=60)
@@ -224,115 +259,225 @@ def cached(ttl_seconds: int = 300) -> Callable[[F], F]:
         # Second call with same params returns cached result
     """
     
-    cache: dict[str, tuple[AgentResult, datetime]] = {}
+    if cache is None and ttl_seconds <= 0:
+        # Entries used to expire immediately: nothing was ever served
+        warnings.warn(
+            "cached(ttl_seconds=0) caches nothing and is deprecated; remove "
+            "the decorator instead. Non-positive TTLs will raise ValueError "
+            "in the next release.",
+            DeprecationWarning,
+            stacklevel=2
+        )
+    elif cache is None:
+        cache = ResultCache(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            ttl_seconds=ttl_seconds
+        )
     
     def decorator(func: F) -> F:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> AgentResult:
-            # Generate cache key from context
-            context = args[0] if args else kwargs.get('context')
-            
-            if not isinstance(context, AgentContext):
-                # Can't cache without proper context
-                return func(*args, **kwargs)
-            
-            # Create cache key from task and sorted parameters
-            params_str = str(sorted(context.parameters.items()))
-            cache_key = f"{context.task}:{params_str}"
-            
-            # Check cache
-            if cache_key in cache:
-                cached_result, cached_time = cache[cache_key]
+            with child_span("decorator:cached") as span:
+                # Generate cache key from context
+                context = args[0] if args else kwargs.get('context')
+                
+                if cache is None or not isinstance(context, AgentContext):
+                    # Caching disabled, or can't cache without proper context
+                    return func(*args, **kwargs)
                 
-                # Check if cache is still valid
-                if datetime.now() - cached_time < timedelta(seconds=ttl_seconds):
+                cache_key = context.cache_key(exclude_params)
+                
+                # Check cache (returns a private copy; safe to annotate)
+                with child_span("cache:get"):
+                    cached_result = cache.get(cache_key)
+                span.set_attribute("cache_hit", cached_result is not None)
+                
+                if cached_result is not None:
                     logger.debug(f"⚡ Cache hit: {cache_key}")
-                    
-                    # Add cache metadata
                     cached_result.metadata["cache_hit"] = True
-                    cached_result.metadata["cached_at"] = cached_time.isoformat()
-                    
                     return cached_result
-                else:
-                    # Cache expired, remove it
-                    del cache[cache_key]
-            
-            # Execute function
-            result = func(*args, **kwargs)
-            
-            # Cache successful results only
-            if isinstance(result, AgentResult) and result.success:
-                cache[cache_key] = (result, datetime.now())
-                result.metadata["cache_hit"] = False
-                logger.debug(f"💾 Cached result: {cache_key}")
-            
-            return result
+                
+                # Execute function
+                result = func(*args, **kwargs)
+                
+                # Cache successful results only
+                if isinstance(result, AgentResult) and result.success:
+                    result.metadata["cache_hit"] = False
+                    cache.put(cache_key, result)
+                    logger.debug(f"💾 Cached result: {cache_key}")
+                
+                return result
         
+        wrapper.cache = cache
         return cast(F, wrapper)
     
     return decorator
 
 
-def retry(max_attempts: int = 3, delay_seconds: float = 1.0) -> Callable[[F], F]:
+def retry(
+    max_attempts: int = 3,
+    delay_seconds: float = 1.0,
+    policy: RetryPolicy | None = None,
+    budget: RetryBudget | None = None
+) -> Callable[[F], F]:
     """
     Decorator factory that retries failed skill executions.
     
-    Retries skills that return FAILURE status up to max_attempts times,
-    with exponential backoff between attempts.
+    Retries skills that return a non-success status up to max_attempts
+    times, with exponential backoff between attempts. Retrying stops
+    early if the context deadline would pass before the next attempt
+    starts, or if the retry budget is exhausted.
+    
+    Async skills (``async def``) await their backoff. Sync skills sleep
+    in the calling thread; prefer AgentOrchestrator(retry_policy=...)
+    with PriorityScheduler or execute_task_async, which wait without
+    holding a worker.
     
     Args:
         max_attempts: Maximum number of execution attempts
         delay_seconds: Initial delay between retries (exponentially increases)
+        policy: Backoff policy with jitter (see retries.py); overrides
+                max_attempts and delay_seconds
+        budget: Shared RetryBudget capping retries as a share of calls
     
     Example:
         @retry(max_attempts=3, delay_seconds=1.0)
         def execute(context: AgentContext) -> AgentResult:
             # Potentially flaky operation
             return AgentResult(...)
+        
+        @retry(policy=RetryPolicy(max_attempts=5, base_delay_s=0.05))
+        async def execute(context: AgentContext) -> AgentResult:
+            ...
     """
+    if policy is None:
+        # Deterministic doubling, no cap: the original behaviour
+        policy = RetryPolicy(
+            max_attempts=max_attempts,
+            base_delay_s=delay_seconds,
+            max_delay_s=float("inf"),
+            jitter="none",
+            retry_on=frozenset(ResultStatus)
+        )
     
     def decorator(func: F) -> F:
-        @wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> AgentResult:
-            last_result = None
-            
-            for attempt in range(1, max_attempts + 1):
-                result = func(*args, **kwargs)
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> AgentResult:
+                context = args[0] if args else kwargs.get('context')
+                last_result, decision, attempts = None, None, 0
+                if budget is not None:
+                    budget.deposit()
                 
-                if isinstance(result, AgentResult):
+                for attempt in range(1, policy.max_attempts + 1):
+                    attempts = attempt
+                    with child_span("decorator:retry", attempt=attempt):
+                        result = await func(*args, **kwargs)
+                    
+                    if not isinstance(result, AgentResult):
+                        continue
                     if result.success:
-                        # Add retry metadata
-                        result.metadata["retry_attempt"] = attempt
-                        result.metadata["retry_needed"] = attempt > 1
-                        return result
+                        return _mark_retry_success(result, attempt)
                     
                     last_result = result
-                    
-                    # Don't retry on last attempt
-                    if attempt < max_attempts:
-                        # Exponential backoff
-                        wait_time = delay_seconds * (2 ** (attempt - 1))
-                        logger.warning(
-                            f"⚠ Attempt {attempt}/{max_attempts} failed for {func.__name__}, "
-                            f"retrying in {wait_time}s..."
-                        )
-                        time.sleep(wait_time)
+                    decision = _retry_decision(
+                        func.__name__, result, attempt, policy, context, budget
+                    )
+                    if not decision.retry:
+                        break
+                    await asyncio.sleep(decision.delay_s)
+                
+                return _mark_retries_failed(last_result, attempts, decision)
+            
+            return cast(F, async_wrapper)
+        
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> AgentResult:
+            context = args[0] if args else kwargs.get('context')
+            last_result, decision, attempts = None, None, 0
+            if budget is not None:
+                budget.deposit()
             
-            # All attempts failed
-            if last_result:
-                last_result.metadata["retry_attempts"] = max_attempts
-                last_result.metadata["all_attempts_failed"] = True
-                last_result.message = (
-                    f"{last_result.message} (failed after {max_attempts} attempts)"
+            for attempt in range(1, policy.max_attempts + 1):
+                attempts = attempt
+                with child_span("decorator:retry", attempt=attempt):
+                    result = func(*args, **kwargs)
+                
+                if not isinstance(result, AgentResult):
+                    continue
+                if result.success:
+                    return _mark_retry_success(result, attempt)
+                
+                last_result = result
+                decision = _retry_decision(
+                    func.__name__, result, attempt, policy, context, budget
                 )
+                if not decision.retry:
+                    break
+                time.sleep(decision.delay_s)
             
-            return last_result
+            return _mark_retries_failed(last_result, attempts, decision)
         
         return cast(F, wrapper)
     
     return decorator
 
 
+def _retry_decision(
+    func_name: str,
+    result: AgentResult,
+    attempt: int,
+    policy: RetryPolicy,
+    context: Any,
+    budget: RetryBudget | None
+) -> RetryDecision:
+    """Ask the policy whether to retry, and log the outcome."""
+    decision = policy.decide(
+        result,
+        attempt,
+        context if isinstance(context, AgentContext) else None,
+        budget
+    )
+    
+    if decision.retry:
+        logger.warning(
+            f"⚠ Attempt {attempt}/{policy.max_attempts} failed for {func_name}, "
+            f"retrying in {decision.delay_s:.3f}s..."
+        )
+    elif decision.reason in ("deadline", "budget"):
+        logger.warning(
+            f"⚠ Attempt {attempt}/{policy.max_attempts} failed for {func_name}, "
+            f"not retrying ({decision.reason} exhausted)"
+        )
+    
+    return decision
+
+
+def _mark_retry_success(result: AgentResult, attempt: int) -> AgentResult:
+    result.metadata["retry_attempt"] = attempt
+    result.metadata["retry_needed"] = attempt > 1
+    return result
+
+
+def _mark_retries_failed(
+    last_result: AgentResult | None,
+    attempts: int,
+    decision: RetryDecision | None
+) -> AgentResult | None:
+    """Annotate the final failed attempt."""
+    if last_result:
+        last_result.metadata["retry_attempts"] = attempts
+        last_result.metadata["all_attempts_failed"] = True
+        if decision is not None and decision.reason in ("deadline", "budget"):
+            last_result.metadata["retry_stopped"] = decision.reason
+        last_result.message = (
+            f"{last_result.message} (failed after {attempts} attempts)"
+        )
+    
+    return last_result
+
+
 def require_params(*required_params: str) -> Callable[[F], F]:
     """
     Decorator factory that validates required parameters exist in context.
@@ -359,7 +504,7 @@ def require_params(*required_params: str) -> Callable[[F], F]:
             context = args[0] if args else kwargs.get('context')
             
             if not isinstance(context, AgentContext):
-                return AgentResult(
+                return AgentResult.trusted(
                     status=ResultStatus.FAILURE,
                     data=None,
                     message="Invalid context for parameter validation"
@@ -372,7 +517,7 @@ def require_params(*required_params: str) -> Callable[[F], F]:
             ]
             
             if missing:
-                return AgentResult(
+                return AgentResult.trusted(
                     status=ResultStatus.FAILURE,
                     data=None,
                     message=f"Missing required parameters: {', '.join(missing)}",
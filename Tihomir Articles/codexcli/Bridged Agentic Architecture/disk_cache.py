@@ -0,0 +1,403 @@
+"""
+Persistent Result Cache: SQLite-Backed Storage Shared Across Processes
+
+Drop-in CacheBackend for caching_middleware and @cached whose entries
+survive restarts and are shared by every orchestrator process (including
+ProcessPoolBatchExecutor workers) pointed at the same database file.
+
+Single Responsibility: This module ONLY persists and evicts results.
+Keys come from the same key functions as the in-memory ResultCache.
+
+Storage:
+- One SQLite database in WAL mode: readers never block writers, and
+  concurrent writers from other processes wait up to busy_timeout
+- Results stored as AgentResult JSON (data must be JSON-serializable);
+  payloads at or above compress_threshold bytes are zlib-compressed
+- Entry count and byte totals are maintained by triggers, so capacity
+  checks are O(1) instead of a table scan
+
+Usage:
+    from core.disk_cache import SQLiteResultCache
+
+    cache = SQLiteResultCache("~/.cache/agents/results.db",
+                              ttl_seconds=24 * 3600,
+                              max_bytes=2 * 1024**3)
+    orchestrator.add_middleware(caching_middleware(cache))
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+from .cache import CacheStats
+from .protocols import AgentResult
+
+
+# ============================================================================
+# Logging Configuration
+# ============================================================================
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Schema
+# ============================================================================
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key         TEXT PRIMARY KEY,
+    payload     BLOB NOT NULL,
+    compressed  INTEGER NOT NULL,
+    size_bytes  INTEGER NOT NULL,
+    created_at  REAL NOT NULL,
+    expires_at  REAL,
+    accessed_at REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_results_accessed ON results(accessed_at);
+CREATE INDEX IF NOT EXISTS idx_results_expires ON results(expires_at);
+
+CREATE TABLE IF NOT EXISTS totals (
+    id          INTEGER PRIMARY KEY CHECK (id = 0),
+    entries     INTEGER NOT NULL,
+    size_bytes  INTEGER NOT NULL
+);
+
+INSERT OR IGNORE INTO totals (id, entries, size_bytes) VALUES (0, 0, 0);
+
+CREATE TRIGGER IF NOT EXISTS results_insert AFTER INSERT ON results
+BEGIN
+    UPDATE totals SET entries = entries + 1,
+                      size_bytes = size_bytes + NEW.size_bytes
+    WHERE id = 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS results_delete AFTER DELETE ON results
+BEGIN
+    UPDATE totals SET entries = entries - 1,
+                      size_bytes = size_bytes - OLD.size_bytes
+    WHERE id = 0;
+END;
+"""
+
+# Skip rewriting accessed_at on hits more often than this (seconds);
+# LRU order only needs coarse recency, and every write takes the DB lock
+_ACCESS_TOUCH_INTERVAL = 1.0
+
+
+# ============================================================================
+# SQLite Result Cache
+# ============================================================================
+
+class SQLiteResultCache:
+    """
+    Persistent, multi-process CacheBackend with TTL and size caps.
+
+    Design Principles:
+    - LSP: Same get/put/invalidate/clear/stats surface as ResultCache
+    - Fail-open: storage errors are logged and treated as cache misses,
+      never surfaced to skill execution
+
+    Eviction:
+    - Least recently accessed first when max_entries or max_bytes
+      (stored, possibly compressed, size) is exceeded
+    - Expired entries are dropped on lookup and by purge_expired()
+
+    Concurrency:
+        One connection per thread per process (connections are not shared
+        across fork), WAL journaling, and a busy timeout for writers.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        ttl_seconds: float | None = None,
+        compress_threshold: int | None = 64 * 1024,
+        busy_timeout_ms: int = 5000
+    ):
+        """
+        Args:
+            path: Database file (created with parent directories if missing)
+            max_entries: Maximum stored results (None: unbounded)
+            max_bytes: Maximum total stored payload bytes (None: unbounded)
+            ttl_seconds: Entry lifetime (None: entries never expire)
+            compress_threshold: Compress payloads of at least this many
+                                bytes (None: never compress)
+            busy_timeout_ms: How long writers wait on a locked database
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1, got {max_bytes}")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be > 0, got {ttl_seconds}")
+
+        self.path = Path(path).expanduser()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.compress_threshold = compress_threshold
+        self.busy_timeout_ms = busy_timeout_ms
+
+        self._local = threading.local()
+        self._counter_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    # ========================================================================
+    # Public API
+    # ========================================================================
+
+    def get(self, key: str) -> AgentResult | None:
+        """
+        Look up a persisted result.
+
+        Returns:
+            The decoded result with ``metadata["cached_at"]`` set, or None
+            on miss, expiry, or storage error
+        """
+        now = time.time()
+
+        try:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT payload, compressed, created_at, expires_at, "
+                "accessed_at FROM results WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+            if row is None:
+                self._count(misses=1)
+                return None
+
+            payload, compressed, created_at, expires_at, accessed_at = row
+
+            if expires_at is not None and expires_at <= now:
+                with conn:
+                    conn.execute(
+                        "DELETE FROM results WHERE key = ? AND expires_at <= ?",
+                        (key, now)
+                    )
+                self._count(misses=1, expirations=1)
+                return None
+
+            if now - accessed_at >= _ACCESS_TOUCH_INTERVAL:
+                with conn:
+                    conn.execute(
+                        "UPDATE results SET accessed_at = ? WHERE key = ?",
+                        (now, key)
+                    )
+
+            if compressed:
+                payload = zlib.decompress(payload)
+            result = AgentResult.model_validate_json(payload)
+
+        except (sqlite3.Error, zlib.error, ValueError) as e:
+            logger.warning(f"⚠ Disk cache read failed for {key}: {e}")
+            self._count(misses=1)
+            return None
+
+        self._count(hits=1)
+        result.metadata["cached_at"] = datetime.fromtimestamp(
+            created_at
+        ).isoformat()
+        return result
+
+    def put(self, key: str, result: AgentResult) -> None:
+        """
+        Persist a result, then evict least recently used entries over caps.
+
+        Results whose data is not JSON-serializable are skipped.
+        """
+        try:
+            payload = result.model_dump_json().encode("utf-8")
+        except Exception as e:
+            logger.debug(f"⊝ Result not serializable, not cached: {key}: {e}")
+            return
+
+        compressed = (
+            self.compress_threshold is not None
+            and len(payload) >= self.compress_threshold
+        )
+        if compressed:
+            payload = zlib.compress(payload)
+
+        if self.max_bytes is not None and len(payload) > self.max_bytes:
+            logger.debug(
+                f"⊝ Result too large to cache ({len(payload)} bytes): {key}"
+            )
+            return
+
+        now = time.time()
+        expires_at = now + self.ttl_seconds if self.ttl_seconds else None
+
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                conn.execute(
+                    "INSERT INTO results (key, payload, compressed, "
+                    "size_bytes, created_at, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, payload, int(compressed), len(payload),
+                     now, expires_at, now)
+                )
+                self._evict_over_capacity(conn)
+        except sqlite3.Error as e:
+            logger.warning(f"⚠ Disk cache write failed for {key}: {e}")
+
+    def invalidate(self, key: str) -> bool:
+        """
+        Remove a single entry.
+
+        Returns:
+            True if an entry was removed
+        """
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute("DELETE FROM results WHERE key = ?", (key,))
+        return cursor.rowcount > 0
+
+    def purge_expired(self) -> int:
+        """
+        Delete all expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute(
+                "DELETE FROM results WHERE expires_at IS NOT NULL "
+                "AND expires_at <= ?",
+                (time.time(),)
+            )
+        self._count(expirations=cursor.rowcount)
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        """Remove all entries (for every process sharing the file)."""
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM results")
+
+    def stats(self) -> CacheStats:
+        """
+        Snapshot this instance's counters and the shared occupancy.
+
+        Hits, misses, evictions and expirations are per-instance;
+        entries and size_bytes reflect the whole database.
+        """
+        entries, size_bytes = self._totals()
+        with self._counter_lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=entries,
+                size_bytes=size_bytes
+            )
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def __len__(self) -> int:
+        return self._totals()[0]
+
+    def __contains__(self, key: object) -> bool:
+        row = self._connection().execute(
+            "SELECT 1 FROM results WHERE key = ? AND "
+            "(expires_at IS NULL OR expires_at > ?)",
+            (key, time.time())
+        ).fetchone()
+        return row is not None
+
+    # ========================================================================
+    # Implementation (Private)
+    # ========================================================================
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Return this thread's connection, reconnecting after fork.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        conn = sqlite3.connect(self.path, timeout=self.busy_timeout_ms / 1000)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def _totals(self) -> tuple[int, int]:
+        row = self._connection().execute(
+            "SELECT entries, size_bytes FROM totals WHERE id = 0"
+        ).fetchone()
+        return (row[0], row[1]) if row else (0, 0)
+
+    def _evict_over_capacity(self, conn: sqlite3.Connection) -> None:
+        """
+        Delete least recently accessed entries until within caps.
+
+        Runs inside the caller's write transaction.
+        """
+        if self.max_entries is None and self.max_bytes is None:
+            return
+
+        entries, size_bytes = conn.execute(
+            "SELECT entries, size_bytes FROM totals WHERE id = 0"
+        ).fetchone()
+
+        evicted = 0
+        while ((self.max_entries is not None and entries > self.max_entries)
+               or (self.max_bytes is not None and size_bytes > self.max_bytes)):
+            row = conn.execute(
+                "SELECT key, size_bytes FROM results "
+                "ORDER BY accessed_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            conn.execute("DELETE FROM results WHERE key = ?", (row[0],))
+            entries -= 1
+            size_bytes -= row[1]
+            evicted += 1
+
+        if evicted:
+            self._count(evictions=evicted)
+            logger.debug(f"♻ Evicted {evicted} disk cache entries")
+
+    def _count(
+        self,
+        hits: int = 0,
+        misses: int = 0,
+        evictions: int = 0,
+        expirations: int = 0
+    ) -> None:
+        with self._counter_lock:
+            self._hits += hits
+            self._misses += misses
+            self._evictions += evictions
+            self._expirations += expirations
@@ -0,0 +1,442 @@
+"""
+Batch Executors: Pluggable Backends for execute_batch
+
+Implements the Strategy Pattern—AgentOrchestrator.execute_batch delegates
+HOW a batch runs to an executor, while the orchestrator keeps ownership
+of WHAT runs (lookup, middleware, error containment).
+
+Single Responsibility: Executors only schedule work onto threads or
+processes and collect results. They never inspect skill output beyond
+the CRITICAL short-circuit check.
+
+Usage:
+    from core.executors import ThreadPoolBatchExecutor, ProcessPoolBatchExecutor
+
+    results = orchestrator.execute_batch(tasks, executor=ThreadPoolBatchExecutor(8))
+
+    with ProcessPoolBatchExecutor(max_workers=32) as executor:
+        results = orchestrator.execute_batch(tasks, executor=executor)
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Protocol, runtime_checkable
+
+from .protocols import AgentContext, AgentResult, TaskPriority
+from .registry import SkillRegistry
+
+if TYPE_CHECKING:
+    from .orchestrator import AgentOrchestrator
+
+
+# ============================================================================
+# Logging Configuration
+# ============================================================================
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Executor Protocol
+# ============================================================================
+
+@runtime_checkable
+class BatchExecutor(Protocol):
+    """
+    Structural contract for execute_batch backends.
+
+    Implementations must:
+    - Return exactly one AgentResult per task, in input order
+    - Never raise for individual task failures (error containment)
+    - Cancel remaining work when a CRITICAL task fails
+    """
+
+    def run_batch(
+        self,
+        orchestrator: AgentOrchestrator,
+        tasks: list[tuple[str, AgentContext]]
+    ) -> list[AgentResult]:
+        """Execute tasks and return results in input order."""
+        ...
+
+
+# ============================================================================
+# Result Collection
+# ============================================================================
+
+def collect_batch_results(
+    orchestrator: AgentOrchestrator,
+    tasks: list[tuple[str, AgentContext]],
+    futures: dict[Future, int],
+    on_broken_pool: Callable[..., Any] | None = None
+) -> list[AgentResult]:
+    """
+    Gather batch results as they complete, honouring the CRITICAL abort.
+
+    Work that had not started when the batch aborted is cancelled and
+    reported as SKIPPED; tasks already running cannot be interrupted, so
+    they are waited for and keep their real results. Tasks whose context
+    deadline passes before they finish are cancelled (if not yet
+    started) and reported as timeout FAILUREs; the batch does not wait
+    for them.
+
+    Args:
+        orchestrator: Orchestrator used to build failure/cancel results
+        tasks: The submitted (skill_name, context) tuples
+        futures: Mapping of future -> index into tasks
+        on_broken_pool: Called with wait=False if a worker process died
+
+    Returns:
+        List of AgentResult in same order as tasks
+    """
+    results: list[AgentResult | None] = [None] * len(tasks)
+    deadlines = {
+        future: tasks[index][1].deadline
+        for future, index in futures.items()
+        if tasks[index][1].deadline is not None
+    }
+    pending = set(futures)
+    aborted = False
+
+    while pending:
+        timeout = None
+        if deadlines:
+            timeout = max(0.0, min(deadlines.values()) - time.time())
+        done, pending = wait(pending, timeout=timeout,
+                             return_when=FIRST_COMPLETED)
+
+        # Record everything that finished before acting on an abort
+        aborted_by = None
+        for future in done:
+            deadlines.pop(future, None)
+            index = futures[future]
+            skill_name, context = tasks[index]
+
+            try:
+                result = future.result()
+            except BrokenProcessPool as e:
+                # A worker died; let the owner rebuild its pool on next use
+                if on_broken_pool is not None:
+                    on_broken_pool(wait=False)
+                result = orchestrator._create_exception_result(e)
+            except Exception as e:
+                result = orchestrator._create_exception_result(e)
+            results[index] = result
+
+            if (not aborted and not result.success and
+                    context.priority == TaskPriority.CRITICAL):
+                aborted_by = skill_name
+
+        # Short-circuit on critical failures: queued work is dropped;
+        # running work can't be interrupted, so it is still collected
+        # with its real result (like Workflow.run and the async path)
+        if aborted_by is not None:
+            aborted = True
+            cancelled = {future for future in pending if future.cancel()}
+            pending -= cancelled
+            logger.error(
+                f"⚠ Critical task failed: {aborted_by}, cancelled "
+                f"{len(cancelled)} queued tasks, waiting for "
+                f"{len(pending)} running"
+            )
+            for future in list(deadlines):
+                if future not in pending:
+                    del deadlines[future]
+
+        _expire_overdue(orchestrator, tasks, futures, deadlines,
+                        pending, results)
+
+    return [
+        result if result is not None
+        else orchestrator._create_cancelled_result(tasks[index][0])
+        for index, result in enumerate(results)
+    ]
+
+
+def _expire_overdue(
+    orchestrator: AgentOrchestrator,
+    tasks: list[tuple[str, AgentContext]],
+    futures: dict[Future, int],
+    deadlines: dict[Future, float],
+    pending: set[Future],
+    results: list[AgentResult | None]
+) -> None:
+    """Stop waiting for pending tasks whose deadline has passed."""
+    now = time.time()
+    for future, deadline in list(deadlines.items()):
+        if deadline > now:
+            continue
+        del deadlines[future]
+        pending.discard(future)
+        # Queued work is dropped; running work can't be interrupted
+        # and finishes unobserved
+        future.cancel()
+        index = futures[future]
+        results[index] = orchestrator._create_timeout_result(
+            tasks[index][0], 0.0
+        )
+
+
+# ============================================================================
+# Pool-Backed Executors
+# ============================================================================
+
+class _PoolBatchExecutor(ABC):
+    """
+    Shared lifecycle and result collection for pool-backed executors.
+
+    The underlying pool is created lazily on first use and reused across
+    batches, so warm-up cost is paid once per executor, not per batch.
+    A pool that depends on the orchestrator it was built for (see
+    _key_for) is only reused for orchestrators that would build the
+    same pool.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+
+        self.max_workers = max_workers
+        self._pool: Executor | None = None
+        self._pool_key: Any = None
+        self._lock = threading.Lock()
+
+    # ========================================================================
+    # Public API
+    # ========================================================================
+
+    def run_batch(
+        self,
+        orchestrator: AgentOrchestrator,
+        tasks: list[tuple[str, AgentContext]]
+    ) -> list[AgentResult]:
+        """
+        Execute tasks on the pool and return results in input order.
+
+        Raises:
+            ValueError: The pool was built for an incompatible orchestrator
+        """
+        pool = self._get_pool(orchestrator)
+        futures: dict[Future, int] = {
+            self._submit(pool, orchestrator, skill_name, context): index
+            for index, (skill_name, context) in enumerate(tasks)
+        }
+        return collect_batch_results(
+            orchestrator, tasks, futures, on_broken_pool=self.shutdown
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Release pool workers. The executor may be reused afterwards."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    def __enter__(self) -> "_PoolBatchExecutor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+
+    # ========================================================================
+    # Extension Points (Private)
+    # ========================================================================
+
+    @abstractmethod
+    def _create_pool(self, orchestrator: AgentOrchestrator) -> Executor:
+        """Build the pool that runs orchestrator's batches."""
+
+    @abstractmethod
+    def _submit(
+        self,
+        pool: Executor,
+        orchestrator: AgentOrchestrator,
+        skill_name: str,
+        context: AgentContext
+    ) -> Future:
+        """Schedule one task on the pool."""
+
+    def _key_for(self, orchestrator: AgentOrchestrator) -> Any:
+        """
+        What a pool built for orchestrator depends on.
+
+        The default (None) fits pools that receive the orchestrator with
+        every task and so serve any orchestrator.
+        """
+        return None
+
+    # ========================================================================
+    # Implementation (Private)
+    # ========================================================================
+
+    def _get_pool(self, orchestrator: AgentOrchestrator) -> Executor:
+        key = self._key_for(orchestrator)
+        with self._lock:
+            if self._pool is None:
+                self._pool = self._create_pool(orchestrator)
+                self._pool_key = key
+            elif key != self._pool_key:
+                raise ValueError(
+                    f"{type(self).__name__} pool was built for {self._pool_key}, "
+                    f"not {key}; call shutdown() first or use another executor"
+                )
+            return self._pool
+
+
+class ThreadPoolBatchExecutor(_PoolBatchExecutor):
+    """
+    Runs batch tasks on a shared thread pool.
+
+    Best for I/O-bound skills and CPU-bound skills that release the GIL
+    (NumPy, compression, hashing). Middleware registered on the
+    orchestrator runs in the worker threads and must be thread-safe.
+    """
+
+    def _create_pool(self, orchestrator: AgentOrchestrator) -> Executor:
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="skill-worker"
+        )
+
+    def _submit(
+        self,
+        pool: Executor,
+        orchestrator: AgentOrchestrator,
+        skill_name: str,
+        context: AgentContext
+    ) -> Future:
+        return pool.submit(orchestrator.execute_task, skill_name, context)
+
+
+class ProcessPoolBatchExecutor(_PoolBatchExecutor):
+    """
+    Runs batch tasks on a pool of worker processes.
+
+    Each worker builds its own SkillRegistry and AgentOrchestrator once,
+    in the pool initializer, and keeps them warm for every subsequent
+    task—skill modules are imported and discovered once per worker, not
+    once per task.
+
+    Constraints:
+    - AgentContext and AgentResult cross the process boundary by pickling,
+      so result data must be picklable
+    - The parent orchestrator's middleware is NOT shipped to workers; pass
+      module-level (picklable) middleware via ``middleware`` instead
+    - Workers are bound to the skills directory and naming convention of
+      the first orchestrator; running a batch for one with different
+      skills raises ValueError until shutdown() is called
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        skills_dir: Path | str | None = None,
+        naming_convention: str | None = None,
+        middleware: tuple[Callable, ...] = (),
+        orchestrator_options: dict[str, Any] | None = None
+    ):
+        """
+        Args:
+            max_workers: Number of worker processes (default: CPU count)
+            skills_dir: Skills directory for workers (default: the
+                        orchestrator's registry directory)
+            naming_convention: Skill function name (default: registry's)
+            middleware: Picklable middleware to install in each worker
+            orchestrator_options: Extra AgentOrchestrator kwargs for workers
+                                  (default: logging disabled)
+        """
+        super().__init__(max_workers)
+        self.skills_dir = skills_dir
+        self.naming_convention = naming_convention
+        self.middleware = tuple(middleware)
+        self.orchestrator_options = (
+            orchestrator_options
+            if orchestrator_options is not None
+            else {"enable_logging": False}
+        )
+
+    def _key_for(self, orchestrator: AgentOrchestrator) -> tuple[str, str]:
+        """Workers discover skills themselves: (skills_dir, naming)."""
+        registry = orchestrator.registry
+        skills_dir = Path(self.skills_dir or registry.skills_dir).resolve()
+        return (
+            str(skills_dir),
+            self.naming_convention or registry.naming_convention
+        )
+
+    def _create_pool(self, orchestrator: AgentOrchestrator) -> Executor:
+        skills_dir, naming_convention = self._key_for(orchestrator)
+
+        logger.info(
+            f"🚀 Starting process pool for skills in: {skills_dir}"
+        )
+
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(
+                skills_dir,
+                naming_convention,
+                self.middleware,
+                self.orchestrator_options
+            )
+        )
+
+    def _submit(
+        self,
+        pool: Executor,
+        orchestrator: AgentOrchestrator,
+        skill_name: str,
+        context: AgentContext
+    ) -> Future:
+        return pool.submit(_execute_in_worker, skill_name, context)
+
+
+# ============================================================================
+# Process Worker Entry Points
+# ============================================================================
+
+# Per-process orchestrator, built once by _init_worker
+_worker_orchestrator: AgentOrchestrator | None = None
+
+
+def _init_worker(
+    skills_dir: str,
+    naming_convention: str,
+    middleware: tuple[Callable, ...],
+    orchestrator_options: dict[str, Any]
+) -> None:
+    """
+    Process pool initializer: discover skills once and keep them warm.
+    """
+    from .orchestrator import AgentOrchestrator
+
+    global _worker_orchestrator
+
+    registry = SkillRegistry(skills_dir, naming_convention=naming_convention)
+    _worker_orchestrator = AgentOrchestrator(registry, **orchestrator_options)
+    for m in middleware:
+        _worker_orchestrator.add_middleware(m)
+
+
+def _execute_in_worker(skill_name: str, context: AgentContext) -> AgentResult:
+    """
+    Execute a single task on this worker's warm orchestrator.
+    """
+    if _worker_orchestrator is None:
+        raise RuntimeError("Worker process was not initialized")
+    return _worker_orchestrator.execute_task(skill_name, context)
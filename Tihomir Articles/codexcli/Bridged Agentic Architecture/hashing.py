@@ -0,0 +1,208 @@
+"""
+Canonical Hashing: Deterministic Digests of Nested Parameter Structures
+
+Produces content-addressed cache keys that are stable across processes
+and insertion order, and that work for values which cannot be compared
+with each other (mixed-type dict keys, sets of unorderable items).
+
+Encoding Rules:
+- Plain JSON values (string-keyed dicts, lists, str, int, finite
+  float, bool, None) are encoded as key-sorted JSON by orjson, in C.
+  orjson would also accept tuples, enums, NaN and infinity, but writes
+  them like lists, plain values and null; a value is only keyed by its
+  JSON if decoding that JSON gives back an equal value (a C-level
+  check), so those take the canonical path below instead.
+- Everything else, or everything when orjson is not installed, is
+  rewritten into a canonical form whose repr() is the encoding. repr()
+  of str, int, float, bool, None, bytes, lists, tuples and dicts is
+  unambiguous, so 1, 1.0, True and "1" never collide.
+  - Dicts with all-string keys are rebuilt in sorted key order. Other
+    dicts and all sets are sorted by the ENCODED form of their members,
+    so unorderable values never need comparing.
+  - Pydantic models, dataclasses, enums, sets and other objects are
+    wrapped in a tagged marker ("<kind, type name, content>") that no
+    builtin repr() can produce. Unknown objects use their repr().
+  - Subclasses of builtin scalars and containers are encoded as their
+    base type. -0.0 is encoded as 0.0.
+- The two encodings start differently (a "j" prefix for JSON), so they
+  cannot collide with each other.
+
+The digest is BLAKE2b (stdlib, faster than SHA-256 on 64-bit CPUs),
+truncated to 128 bits.
+"""
+
+import dataclasses
+import hashlib
+from enum import Enum
+from typing import Any, Collection, Mapping
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+
+# ============================================================================
+# Public API
+# ============================================================================
+
+DIGEST_SIZE = 16
+
+
+def canonical_digest(value: Any) -> str:
+    """
+    Hex digest of the canonical encoding of value.
+
+    Equal structures produce equal digests regardless of dict insertion
+    order or set iteration order.
+
+    Example:
+        canonical_digest({"b": {1, 2}, "a": [1.5, None]}) == \\
+            canonical_digest({"a": [1.5, None], "b": {2, 1}})
+    """
+    return hashlib.blake2b(
+        canonical_encode(value),
+        digest_size=DIGEST_SIZE
+    ).hexdigest()
+
+
+def canonical_encode(value: Any) -> bytes:
+    """Deterministic, type-distinguishing byte encoding of value."""
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(value, default=_not_json, option=_JSON_OPTIONS)
+        except TypeError:
+            pass
+        else:
+            # orjson writes tuples like lists, enums like their values and
+            # NaN/infinity as null; none of those survive the round trip
+            # (list != tuple, nan != None), so they fall through below
+            if orjson.loads(encoded) == value:
+                return b"j" + encoded
+    return repr(_canonical(value)).encode("utf-8", "surrogatepass")
+
+
+# ============================================================================
+# Encoding Implementation (Private)
+# ============================================================================
+
+if orjson is not None:
+    # Subclasses, dataclasses and datetimes are handed to _not_json, so
+    # they take the canonical repr() path instead of being coerced
+    _JSON_OPTIONS = (
+        orjson.OPT_SORT_KEYS
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+
+def _not_json(value: Any) -> Any:
+    raise TypeError(f"{type(value).__name__} is not plain JSON")
+
+
+# Exact types that are their own canonical form
+_SCALARS = frozenset({str, int, bool, type(None), bytes})
+
+# ... and floats other than zero
+_LEAF_TYPES = _SCALARS | {float}
+
+_STR_ONLY = frozenset({str})
+
+
+class _Tagged(tuple):
+    """Marker for non-builtin values; its repr starts with "<"."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f"<{tuple.__repr__(self)[1:-1]}>"
+
+
+def _canonical(value: Any) -> Any:
+    # Exact-type fast paths for the common JSON-like shapes
+    value_type = type(value)
+
+    if value_type in _SCALARS:
+        return value
+    if value_type is float:
+        # -0.0 == 0.0, so both must encode alike
+        return value if value else 0.0
+    if value_type is dict:
+        return _canonical_mapping(value)
+    if value_type is list or value_type is tuple:
+        if _all_scalars(value):
+            return value
+        return value_type(map(_canonical, value))
+
+    # Subclasses and everything else
+    if isinstance(value, Enum):
+        return _Tagged(("enum", _type_name(value), _canonical(value.value)))
+    if isinstance(value, BaseModel):
+        return _Tagged(("model", _type_name(value), _canonical(value.model_dump())))
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return _Tagged((
+            "dataclass", _type_name(value), _canonical(dataclasses.asdict(value))
+        ))
+    if isinstance(value, Mapping):
+        return _canonical_mapping(value)
+    if isinstance(value, (set, frozenset)):
+        return _Tagged(("set", *sorted(map(_encoded, value))))
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value)
+    if isinstance(value, bool):
+        return bool(value)
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float):
+        return _canonical(float(value))
+    if isinstance(value, str):
+        return str(value)
+    if isinstance(value, list):
+        return _canonical(list(value))
+    if isinstance(value, tuple):
+        return _canonical(tuple(value))
+
+    # datetime, Decimal, UUID, Path, ...: type + repr
+    return _Tagged(("repr", _type_name(value), repr(value)))
+
+
+def _canonical_mapping(value: Mapping) -> Any:
+    if not set(map(type, value)) <= _STR_ONLY:
+        # Keys of mixed types: order by encoded form instead
+        return _Tagged(("dict", *sorted(
+            f"{_encoded(k)}: {_encoded(v)}" for k, v in value.items()
+        )))
+
+    # String keys are unique and mutually orderable, so sorting the items
+    # never compares values; a dict rebuilt in sorted order reprs in order
+    items = sorted(value.items())
+    if _all_scalars(value.values()):
+        return dict(items)
+    return {
+        key: item if type(item) in _SCALARS else _canonical(item)
+        for key, item in items
+    }
+
+
+def _all_scalars(items: Collection[Any]) -> bool:
+    """
+    True if every item is its own canonical form.
+
+    Type checks run in C (set of types). Zero floats (-0.0) are not
+    canonical; "0.0 in items" also matches 0 and False, which only
+    costs the slow path.
+    """
+    types = set(map(type, items))
+    return types <= _LEAF_TYPES and (float not in types or 0.0 not in items)
+
+
+def _encoded(value: Any) -> str:
+    return repr(_canonical(value))
+
+
+def _type_name(value: Any) -> str:
+    cls = type(value)
+    return f"{cls.__module__}.{cls.__qualname__}"
@@ -0,0 +1,225 @@
+"""
+Hedging: Duplicate Slow Requests to Cut Tail Latency
+
+When an execution of an idempotent skill is still running after its
+learned p95 (by default), a second "hedged" execution is started and
+whichever finishes first is returned. Stragglers stop dominating p99 at
+the cost of a small, capped amount of extra work.
+
+Single Responsibility: This module ONLY decides when to hedge and keeps
+the accounting. AgentOrchestrator runs the attempts and cancels the
+loser (async skills are cancelled; sync attempts on threads cannot be
+interrupted and are abandoned to a bounded pool of max_sync_workers
+daemon threads).
+
+Eligibility:
+    Only skills whose module declares it through SkillMetadata:
+
+        def get_metadata() -> dict:
+            return {"idempotent": True}
+
+Trigger:
+    hedge delay = latency quantile from MetricsRegistry, once at least
+    min_samples executions have been observed (no hedging before that).
+
+Cap:
+    Every hedgeable request deposits max_hedge_ratio tokens and every
+    hedge spends one, so hedges stay below that share of traffic even
+    when a whole skill slows down. At most max_outstanding_hedges run
+    at once; sync requests that find every hedging worker busy run
+    inline, unhedged.
+
+Exported Events (MetricsRegistry, per skill):
+    hedges, hedge_wins, hedge_capped
+    Win rate = hedge_wins / hedges.
+
+Usage:
+    orchestrator = AgentOrchestrator(
+        registry,
+        metrics=MetricsRegistry(),
+        hedging=HedgePolicy(quantile=0.95, max_hedge_ratio=0.05)
+    )
+"""
+
+import logging
+import threading
+from collections import Counter
+from dataclasses import dataclass
+
+from .metrics import MetricsRegistry
+
+
+# ============================================================================
+# Logging Configuration
+# ============================================================================
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Domain Models
+# ============================================================================
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """
+    When to hedge, and how much.
+
+    The hedge delay is the skill's latency quantile, clamped to
+    [min_delay_ms, max_delay_ms]. Sync attempts run on at most
+    max_sync_workers daemon threads (shared by originals and hedges).
+    """
+    quantile: float = 0.95
+    min_samples: int = 50
+    min_delay_ms: float = 1.0
+    max_delay_ms: float = 10_000.0
+    max_hedge_ratio: float = 0.05
+    max_burst: float = 10.0
+    max_outstanding_hedges: int = 8
+    max_sync_workers: int = 32
+
+    def __post_init__(self):
+        if not 0.0 < self.quantile < 1.0:
+            raise ValueError(f"quantile must be in (0, 1), got {self.quantile}")
+        if not 0.0 <= self.max_hedge_ratio <= 1.0:
+            raise ValueError(
+                f"max_hedge_ratio must be in [0, 1], got {self.max_hedge_ratio}"
+            )
+        if self.min_delay_ms > self.max_delay_ms:
+            raise ValueError("min_delay_ms must be <= max_delay_ms")
+        if self.max_outstanding_hedges < 0:
+            raise ValueError("max_outstanding_hedges must be >= 0")
+        if self.max_sync_workers < 1:
+            raise ValueError("max_sync_workers must be >= 1")
+
+
+@dataclass(frozen=True)
+class HedgeStats:
+    """Hedging counters for one skill (or all skills)."""
+    requests: int
+    hedges: int
+    hedge_wins: int
+    capped: int
+
+    @property
+    def hedge_rate(self) -> float:
+        return self.hedges / self.requests if self.requests else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of hedges that returned before the original."""
+        return self.hedge_wins / self.hedges if self.hedges else 0.0
+
+
+# ============================================================================
+# Hedger
+# ============================================================================
+
+class Hedger:
+    """
+    Hedge trigger, traffic cap and win accounting for an orchestrator.
+
+    Thread-safe.
+    """
+
+    def __init__(self, policy: HedgePolicy, metrics: MetricsRegistry):
+        """
+        Args:
+            policy: Trigger and cap configuration
+            metrics: Source of learned latencies and sink for hedge events
+        """
+        self.policy = policy
+        self.metrics = metrics
+        self._balance = 0.0
+        self._outstanding = 0
+        self._requests: Counter[str] = Counter()
+        self._hedges: Counter[str] = Counter()
+        self._wins: Counter[str] = Counter()
+        self._capped: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    # ========================================================================
+    # Public API
+    # ========================================================================
+
+    def delay_for(self, skill_name: str) -> float | None:
+        """
+        Seconds to wait before hedging a new request, and count it.
+
+        Returns:
+            None while the skill's latency has not been learned yet
+        """
+        policy = self.policy
+        with self._lock:
+            self._requests[skill_name] += 1
+            self._balance = min(
+                policy.max_burst, self._balance + policy.max_hedge_ratio
+            )
+
+        latency_ms = self.metrics.latency_quantile(
+            skill_name, policy.quantile, min_samples=policy.min_samples
+        )
+        if latency_ms is None:
+            return None
+
+        delay_ms = min(policy.max_delay_ms, max(policy.min_delay_ms, latency_ms))
+        return delay_ms / 1000
+
+    def try_hedge(self, skill_name: str) -> bool:
+        """
+        Spend hedge capacity for a straggling request, if any is left.
+
+        A True result must be paired with hedge_finished() once the
+        hedge attempt has completed or been cancelled.
+        """
+        with self._lock:
+            if (self._balance >= 1.0
+                    and self._outstanding < self.policy.max_outstanding_hedges):
+                self._balance -= 1.0
+                self._outstanding += 1
+                self._hedges[skill_name] += 1
+                event = "hedges"
+            else:
+                self._capped[skill_name] += 1
+                event = "hedge_capped"
+
+        self.metrics.increment(skill_name, event)
+        if event == "hedge_capped":
+            logger.debug(f"⊘ Hedge for {skill_name} capped")
+            return False
+        return True
+
+    def hedge_finished(self) -> None:
+        """Free the outstanding-hedge slot taken by try_hedge()."""
+        with self._lock:
+            self._outstanding -= 1
+
+    @property
+    def outstanding(self) -> int:
+        """Hedge attempts started and not yet finished."""
+        return self._outstanding
+
+    def record_winner(self, skill_name: str, hedge_won: bool) -> None:
+        """Record which attempt of a hedged request finished first."""
+        if not hedge_won:
+            return
+        with self._lock:
+            self._wins[skill_name] += 1
+        self.metrics.increment(skill_name, "hedge_wins")
+
+    def stats(self, skill_name: str | None = None) -> HedgeStats:
+        """Counters for one skill, or totals across all skills."""
+        with self._lock:
+            if skill_name is not None:
+                return HedgeStats(
+                    requests=self._requests[skill_name],
+                    hedges=self._hedges[skill_name],
+                    hedge_wins=self._wins[skill_name],
+                    capped=self._capped[skill_name]
+                )
+            return HedgeStats(
+                requests=sum(self._requests.values()),
+                hedges=sum(self._hedges.values()),
+                hedge_wins=sum(self._wins.values()),
+                capped=sum(self._capped.values())
+            )
@@ -0,0 +1,474 @@
+"""
+Metrics: Per-Skill Counters, Latency Histograms, and Prometheus Export
+
+Aggregates what would otherwise be discarded in each result's
+``metadata["execution_time_ms"]`` into constant-memory, per-skill
+statistics that can be scraped or written out in Prometheus text format.
+
+Single Responsibility: This module ONLY aggregates and exports
+measurements. Producers (AgentOrchestrator, PriorityScheduler, @timed)
+decide what to observe.
+
+Usage:
+    from core.metrics import MetricsRegistry
+
+    metrics = MetricsRegistry()
+    orchestrator = AgentOrchestrator(registry, metrics=metrics)
+
+    metrics.serve_prometheus(port=9464)         # GET /metrics
+    metrics.write_prometheus("/var/lib/node_exporter/agents.prom")
+"""
+
+import bisect
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+
+# ============================================================================
+# Logging Configuration
+# ============================================================================
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Defaults
+# ============================================================================
+
+# Upper bounds (ms) of histogram buckets; roughly 2.5x apart from 100µs
+# to 60s. Everything slower lands in the implicit +Inf bucket.
+DEFAULT_LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500,
+    1_000, 2_500, 5_000, 10_000, 30_000, 60_000,
+)
+
+EXPORTED_QUANTILES: tuple[float, ...] = (0.5, 0.95, 0.99)
+
+
+# ============================================================================
+# Latency Histogram
+# ============================================================================
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram with quantile estimation.
+
+    Memory is constant (one counter per bucket) no matter how many
+    observations are recorded. Quantiles are interpolated linearly
+    within the bucket that contains them, so their precision is bounded
+    by bucket width.
+
+    Not thread-safe on its own; MetricsRegistry serializes access.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum", "min", "max")
+
+    def __init__(self, bounds: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS_MS):
+        if list(bounds) != sorted(bounds) or not bounds:
+            raise ValueError("Histogram bounds must be non-empty and sorted")
+
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(bounds) + 1)  # last bucket is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        """Record one observation."""
+        self.counts[bisect.bisect_left(self.bounds, value_ms)] += 1
+        self.count += 1
+        self.sum += value_ms
+        self.min = min(self.min, value_ms)
+        self.max = max(self.max, value_ms)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the q-quantile (0 < q <= 1) in milliseconds.
+
+        Returns 0.0 when empty.
+        """
+        if not 0 < q <= 1:
+            raise ValueError(f"Quantile must be in (0, 1], got {q}")
+        if self.count == 0:
+            return 0.0
+
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = self.bounds[index - 1] if index > 0 else 0.0
+                upper = (
+                    self.bounds[index] if index < len(self.bounds)
+                    else self.max
+                )
+                lower = max(lower, self.min)
+                upper = min(upper, self.max)
+                fraction = (rank - cumulative) / bucket_count
+                return lower + (upper - lower) * fraction
+            cumulative += bucket_count
+
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+
+# ============================================================================
+# Domain Models
+# ============================================================================
+
+@dataclass
+class SkillMetrics:
+    """Aggregated measurements for one (skill, source) pair."""
+    calls_by_status: dict[str, int] = field(default_factory=dict)
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    queue_wait: LatencyHistogram = field(default_factory=LatencyHistogram)
+    events: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def calls(self) -> int:
+        return sum(self.calls_by_status.values())
+
+    @property
+    def errors(self) -> int:
+        return self.calls_by_status.get("failure", 0)
+
+    @property
+    def error_rate(self) -> float:
+        calls = self.calls
+        return self.errors / calls if calls else 0.0
+
+
+# ============================================================================
+# Metrics Registry
+# ============================================================================
+
+class MetricsRegistry:
+    """
+    Thread-safe store of per-skill metrics with Prometheus export.
+
+    Series are labelled by ``skill`` and ``source`` (which component
+    observed them, e.g. "orchestrator" or "timed"), so sharing one
+    registry between the orchestrator and @timed does not double count.
+    """
+
+    def __init__(
+        self,
+        namespace: str = "agent",
+        latency_buckets_ms: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS_MS
+    ):
+        """
+        Args:
+            namespace: Prefix for exported metric names
+            latency_buckets_ms: Histogram bucket upper bounds
+        """
+        self.namespace = namespace
+        self._buckets = tuple(latency_buckets_ms)
+        self._skills: dict[tuple[str, str], SkillMetrics] = {}
+        self._lock = threading.Lock()
+
+    # ========================================================================
+    # Recording
+    # ========================================================================
+
+    def observe_execution(
+        self,
+        skill_name: str,
+        status: str,
+        elapsed_ms: float,
+        source: str = "orchestrator"
+    ) -> None:
+        """Record one completed execution and its latency."""
+        with self._lock:
+            metrics = self._get(skill_name, source)
+            metrics.calls_by_status[status] = (
+                metrics.calls_by_status.get(status, 0) + 1
+            )
+            metrics.latency.observe(elapsed_ms)
+
+    def observe_queue_wait(
+        self,
+        skill_name: str,
+        wait_ms: float,
+        source: str = "orchestrator"
+    ) -> None:
+        """Record time a task spent queued before execution started."""
+        with self._lock:
+            self._get(skill_name, source).queue_wait.observe(wait_ms)
+
+    def increment(
+        self,
+        skill_name: str,
+        event: str,
+        value: int = 1,
+        source: str = "orchestrator"
+    ) -> None:
+        """Count a named per-skill event (e.g. "hedges", "hedge_wins")."""
+        with self._lock:
+            events = self._get(skill_name, source).events
+            events[event] = events.get(event, 0) + value
+
+    # ========================================================================
+    # Reading
+    # ========================================================================
+
+    def latency_quantile(
+        self,
+        skill_name: str,
+        q: float,
+        source: str = "orchestrator",
+        min_samples: int = 1
+    ) -> float | None:
+        """
+        Estimated latency quantile for a skill, or None if fewer than
+        min_samples executions have been observed.
+        """
+        with self._lock:
+            metrics = self._skills.get((skill_name, source))
+            if metrics is None or metrics.latency.count < max(1, min_samples):
+                return None
+            return metrics.latency.quantile(q)
+
+    def snapshot(self) -> dict[str, dict]:
+        """
+        Plain-dict summary per skill (for logging, JSON, or tests).
+
+        Keys are "<skill>" for orchestrator series and
+        "<skill>@<source>" for others.
+        """
+        with self._lock:
+            summary = {}
+            for (skill_name, source), m in sorted(self._skills.items()):
+                key = skill_name if source == "orchestrator" else (
+                    f"{skill_name}@{source}"
+                )
+                summary[key] = {
+                    "calls": m.calls,
+                    "errors": m.errors,
+                    "error_rate": m.error_rate,
+                    "calls_by_status": dict(m.calls_by_status),
+                    "latency_ms": _histogram_summary(m.latency),
+                    "queue_wait_ms": _histogram_summary(m.queue_wait),
+                    "events": dict(m.events),
+                }
+            return summary
+
+    # ========================================================================
+    # Prometheus Export
+    # ========================================================================
+
+    def render_prometheus(self) -> str:
+        """
+        Render all series in Prometheus text exposition format (0.0.4).
+
+        Latencies are exported in seconds, per Prometheus convention.
+        """
+        ns = self.namespace
+        lines: list[str] = []
+
+        with self._lock:
+            items = sorted(self._skills.items())
+
+            lines += [
+                f"# HELP {ns}_skill_executions_total Completed skill executions.",
+                f"# TYPE {ns}_skill_executions_total counter",
+            ]
+            for (skill_name, source), m in items:
+                for status, count in sorted(m.calls_by_status.items()):
+                    labels = _labels(skill=skill_name, source=source, status=status)
+                    lines.append(f"{ns}_skill_executions_total{labels} {count}")
+
+            lines += [
+                f"# HELP {ns}_skill_error_ratio Fraction of executions that failed.",
+                f"# TYPE {ns}_skill_error_ratio gauge",
+            ]
+            for (skill_name, source), m in items:
+                labels = _labels(skill=skill_name, source=source)
+                lines.append(f"{ns}_skill_error_ratio{labels} {m.error_rate:.6g}")
+
+            lines += [
+                f"# HELP {ns}_skill_events_total Named per-skill events.",
+                f"# TYPE {ns}_skill_events_total counter",
+            ]
+            for (skill_name, source), m in items:
+                for event, count in sorted(m.events.items()):
+                    labels = _labels(skill=skill_name, source=source, event=event)
+                    lines.append(f"{ns}_skill_events_total{labels} {count}")
+
+            for metric, attr, help_text in (
+                ("skill_latency_seconds", "latency",
+                 "Skill execution latency."),
+                ("skill_queue_wait_seconds", "queue_wait",
+                 "Time tasks waited in the scheduler queue."),
+            ):
+                lines += [
+                    f"# HELP {ns}_{metric} {help_text}",
+                    f"# TYPE {ns}_{metric} histogram",
+                ]
+                for (skill_name, source), m in items:
+                    histogram: LatencyHistogram = getattr(m, attr)
+                    if histogram.count:
+                        lines += _render_histogram(
+                            f"{ns}_{metric}", histogram,
+                            skill=skill_name, source=source
+                        )
+
+            lines += [
+                f"# HELP {ns}_skill_latency_quantile_seconds "
+                f"Estimated latency quantiles.",
+                f"# TYPE {ns}_skill_latency_quantile_seconds gauge",
+            ]
+            for (skill_name, source), m in items:
+                if not m.latency.count:
+                    continue
+                for q in EXPORTED_QUANTILES:
+                    labels = _labels(
+                        skill=skill_name, source=source, quantile=f"{q:g}"
+                    )
+                    lines.append(
+                        f"{ns}_skill_latency_quantile_seconds{labels} "
+                        f"{m.latency.quantile(q) / 1000:.6g}"
+                    )
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: Path | str) -> None:
+        """
+        Atomically write the exposition to a file.
+
+        Suitable for the node_exporter textfile collector: the file is
+        written to a temporary sibling and renamed into place.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.render_prometheus())
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def serve_prometheus(
+        self,
+        port: int = 9464,
+        host: str = "127.0.0.1"
+    ) -> ThreadingHTTPServer:
+        """
+        Serve GET /metrics from a background daemon thread.
+
+        Returns:
+            The running server; call .shutdown() to stop it
+        """
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header(
+                    "Content-Type", "text/plain; version=0.0.4; charset=utf-8"
+                )
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                logger.debug(f"metrics: {format % args}")
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        thread = threading.Thread(
+            target=server.serve_forever,
+            name="metrics-http",
+            daemon=True
+        )
+        thread.start()
+
+        logger.info(
+            f"📈 Serving metrics on http://{host}:{server.server_port}/metrics"
+        )
+        return server
+
+    # ========================================================================
+    # Implementation (Private)
+    # ========================================================================
+
+    def _get(self, skill_name: str, source: str) -> SkillMetrics:
+        """Return (creating) the series for a skill. Lock must be held."""
+        metrics = self._skills.get((skill_name, source))
+        if metrics is None:
+            metrics = SkillMetrics(
+                latency=LatencyHistogram(self._buckets),
+                queue_wait=LatencyHistogram(self._buckets)
+            )
+            self._skills[(skill_name, source)] = metrics
+        return metrics
+
+
+# ============================================================================
+# Default Registry
+# ============================================================================
+
+# Fed by the @timed decorator; pass it to AgentOrchestrator(metrics=...)
+# to export orchestrator and decorator series together
+default_registry = MetricsRegistry()
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def _labels(**labels: str) -> str:
+    escaped = (
+        f'{name}="{_escape(value)}"' for name, value in labels.items()
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _escape(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+    )
+
+
+def _render_histogram(
+    name: str,
+    histogram: LatencyHistogram,
+    **labels: str
+) -> list[str]:
+    lines = []
+    cumulative = 0
+    for bound, count in zip(histogram.bounds, histogram.counts):
+        cumulative += count
+        le = f"{bound / 1000:.6g}"
+        lines.append(f"{name}_bucket{_labels(**labels, le=le)} {cumulative}")
+    lines.append(
+        f"{name}_bucket{_labels(**labels, le='+Inf')} {histogram.count}"
+    )
+    lines.append(f"{name}_sum{_labels(**labels)} {histogram.sum / 1000:.6g}")
+    lines.append(f"{name}_count{_labels(**labels)} {histogram.count}")
+    return lines
+
+
+def _histogram_summary(histogram: LatencyHistogram) -> dict[str, float]:
+    if not histogram.count:
+        return {"count": 0}
+    return {
+        "count": histogram.count,
+        "mean": histogram.mean,
+        "min": histogram.min,
+        "max": histogram.max,
+        **{f"p{int(q * 100)}": histogram.quantile(q) for q in EXPORTED_QUANTILES},
+    }
@@ -9,9 +9,20 @@ and handles execution lifecycle. Discovery, validation, and domain
 logic are separate concerns.
 """
 
+import asyncio
+import contextvars
+import inspect
 import logging
+import queue
+import threading
 import time
-from typing import Optional, Callable, Any
+import warnings
+from concurrent.futures import (
+    Future,
+    InvalidStateError,
+    TimeoutError as FutureTimeoutError,
+)
+from typing import TYPE_CHECKING, Optional, Callable, Any, AsyncIterator, Mapping
 from contextlib import contextmanager
 
 from .protocols import (
@@ -20,7 +31,21 @@ from .protocols import (
     ResultStatus,
     TaskPriority
 )
+from .admission import AdmissionController, AdmissionRejected, Permit
+from .batching import BatchPolicy, MicroBatcher
+from .cache import CacheBackend, ResultCache, default_cache_key
+from .coalescing import SingleFlight
+from .hedging import HedgePolicy, Hedger
+from .profiling import SkillProfiler
 from .registry import SkillRegistry
+from .resilience import LimiterSlot, ResilienceManager
+from .retries import RetryBudget, RetryPolicy, annotate_attempts
+from .tracing import Tracer, child_span, current_span, get_tracer
+
+if TYPE_CHECKING:
+    from .executors import BatchExecutor
+    from .metrics import MetricsRegistry
+    from .workflow import Workflow, WorkflowResult
 
 
 # ============================================================================
@@ -35,6 +60,22 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 ExecutionMiddleware = Callable[[AgentContext, Callable], AgentResult]
+SkillHandler = Callable[[AgentContext], AgentResult]
+
+# Stream middleware transforms the chunk stream of a streaming skill
+StreamMiddleware = Callable[
+    [AgentContext, AsyncIterator[AgentResult]],
+    AsyncIterator[AgentResult]
+]
+
+# Sentinel marking the end of a buffered stream
+_STREAM_END = object()
+
+# Event loop of the coroutine running an async middleware chain; read by
+# the chain's innermost handler in its worker thread (to_thread copies it)
+_CALLER_LOOP: contextvars.ContextVar[asyncio.AbstractEventLoop] = (
+    contextvars.ContextVar("caller_loop")
+)
 
 
 # ============================================================================
@@ -52,17 +93,42 @@ class AgentOrchestrator:
     - DIP: Depends on SkillRegistry abstraction
     
     Features:
-    - Execution timing and metrics
+    - Execution timing and per-skill metrics (metrics.py)
     - Middleware support for cross-cutting concerns
     - Error containment (failures don't cascade)
-    - Priority-aware execution (future: resource allocation)
+    - Concurrent asyncio batches for I/O-bound and async skills
+    - Streaming execution with bounded-buffer backpressure
+    - Single-flight coalescing of identical concurrent requests
+    - Admission control: rate limits and concurrency caps (admission.py)
+    - Per-skill circuit breakers and adaptive concurrency (resilience.py)
+    - Deadlines (AgentContext.deadline) and per-skill timeouts
+    - Non-blocking retries with jitter and a retry budget (retries.py)
+    - Hedged requests for idempotent skills (hedging.py)
+    - Micro-batching for BatchAgentSkill skills (batching.py)
+    - Sampled tracing spans per middleware layer (tracing.py)
+    - On-demand per-skill profiling (profiling.py)
+    - Dependency-aware DAG workflows (workflow.py)
+    - Priority-aware scheduling via PriorityScheduler (scheduler.py)
     """
     
     def __init__(
         self,
         registry: SkillRegistry,
         enable_timing: bool = True,
-        enable_logging: bool = True
+        enable_logging: bool = True,
+        coalesce_requests: bool = False,
+        coalesce_key_fn: Callable[[AgentContext], str] | None = None,
+        metrics: Optional["MetricsRegistry"] = None,
+        tracer: Tracer | None = None,
+        admission: AdmissionController | None = None,
+        resilience: ResilienceManager | None = None,
+        skill_timeouts: Mapping[str, float] | None = None,
+        default_timeout_s: float | None = None,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        hedging: HedgePolicy | None = None,
+        batching: BatchPolicy | None = None,
+        max_timeout_workers: int = 32
     ):
         """
         Initialize orchestrator with skill registry.
@@ -71,20 +137,141 @@ class AgentOrchestrator:
             registry: SkillRegistry instance for skill lookup
             enable_timing: Add execution duration to result metadata
             enable_logging: Log all skill executions
+            coalesce_requests: Share one execution among concurrent
+                               identical calls (same skill + key)
+            coalesce_key_fn: Context -> key for coalescing
+                             (default: same key as the result cache)
+            metrics: Registry receiving per-skill counts and latencies
+                     (see metrics.py); None disables collection
+            tracer: Tracer for execution spans (default: the global
+                    tracer from tracing.get_tracer(), off unless set)
+            admission: Per-skill/per-tenant rate and concurrency limits;
+                       refused tasks return ResultStatus.REJECTED
+            resilience: Per-skill circuit breakers and AIMD concurrency
+                        limits; open circuits fail fast with a cached
+                        or SKIPPED result
+            skill_timeouts: Maximum runtime in seconds by skill name
+            default_timeout_s: Maximum runtime for skills not in
+                               skill_timeouts (None: unbounded). The
+                               effective budget is the smaller of this
+                               and the context's remaining deadline.
+            retry_policy: Backoff for failed attempts, applied by
+                          execute_task_async and PriorityScheduler
+                          (execute_task itself never sleeps)
+            retry_budget: Orchestrator-wide cap on retries as a share
+                          of requests
+            hedging: Hedge straggling executions of skills that declare
+                     {"idempotent": True} metadata; requires metrics
+            batching: Collect concurrent requests for skills with an
+                      execute_many function into micro-batches (None:
+                      call execute per request)
+            max_timeout_workers: Daemon threads (created on demand and
+                                 reused) that run sync skills under a
+                                 timeout or deadline. Hung skills each
+                                 hold one; once all are busy, further
+                                 budgeted calls queue and time out if
+                                 no thread frees up within their budget.
+        
+        Raises:
+            ValueError: hedging without metrics (hedge delays are
+                        learned from its latency histograms)
         """
+        if hedging is not None and metrics is None:
+            raise ValueError("hedging requires a metrics registry")
+        
         self._registry = registry
         self._enable_timing = enable_timing
         self._enable_logging = enable_logging
+        self._single_flight = SingleFlight() if coalesce_requests else None
+        self._coalesce_key_fn = coalesce_key_fn or default_cache_key
+        self._metrics = metrics
+        self._tracer = tracer
+        self._profiler: SkillProfiler | None = None
+        self._admission = admission
+        self._resilience = resilience
+        self._skill_timeouts = dict(skill_timeouts or {})
+        self._default_timeout_s = default_timeout_s
+        self._retry_policy = retry_policy
+        self._retry_budget = retry_budget
+        self._hedger = Hedger(hedging, metrics) if hedging is not None else None
+        self._hedge_workers = (
+            _DaemonWorkers(hedging.max_sync_workers, thread_name_prefix="skill-hedge")
+            if hedging is not None else None
+        )
+        self._batching = batching
+        self._timeout_workers = _DaemonWorkers(
+            max_timeout_workers, thread_name_prefix="skill-budget"
+        )
+        self._batchers: dict[str, MicroBatcher] = {}
+        self._batchers_lock = threading.Lock()
         self._middleware: list[ExecutionMiddleware] = []
+        self._stream_middleware: list[StreamMiddleware] = []
+        
+        # Compiled execution plans:
+        # (skill_name, traced, is_async) -> (skill, handler)
+        self._plans: dict[
+            tuple[str, bool, bool], tuple[Callable, SkillHandler]
+        ] = {}
     
     # ========================================================================
     # Public API
     # ========================================================================
     
+    @property
+    def registry(self) -> SkillRegistry:
+        """The SkillRegistry this orchestrator dispatches to."""
+        return self._registry
+    
+    @property
+    def metrics(self) -> Optional["MetricsRegistry"]:
+        """Metrics registry fed by this orchestrator, if any."""
+        return self._metrics
+    
+    @property
+    def tracer(self) -> Tracer:
+        """Tracer used for execution spans."""
+        return self._tracer if self._tracer is not None else get_tracer()
+    
+    @property
+    def admission(self) -> AdmissionController | None:
+        """Admission controller (None if admission is unlimited)."""
+        return self._admission
+    
+    @property
+    def resilience(self) -> ResilienceManager | None:
+        """Circuit breakers and adaptive limits (None if disabled)."""
+        return self._resilience
+    
+    @property
+    def retry_policy(self) -> RetryPolicy | None:
+        """Retry policy for scheduled and async execution (None: no retries)."""
+        return self._retry_policy
+    
+    @property
+    def retry_budget(self) -> RetryBudget | None:
+        """Orchestrator-wide retry budget (None: unlimited)."""
+        return self._retry_budget
+    
+    @property
+    def hedger(self) -> Hedger | None:
+        """Hedging trigger and statistics (None if hedging is off)."""
+        return self._hedger
+    
+    @property
+    def batchers(self) -> dict[str, MicroBatcher]:
+        """Active micro-batchers by skill name (see MicroBatcher.stats)."""
+        return dict(self._batchers)
+    
+    @property
+    def single_flight(self) -> SingleFlight | None:
+        """Request coalescer (None unless coalesce_requests=True)."""
+        return self._single_flight
+    
     def execute_task(
         self,
         skill_name: str,
-        context: AgentContext
+        context: AgentContext,
+        attempt: int = 1
     ) -> AgentResult:
         """
         Execute a task by dispatching to the appropriate skill.
@@ -94,6 +281,8 @@ class AgentOrchestrator:
         Args:
             skill_name: Identifier of skill to execute
             context: Execution context with parameters
+            attempt: 1 for a new request; callers retrying it pass the
+                     attempt number, so retries don't earn retry budget
             
         Returns:
             AgentResult with execution outcome
@@ -103,53 +292,93 @@ class AgentOrchestrator:
             - Invalid result type → FAILURE result
             - Exception during execution → FAILURE result with details
             - Never propagates exceptions (error containment)
+            
+        Retries:
+            A single attempt; retry_policy is applied by callers that can
+            wait without blocking (PriorityScheduler, execute_task_async).
         """
-        if self._enable_logging:
-            logger.info(
-                f"⚙ Executing: {skill_name} "
-                f"[priority={context.priority.value}]"
-            )
+        if self._retry_budget is not None and attempt == 1:
+            self._retry_budget.deposit()
         
-        # Lookup skill
-        skill = self._registry.get_skill(skill_name)
+        span = self.tracer.start_span("execute_task", skill=skill_name)
         
-        if not skill:
-            return self._create_not_found_result(skill_name)
+        if not span.sampled:
+            return self._execute_task(skill_name, context)
         
-        # Execute with timing and error handling
-        with self._measure_execution() as timer:
-            result = self._execute_with_middleware(skill, context)
+        with span:
+            result = self._execute_task(skill_name, context, traced=True)
+            span.set_attribute("status", result.status.value)
+        return result
+    
+    async def execute_task_async(
+        self,
+        skill_name: str,
+        context: AgentContext
+    ) -> AgentResult:
+        """
+        Execute a task without blocking the event loop.
         
-        # Add execution metadata
-        if self._enable_timing:
-            result.metadata["execution_time_ms"] = timer.elapsed_ms
-            result.metadata["skill_name"] = skill_name
+        Async skills (``async def execute``) are awaited on the running
+        loop. Sync skills are dispatched to a worker thread so a slow
+        skill never stalls other coroutines.
         
-        # Log result
-        if self._enable_logging:
-            status_symbol = "✓" if result.success else "✗"
-            logger.info(
-                f"{status_symbol} {skill_name}: {result.message} "
-                f"({timer.elapsed_ms:.2f}ms)"
-            )
+        Args:
+            skill_name: Identifier of skill to execute
+            context: Execution context with parameters
+            
+        Returns:
+            AgentResult with execution outcome (same contract as
+            execute_task—exceptions are never propagated)
         
-        return result
+        With a retry_policy, failed attempts are retried after an
+        awaited backoff, within the context deadline and retry budget.
+        """
+        if self._retry_policy is None:
+            return await self._execute_task_async(skill_name, context)
+        
+        # Failed attempts wait on the event loop, never in a thread
+        attempt = 1
+        result = await self._execute_task_async(skill_name, context, attempt)
+        while True:
+            decision = self._retry_policy.decide(
+                result, attempt, context, self._retry_budget
+            )
+            if not decision.retry:
+                return annotate_attempts(result, attempt, decision)
+            
+            if self._enable_logging:
+                logger.warning(
+                    f"⚠ Attempt {attempt} failed for {skill_name}, "
+                    f"retrying in {decision.delay_s:.3f}s"
+                )
+            await asyncio.sleep(decision.delay_s)
+            attempt += 1
+            result = await self._execute_task_async(skill_name, context, attempt)
     
     def execute_batch(
         self,
-        tasks: list[tuple[str, AgentContext]]
+        tasks: list[tuple[str, AgentContext]],
+        executor: Optional["BatchExecutor"] = None
     ) -> list[AgentResult]:
         """
-        Execute multiple tasks in sequence.
+        Execute multiple tasks in sequence, or on a pluggable executor.
         
-        Future: Support parallel execution with asyncio.
+        See execute_batch_async for concurrent asyncio execution.
         
         Args:
             tasks: List of (skill_name, context) tuples
+            executor: Optional BatchExecutor backend (see executors.py),
+                      e.g. ThreadPoolBatchExecutor or
+                      ProcessPoolBatchExecutor. None runs sequentially.
             
         Returns:
-            List of AgentResult in same order as input
+            List of AgentResult in same order as input. Sequential runs
+            stop at a critical failure; executors report cancelled tasks
+            as SKIPPED instead.
         """
+        if executor is not None:
+            return executor.run_batch(self, tasks)
+        
         results = []
         
         for skill_name, context in tasks:
@@ -167,6 +396,192 @@ class AgentOrchestrator:
         
         return results
     
+    def execute_workflow(
+        self,
+        workflow: "Workflow",
+        max_workers: int = 8
+    ) -> "WorkflowResult":
+        """
+        Execute a DAG of tasks with dependency-aware parallelism.
+        
+        Independent branches run concurrently; each task starts once its
+        dependencies have succeeded and receives their data by reference
+        in ``parameters["upstream"]``. A failure prunes only its
+        descendants. See workflow.py.
+        
+        Args:
+            workflow: Workflow definition
+            max_workers: Maximum tasks running at once
+            
+        Returns:
+            WorkflowResult with one AgentResult per node
+        """
+        return workflow.run(self, max_workers=max_workers)
+    
+    async def execute_batch_async(
+        self,
+        tasks: list[tuple[str, AgentContext]],
+        max_concurrency: int = 10
+    ) -> list[AgentResult]:
+        """
+        Execute multiple tasks concurrently on the running event loop.
+        
+        Async skills are awaited concurrently; sync skills run in worker
+        threads. At most ``max_concurrency`` tasks are in flight at once.
+        
+        Critical failures short-circuit the batch: outstanding tasks are
+        cancelled and reported as SKIPPED, so the returned list always
+        has one result per input task.
+        
+        Args:
+            tasks: List of (skill_name, context) tuples
+            max_concurrency: Maximum number of tasks executing at once
+            
+        Returns:
+            List of AgentResult in same order as input
+            
+        Example:
+            results = asyncio.run(
+                orchestrator.execute_batch_async(tasks, max_concurrency=32)
+            )
+        """
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be >= 1, got {max_concurrency}"
+            )
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        results: list[AgentResult | None] = [None] * len(tasks)
+        
+        async def run(skill_name: str, context: AgentContext) -> AgentResult:
+            async with semaphore:
+                return await self.execute_task_async(skill_name, context)
+        
+        pending = {
+            asyncio.create_task(run(skill_name, context)): index
+            for index, (skill_name, context) in enumerate(tasks)
+        }
+        
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                
+                aborted_by = None
+                for task in done:
+                    index = pending.pop(task)
+                    skill_name, context = tasks[index]
+                    
+                    try:
+                        result = task.result()
+                    except asyncio.CancelledError:
+                        # Coalesced onto a leader that was cancelled
+                        result = self._create_cancelled_result(skill_name)
+                    except Exception as e:
+                        result = self._create_exception_result(e)
+                    results[index] = result
+                    
+                    # Short-circuit on critical failures
+                    if (not result.success and
+                            context.priority == TaskPriority.CRITICAL):
+                        aborted_by = skill_name
+                
+                if aborted_by is not None:
+                    logger.error(
+                        f"⚠ Critical task failed: {aborted_by}, "
+                        f"cancelling {len(pending)} outstanding tasks"
+                    )
+                    break
+        finally:
+            # Cancel anything still running (critical abort or the
+            # caller cancelled us)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        return [
+            result if result is not None
+            else self._create_cancelled_result(tasks[index][0])
+            for index, result in enumerate(results)
+        ]
+    
+    async def execute_stream(
+        self,
+        skill_name: str,
+        context: AgentContext,
+        buffer_size: int = 16
+    ) -> AsyncIterator[AgentResult]:
+        """
+        Execute a streaming skill and yield partial results as they arrive.
+        
+        The skill runs as a producer task feeding a bounded buffer; when
+        the consumer falls ``buffer_size`` chunks behind, the producer is
+        suspended (backpressure) instead of accumulating chunks in memory.
+        Chunks pass through stream middleware before being yielded.
+        
+        Skills without an ``execute_stream`` function are executed
+        normally and yield a single result.
+        
+        Args:
+            skill_name: Identifier of skill to execute
+            context: Execution context with parameters
+            buffer_size: Maximum chunks buffered ahead of the consumer
+            
+        Yields:
+            AgentResult chunks. With timing enabled, each chunk carries
+            ``chunk_index`` and the first also ``time_to_first_chunk_ms``.
+            A skill exception is reported as a final FAILURE chunk.
+            
+        Example:
+            async for chunk in orchestrator.execute_stream("summarize", ctx):
+                print(chunk.data)
+        """
+        if buffer_size < 1:
+            raise ValueError(f"buffer_size must be >= 1, got {buffer_size}")
+        
+        skill = self._registry.get_stream_skill(skill_name)
+        
+        if skill is None:
+            # Not a streaming skill: a single (possibly not-found) result
+            yield await self.execute_task_async(skill_name, context)
+            return
+        
+        if self._enable_logging:
+            logger.info(
+                f"⚙ Streaming: {skill_name} "
+                f"[priority={context.priority.value}]"
+            )
+        
+        stream = self._buffered_stream(skill, context, buffer_size)
+        for middleware in reversed(self._stream_middleware):
+            stream = middleware(context, stream)
+        
+        timer = _Timer()
+        chunk_count = 0
+        
+        try:
+            async for chunk in stream:
+                if self._enable_timing:
+                    if chunk_count == 0:
+                        timer.stop()
+                        chunk.metadata["time_to_first_chunk_ms"] = timer.elapsed_ms
+                    chunk.metadata["chunk_index"] = chunk_count
+                    chunk.metadata["skill_name"] = skill_name
+                chunk_count += 1
+                yield chunk
+        finally:
+            await _aclose(stream)
+        
+        if self._enable_logging:
+            timer.stop()
+            logger.info(
+                f"✓ {skill_name}: streamed {chunk_count} chunks "
+                f"({timer.elapsed_ms:.2f}ms)"
+            )
+    
     def add_middleware(self, middleware: ExecutionMiddleware) -> None:
         """
         Register execution middleware for cross-cutting concerns.
@@ -188,6 +603,76 @@ class AgentOrchestrator:
             orchestrator.add_middleware(timing_middleware)
         """
         self._middleware.append(middleware)
+        
+        # Compiled plans embed the old chain; rebuild lazily
+        self._plans = {}
+    
+    def enable_profiling(
+        self,
+        profiler: SkillProfiler | None = None,
+        **profiler_options: Any
+    ) -> SkillProfiler:
+        """
+        Profile skill executions without touching skill modules.
+        
+        Only the skill call itself is profiled, not middleware. Async
+        skills awaited on the event loop and micro-batched skills are
+        not profiled.
+        
+        Args:
+            profiler: Existing SkillProfiler to attach
+            **profiler_options: SkillProfiler arguments when profiler is
+                                not given (skills, sample_rate, mode, ...)
+        
+        Returns:
+            The attached profiler (call .dump() to write results)
+        
+        Example:
+            profiler = orchestrator.enable_profiling(
+                skills={"data_processor"}, sample_rate=0.1
+            )
+            ...
+            profiler.dump("profiles/")
+        """
+        self._profiler = profiler or SkillProfiler(**profiler_options)
+        self._plans = {}
+        
+        logger.info(
+            f"🔥 Profiling enabled ({self._profiler.mode}, "
+            f"skills={sorted(self._profiler.skills or []) or 'all'}, "
+            f"sample_rate={self._profiler.sample_rate})"
+        )
+        return self._profiler
+    
+    def disable_profiling(self) -> SkillProfiler | None:
+        """
+        Detach the profiler.
+        
+        Returns:
+            The detached profiler (its collected data is kept), if any
+        """
+        profiler, self._profiler = self._profiler, None
+        self._plans = {}
+        return profiler
+    
+    def add_stream_middleware(self, middleware: StreamMiddleware) -> None:
+        """
+        Register middleware for streaming execution.
+        
+        Stream middleware receives the context and the upstream chunk
+        iterator and returns a new async iterator, so it can observe,
+        transform, drop, or inject chunks without buffering the stream.
+        First registered is outermost, as with add_middleware.
+        
+        Example:
+            async def redact_middleware(context, chunks):
+                async for chunk in chunks:
+                    chunk.data = redact(chunk.data)
+                    yield chunk
+            
+            orchestrator.add_stream_middleware(redact_middleware)
+        """
+        self._stream_middleware.append(middleware)
     
     def list_available_skills(self) -> list[str]:
         """
@@ -201,119 +686,913 @@ class AgentOrchestrator:
     # Execution Implementation (Private)
     # ========================================================================
     
-    def _execute_with_middleware(
+    async def _execute_task_async(
         self,
-        skill: Callable,
-        context: AgentContext
+        skill_name: str,
+        context: AgentContext,
+        attempt: int = 1
     ) -> AgentResult:
         """
-        Execute skill with middleware chain and error handling.
-        
-        Middleware executes in FIFO order (first registered, first executed).
+        Body of execute_task_async for a single attempt.
         """
-        # Build execution chain with middleware
-        def execute_skill(ctx: AgentContext) -> AgentResult:
-            return self._safe_execute_skill(skill, ctx)
+        skill = self._registry.get_skill(skill_name)
         
-        # Wrap with middleware in reverse order (innermost first)
-        handler = execute_skill
-        for middleware in reversed(self._middleware):
-            current_handler = handler
-            handler = lambda ctx, h=current_handler, m=middleware: m(ctx, h)
+        # Batched requests wait on the event loop, not in a thread
+        batcher = self._get_batcher(skill_name)
+        if batcher is not None:
+            skill = batcher.submit_async
+        
+        if skill is None or not inspect.iscoroutinefunction(skill):
+            # Sync skills (and lookup failures) take the regular path
+            # in a worker thread
+            return await asyncio.to_thread(
+                self.execute_task, skill_name, context, attempt
+            )
+        
+        if self._retry_budget is not None and attempt == 1:
+            self._retry_budget.deposit()
+        
+        if self._enable_logging:
+            logger.info(
+                f"⚙ Executing (async): {skill_name} "
+                f"[priority={context.priority.value}]"
+            )
+        
+        span = self.tracer.start_span("execute_task", skill=skill_name)
         
-        # Execute chain
-        return handler(context)
+        async def execute() -> AgentResult:
+            return await self._execute_async_with_middleware(
+                skill_name, skill, context
+            )
+        
+        if self._is_hedgeable(skill_name):
+            unhedged = execute
+            
+            async def execute() -> AgentResult:
+                return await self._hedged_async(skill_name, unhedged)
+        
+        async def admitted() -> AgentResult:
+            if self._admission is None:
+                return await execute()
+            
+            try:
+                permit = await self._acquire_permit_async(skill_name, context)
+            except AdmissionRejected as rejection:
+                return self._create_rejected_result(skill_name, rejection)
+            
+            try:
+                return await execute()
+            finally:
+                permit.release()
+        
+        async def run() -> AgentResult:
+            if self._resilience is None:
+                return await admitted()
+            return await self._guarded_async(skill_name, context, admitted)
+        
+        with span, self._measure_execution() as timer:
+            if self._single_flight is not None:
+                key = f"{skill_name}:{self._coalesce_key_fn(context)}"
+                try:
+                    result = await self._single_flight.do_async(
+                        key, run, timeout=context.remaining()
+                    )
+                except TimeoutError:
+                    result = self._create_timeout_result(skill_name, 0.0)
+            else:
+                result = await run()
+            span.set_attribute("status", result.status.value)
+        
+        return self._finalize_result(skill_name, result, timer.elapsed_ms)
     
-    def _safe_execute_skill(
+    def _execute_task(
         self,
-        skill: Callable,
-        context: AgentContext
+        skill_name: str,
+        context: AgentContext,
+        traced: bool = False
     ) -> AgentResult:
         """
-        Execute skill with comprehensive error handling.
-        
-        Ensures no exceptions propagate to caller (error containment).
+        Body of execute_task; traced selects the span-instrumented plan.
         """
-        try:
-            # Execute skill
-            result = skill(context)
-            
-            # Validate result type
-            if not isinstance(result, AgentResult):
-                return AgentResult(
-                    status=ResultStatus.FAILURE,
-                    data=None,
-                    message=(
-                        f"Skill returned invalid type: {type(result).__name__}"
-                    ),
-                    error_details={
-                        "expected_type": "AgentResult",
-                        "actual_type": type(result).__name__
-                    }
-                )
-            
-            return result
-            
-        except Exception as e:
-            # Catch all exceptions and convert to failure result
-            logger.exception(f"✗ Skill execution failed with exception")
-            
-            return AgentResult(
-                status=ResultStatus.FAILURE,
-                data=None,
-                message=f"Execution error: {str(e)}",
-                error_details={
-                    "exception_type": type(e).__name__,
-                    "exception_message": str(e),
-                    "traceback": self._get_exception_traceback(e)
-                }
+        if self._enable_logging:
+            logger.info(
+                f"⚙ Executing: {skill_name} "
+                f"[priority={context.priority.value}]"
+            )
+        
+        # Lookup skill
+        skill = self._registry.get_skill(skill_name)
+        
+        if not skill:
+            return self._create_not_found_result(skill_name)
+        
+        # Budget already spent (e.g. while queued): don't start at all
+        if context.deadline is not None and context.expired:
+            return self._finalize_result(
+                skill_name, self._create_timeout_result(skill_name, 0.0), 0.0
             )
+        
+        handler = self._get_execution_plan(skill_name, skill, traced)
+        
+        # Hedges share the caller's admission permit and breaker slot
+        if self._is_hedgeable(skill_name):
+            handler = self._hedged(skill_name, handler)
+        
+        # Coalesced followers wait on the leader without taking a permit
+        if self._admission is not None:
+            handler = self._admitted(skill_name, handler)
+        
+        # Open circuits fail fast, before waiting for admission
+        if self._resilience is not None:
+            handler = self._guarded(skill_name, handler)
+        
+        if self._single_flight is not None:
+            handler = self._coalesced(skill_name, handler)
+        
+        # Fast path: nothing to measure or report
+        if not (self._enable_timing or self._enable_logging
+                or self._metrics is not None):
+            return handler(context)
+        
+        # Execute with timing and error handling
+        with self._measure_execution() as timer:
+            result = handler(context)
+        
+        return self._finalize_result(skill_name, result, timer.elapsed_ms)
     
-    def _create_not_found_result(self, skill_name: str) -> AgentResult:
+    def _get_execution_plan(
+        self,
+        skill_name: str,
+        skill: Callable,
+        traced: bool = False
+    ) -> SkillHandler:
         """
-        Create standardized result for missing skills.
+        Return the compiled middleware pipeline for a skill.
         
-        Includes helpful diagnostic information.
+        Plans are built on first use and reused until add_middleware or
+        enable_profiling/disable_profiling is called. The skill function
+        is part of the cache entry, so a registry reload that replaces it
+        triggers a rebuild. Traced and
+        untraced plans are compiled separately, so unsampled requests
+        pay nothing for span instrumentation.
         """
-        available = self._registry.list_skills()
+        plan = self._plans.get((skill_name, traced, False))
+        if plan is not None and plan[0] is skill:
+            return plan[1]
         
-        return AgentResult(
-            status=ResultStatus.FAILURE,
-            data=None,
-            message=f"Skill not found: {skill_name}",
-            metadata={
-                "requested_skill": skill_name,
-                "available_skills": available,
-                "suggestions": self._suggest_similar_skills(
-                    skill_name, 
-                    available
+        profiler = self._profiler
+        timeout_s = self._skill_timeouts.get(skill_name, self._default_timeout_s)
+        batcher = self._get_batcher(skill_name)
+        
+        if batcher is not None:
+            # Batches are shared, so they are neither profiled nor run on
+            # a per-request thread; each caller just stops waiting
+            def execute_skill(ctx: AgentContext) -> AgentResult:
+                return self._call_batched(skill_name, batcher, ctx, timeout_s)
+            
+            handler = self._compile_middleware_chain(
+                execute_skill, skill_name if traced else None
+            )
+            self._plans[(skill_name, traced, False)] = (skill, handler)
+            return handler
+        
+        if profiler is None:
+            def call_skill(ctx: AgentContext) -> AgentResult:
+                return self._safe_execute_skill(skill, ctx)
+        else:
+            def call_skill(ctx: AgentContext) -> AgentResult:
+                return profiler.run(
+                    skill_name, lambda: self._safe_execute_skill(skill, ctx)
                 )
-            }
+        
+        def execute_skill(ctx: AgentContext) -> AgentResult:
+            if timeout_s is None and ctx.deadline is None:
+                return call_skill(ctx)
+            return self._call_with_budget(skill_name, call_skill, ctx, timeout_s)
+        
+        handler = self._compile_middleware_chain(
+            execute_skill, skill_name if traced else None
         )
+        self._plans[(skill_name, traced, False)] = (skill, handler)
+        return handler
     
-    @staticmethod
-    def _suggest_similar_skills(
+    def _get_async_execution_plan(
+        self,
         skill_name: str,
-        available: list[str],
-        max_suggestions: int = 3
-    ) -> list[str]:
+        skill: Callable,
+        traced: bool = False
+    ) -> SkillHandler:
         """
-        Suggest similar skill names using simple string similarity.
+        Return the compiled middleware pipeline for an async skill.
         
-        Future: Use Levenshtein distance or other fuzzy matching.
+        Cached and invalidated together with the sync plans, and rebuilt
+        when the skill (or, for batched skills, the batcher) changes.
+        The chain runs in a worker thread; its innermost handler
+        schedules the skill coroutine on the caller's loop (_CALLER_LOOP)
+        and blocks until it finishes.
         """
-        suggestions = []
+        # == rather than is: a batcher's submit_async is a new bound
+        # method on every access, equal for the same batcher
+        plan = self._plans.get((skill_name, traced, True))
+        if plan is not None and plan[0] == skill:
+            return plan[1]
         
-        for candidate in available:
-            # Simple substring matching
-            if skill_name.lower() in candidate.lower():
-                suggestions.append(candidate)
-            elif candidate.lower() in skill_name.lower():
-                suggestions.append(candidate)
+        def execute_skill(ctx: AgentContext) -> AgentResult:
+            future = asyncio.run_coroutine_threadsafe(
+                self._await_with_budget(skill_name, skill, ctx),
+                _CALLER_LOOP.get()
+            )
+            return future.result()
         
-        return suggestions[:max_suggestions]
+        handler = self._compile_middleware_chain(
+            execute_skill, skill_name if traced else None
+        )
+        self._plans[(skill_name, traced, True)] = (skill, handler)
+        return handler
     
-    @staticmethod
+    def _admitted(self, skill_name: str, handler: SkillHandler) -> SkillHandler:
+        """
+        Hold an admission permit for the duration of a handler.
+        """
+        admission = self._admission
+        
+        def admitted_handler(context: AgentContext) -> AgentResult:
+            try:
+                permit = admission.acquire(
+                    skill_name, context, self._admission_timeout(context)
+                )
+            except AdmissionRejected as rejection:
+                return self._create_rejected_result(skill_name, rejection)
+            
+            try:
+                return handler(context)
+            finally:
+                permit.release()
+        
+        return admitted_handler
+    
+    def _admission_timeout(self, context: AgentContext) -> float | None:
+        """Queue timeout capped so no task waits past its deadline."""
+        remaining = context.remaining()
+        if remaining is None:
+            return None
+        return min(remaining, self._admission.queue_timeout_s)
+    
+    def _call_with_budget(
+        self,
+        skill_name: str,
+        call_skill: SkillHandler,
+        context: AgentContext,
+        timeout_s: float | None
+    ) -> AgentResult:
+        """
+        Run a sync skill call with a bounded wait for its result.
+        
+        Python threads cannot be killed, so the call runs on one of the
+        orchestrator's daemon timeout workers (at most
+        max_timeout_workers) and the caller stops waiting at the budget;
+        a hung skill keeps its worker until it finishes (or notices
+        context.expired). A call still queued for a worker when the
+        budget runs out is dropped without running.
+        """
+        budget = _effective_budget(timeout_s, context.remaining())
+        if budget <= 0:
+            return self._create_timeout_result(skill_name, 0.0)
+        
+        run_context = contextvars.copy_context()
+        future = self._timeout_workers.submit(
+            run_context.run, call_skill, context
+        )
+        
+        try:
+            return future.result(timeout=budget)
+        except FutureTimeoutError:
+            future.cancel()
+            return self._create_timeout_result(skill_name, budget)
+    
+    def _get_batcher(self, skill_name: str) -> MicroBatcher | None:
+        """
+        The skill's micro-batcher, created on first use.
+        
+        Returns:
+            None unless batching is enabled and the skill has execute_many
+        """
+        if self._batching is None:
+            return None
+        
+        execute_many = self._registry.get_batch_skill(skill_name)
+        if execute_many is None:
+            return None
+        
+        batcher = self._batchers.get(skill_name)
+        if batcher is not None and batcher.execute_many is execute_many:
+            return batcher
+        
+        with self._batchers_lock:
+            batcher = self._batchers.get(skill_name)
+            if batcher is None or batcher.execute_many is not execute_many:
+                # New skill, or a registry reload replaced execute_many
+                if batcher is not None:
+                    batcher.close()
+                batcher = MicroBatcher(
+                    skill_name,
+                    execute_many,
+                    self._batching.for_skill(
+                        self._registry.get_skill_metadata(skill_name)
+                    ),
+                    metrics=self._metrics
+                )
+                self._batchers[skill_name] = batcher
+        return batcher
+    
+    def _call_batched(
+        self,
+        skill_name: str,
+        batcher: MicroBatcher,
+        context: AgentContext,
+        timeout_s: float | None
+    ) -> AgentResult:
+        """
+        Submit one request to its micro-batch and wait for its result.
+        
+        A caller that runs out of budget cancels its request, which drops
+        it from the batch if the batch has not been dispatched yet.
+        """
+        budget = None
+        if timeout_s is not None or context.deadline is not None:
+            budget = _effective_budget(timeout_s, context.remaining())
+            if budget <= 0:
+                return self._create_timeout_result(skill_name, 0.0)
+        
+        future = batcher.submit(context)
+        try:
+            return self._validate_result_type(future.result(timeout=budget))
+        except Exception as e:
+            if isinstance(e, FutureTimeoutError) and not future.done():
+                future.cancel()
+                return self._create_timeout_result(skill_name, budget)
+            return self._create_exception_result(e)
+    
+    async def _await_with_budget(
+        self,
+        skill_name: str,
+        skill: Callable,
+        context: AgentContext
+    ) -> AgentResult:
+        """
+        Await an async skill, cancelling it when its budget runs out.
+        """
+        timeout_s = self._skill_timeouts.get(skill_name, self._default_timeout_s)
+        if timeout_s is None and context.deadline is None:
+            return await self._safe_execute_skill_async(skill, context)
+        
+        budget = _effective_budget(timeout_s, context.remaining())
+        if budget <= 0:
+            return self._create_timeout_result(skill_name, 0.0)
+        
+        try:
+            return await asyncio.wait_for(
+                self._safe_execute_skill_async(skill, context), budget
+            )
+        except asyncio.TimeoutError:
+            return self._create_timeout_result(skill_name, budget)
+    
+    def _guarded(self, skill_name: str, handler: SkillHandler) -> SkillHandler:
+        """
+        Apply the skill's circuit breaker and adaptive concurrency limit.
+        
+        Outcomes are learned from the contained results produced by
+        _safe_execute_skill, so a failing skill trips its breaker without
+        any exception reaching this layer.
+        """
+        resilience = self._resilience
+        
+        def guarded_handler(context: AgentContext) -> AgentResult:
+            ticket = None
+            breaker = resilience.breaker(skill_name)
+            if breaker is not None:
+                ticket = breaker.allow()
+                if ticket is None:
+                    return resilience.fallback(skill_name, context)
+            
+            slot = None
+            limiter = resilience.limiter(skill_name)
+            if limiter is not None:
+                try:
+                    slot = limiter.acquire()
+                except AdmissionRejected as rejection:
+                    resilience.abandon(skill_name, ticket=ticket)
+                    return self._create_rejected_result(skill_name, rejection)
+            
+            start = time.perf_counter()
+            try:
+                result = handler(context)
+            except BaseException:
+                resilience.abandon(skill_name, slot, ticket)
+                raise
+            
+            resilience.record(
+                skill_name, context, result,
+                (time.perf_counter() - start) * 1000, slot, ticket
+            )
+            return result
+        
+        return guarded_handler
+    
+    async def _guarded_async(
+        self,
+        skill_name: str,
+        context: AgentContext,
+        call: Callable[[], Any]
+    ) -> AgentResult:
+        """
+        Async counterpart of _guarded for an awaitable-returning call.
+        """
+        resilience = self._resilience
+        ticket = None
+        breaker = resilience.breaker(skill_name)
+        if breaker is not None:
+            ticket = breaker.allow()
+            if ticket is None:
+                return resilience.fallback(skill_name, context)
+        
+        try:
+            slot = await self._acquire_slot_async(skill_name)
+        except AdmissionRejected as rejection:
+            resilience.abandon(skill_name, ticket=ticket)
+            return self._create_rejected_result(skill_name, rejection)
+        except BaseException:
+            resilience.abandon(skill_name, ticket=ticket)
+            raise
+        
+        start = time.perf_counter()
+        try:
+            result = await call()
+        except BaseException:
+            resilience.abandon(skill_name, slot, ticket)
+            raise
+        
+        resilience.record(
+            skill_name, context, result,
+            (time.perf_counter() - start) * 1000, slot, ticket
+        )
+        return result
+    
+    async def _acquire_slot_async(self, skill_name: str) -> LimiterSlot | None:
+        """
+        Adaptive-limit counterpart of _acquire_permit_async.
+        """
+        limiter = self._resilience.limiter(skill_name)
+        if limiter is None:
+            return None
+        
+        slot = limiter.try_acquire()
+        if slot is not None:
+            return slot
+        
+        waiter = asyncio.ensure_future(asyncio.to_thread(limiter.acquire))
+        try:
+            return await asyncio.shield(waiter)
+        except asyncio.CancelledError:
+            waiter.add_done_callback(_release_abandoned_permit)
+            raise
+    
+    async def _acquire_permit_async(
+        self,
+        skill_name: str,
+        context: AgentContext
+    ) -> Permit:
+        """
+        Admission for async skills without blocking the event loop.
+        
+        Waiting happens in a worker thread. If the caller is cancelled
+        while waiting, a permit granted afterwards is released.
+        """
+        permit = self._admission.try_acquire(skill_name, context)
+        if permit is not None:
+            return permit
+        
+        waiter = asyncio.ensure_future(asyncio.to_thread(
+            self._admission.acquire, skill_name, context,
+            self._admission_timeout(context)
+        ))
+        try:
+            return await asyncio.shield(waiter)
+        except asyncio.CancelledError:
+            waiter.add_done_callback(_release_abandoned_permit)
+            raise
+    
+    def _is_hedgeable(self, skill_name: str) -> bool:
+        return (
+            self._hedger is not None
+            and self._registry.get_skill_metadata(skill_name).get("idempotent")
+            is True
+        )
+    
+    def _hedged(self, skill_name: str, handler: SkillHandler) -> SkillHandler:
+        """
+        Race a second execution against one that outlives its hedge delay.
+        
+        Attempts run on the orchestrator's hedging workers (at most
+        HedgePolicy.max_sync_workers daemon threads) so the caller can
+        return with the first result; a losing attempt cannot be
+        interrupted and its result is discarded, and a hedge still
+        queued when the original finishes is dropped. When every worker
+        is busy the request runs inline, unhedged.
+        """
+        hedger = self._hedger
+        workers = self._hedge_workers
+        
+        def hedged_handler(context: AgentContext) -> AgentResult:
+            delay = hedger.delay_for(skill_name)
+            if delay is None:
+                return handler(context)
+            
+            outcome: Future = Future()
+            
+            def attempt(hedge: bool) -> None:
+                try:
+                    result = handler(context)
+                except Exception as e:
+                    result = self._create_exception_result(e)
+                try:
+                    outcome.set_result((hedge, result))
+                except InvalidStateError:
+                    pass  # The other attempt finished first
+            
+            original = workers.try_submit(
+                contextvars.copy_context().run, attempt, False
+            )
+            if original is None:
+                return handler(context)
+            
+            try:
+                return outcome.result(timeout=delay)[1]
+            except FutureTimeoutError:
+                pass
+            
+            if not hedger.try_hedge(skill_name):
+                return outcome.result()[1]
+            
+            hedge = workers.submit(contextvars.copy_context().run, attempt, True)
+            hedge.add_done_callback(lambda _: hedger.hedge_finished())
+            hedge_won, result = outcome.result()
+            hedge.cancel()
+            return _mark_hedged(hedger, skill_name, result, hedge_won)
+        
+        return hedged_handler
+    
+    async def _hedged_async(
+        self,
+        skill_name: str,
+        execute: Callable[[], Any]
+    ) -> AgentResult:
+        """
+        Async counterpart of _hedged; the losing attempt is cancelled.
+        """
+        hedger = self._hedger
+        delay = hedger.delay_for(skill_name)
+        if delay is None:
+            return await execute()
+        
+        attempts = [asyncio.ensure_future(execute())]
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if not done and hedger.try_hedge(skill_name):
+                attempts.append(asyncio.ensure_future(execute()))
+                attempts[1].add_done_callback(lambda _: hedger.hedge_finished())
+                done, _ = await asyncio.wait(
+                    attempts, return_when=asyncio.FIRST_COMPLETED
+                )
+            # Prefer the original when both finished together
+            winner = attempts[0] if attempts[0] in done or not done else attempts[1]
+            result = await winner
+        finally:
+            for attempt in attempts:
+                if not attempt.done():
+                    attempt.cancel()
+        
+        if len(attempts) == 1:
+            return result
+        return _mark_hedged(hedger, skill_name, result, winner is attempts[1])
+    
+    def _coalesced(self, skill_name: str, handler: SkillHandler) -> SkillHandler:
+        """
+        Route a handler through the single-flight table.
+        """
+        def coalesced_handler(context: AgentContext) -> AgentResult:
+            key = f"{skill_name}:{self._coalesce_key_fn(context)}"
+            # Followers wait no longer than their own deadline
+            try:
+                return self._single_flight.do(
+                    key, lambda: handler(context), timeout=context.remaining()
+                )
+            except TimeoutError:
+                return self._create_timeout_result(skill_name, 0.0)
+        
+        return coalesced_handler
+    
+    async def _execute_async_with_middleware(
+        self,
+        skill_name: str,
+        skill: Callable,
+        context: AgentContext
+    ) -> AgentResult:
+        """
+        Execute an async skill with middleware chain and error handling.
+        
+        Middleware is synchronous, so when any is registered the
+        (cached) chain runs in a worker thread, which blocks while the
+        skill coroutine runs on this event loop: sync middleware needs a
+        thread to block in. Without middleware the skill is awaited
+        directly, with no thread at all.
+        """
+        traced = current_span() is not None
+        
+        if not self._middleware:
+            with child_span(f"skill:{skill_name}"):
+                return await self._await_with_budget(skill_name, skill, context)
+        
+        handler = self._get_async_execution_plan(skill_name, skill, traced)
+        token = _CALLER_LOOP.set(asyncio.get_running_loop())
+        try:
+            return await asyncio.to_thread(handler, context)
+        finally:
+            _CALLER_LOOP.reset(token)
+    
+    def _compile_middleware_chain(
+        self,
+        execute_skill: SkillHandler,
+        traced_skill_name: str | None = None
+    ) -> SkillHandler:
+        """
+        Wrap the innermost handler with registered middleware.
+        
+        Middleware executes in FIFO order (first registered, first executed).
+        With no middleware the innermost handler is returned unchanged.
+        
+        When traced_skill_name is given, the skill and every middleware
+        layer are additionally wrapped in child spans.
+        """
+        traced = traced_skill_name is not None
+        
+        # Wrap with middleware in reverse order (innermost first)
+        handler = execute_skill
+        if traced:
+            handler = _bind_span(f"skill:{traced_skill_name}", handler)
+        for middleware in reversed(self._middleware):
+            handler = _bind_middleware(middleware, handler)
+            if traced:
+                handler = _bind_span(
+                    f"middleware:{_middleware_name(middleware)}", handler
+                )
+        
+        return handler
+    
+    async def _buffered_stream(
+        self,
+        skill: Callable,
+        context: AgentContext,
+        buffer_size: int
+    ) -> AsyncIterator[AgentResult]:
+        """
+        Run a streaming skill as a producer behind a bounded queue.
+        
+        The producer is cancelled if the consumer stops iterating early.
+        """
+        buffer: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+        
+        async def produce() -> None:
+            try:
+                async for chunk in skill(context):
+                    if not isinstance(chunk, AgentResult):
+                        await buffer.put(self._validate_result_type(chunk))
+                        break
+                    await buffer.put(chunk)
+            except Exception as e:
+                logger.exception(f"✗ Streaming skill failed with exception")
+                await buffer.put(self._create_exception_result(e))
+            
+            # Not reached on cancellation: nobody is left to consume it
+            await buffer.put(_STREAM_END)
+        
+        producer = asyncio.create_task(produce())
+        
+        try:
+            while True:
+                chunk = await buffer.get()
+                if chunk is _STREAM_END:
+                    break
+                yield chunk
+        finally:
+            if not producer.done():
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
+    
+    def _safe_execute_skill(
+        self,
+        skill: Callable,
+        context: AgentContext
+    ) -> AgentResult:
+        """
+        Execute skill with comprehensive error handling.
+        
+        Ensures no exceptions propagate to caller (error containment).
+        Skills that return an awaitable (e.g. async skills hidden behind a
+        sync decorator) are run to completion on a private event loop.
+        """
+        try:
+            # Execute skill
+            result = skill(context)
+            
+            if inspect.isawaitable(result):
+                result = asyncio.run(self._await_result(result))
+            
+            return self._validate_result_type(result)
+            
+        except Exception as e:
+            # Catch all exceptions and convert to failure result
+            logger.exception(f"✗ Skill execution failed with exception")
+            return self._create_exception_result(e)
+    
+    async def _safe_execute_skill_async(
+        self,
+        skill: Callable,
+        context: AgentContext
+    ) -> AgentResult:
+        """
+        Await an async skill with comprehensive error handling.
+        
+        Async counterpart of _safe_execute_skill. Cancellation is not
+        swallowed so batch short-circuits can stop in-flight skills.
+        """
+        try:
+            result = await skill(context)
+            return self._validate_result_type(result)
+            
+        except Exception as e:
+            logger.exception(f"✗ Skill execution failed with exception")
+            return self._create_exception_result(e)
+    
+    @staticmethod
+    async def _await_result(awaitable: Any) -> Any:
+        """Adapt any awaitable into a coroutine for asyncio.run()."""
+        return await awaitable
+    
+    def _finalize_result(
+        self,
+        skill_name: str,
+        result: AgentResult,
+        elapsed_ms: float
+    ) -> AgentResult:
+        """
+        Attach execution metadata and log the outcome.
+        """
+        # Add execution metadata
+        if self._enable_timing:
+            result.metadata["execution_time_ms"] = elapsed_ms
+            result.metadata["skill_name"] = skill_name
+        
+        if self._metrics is not None:
+            self._metrics.observe_execution(
+                skill_name, result.status.value, elapsed_ms
+            )
+        
+        # Log result
+        if self._enable_logging:
+            status_symbol = "✓" if result.success else "✗"
+            logger.info(
+                f"{status_symbol} {skill_name}: {result.message} "
+                f"({elapsed_ms:.2f}ms)"
+            )
+        
+        return result
+    
+    @staticmethod
+    def _validate_result_type(result: Any) -> AgentResult:
+        """
+        Ensure a skill returned an AgentResult.
+        
+        Returns the result unchanged, or a FAILURE result describing
+        the type mismatch.
+        """
+        if not isinstance(result, AgentResult):
+            return AgentResult.trusted(
+                status=ResultStatus.FAILURE,
+                data=None,
+                message=(
+                    f"Skill returned invalid type: {type(result).__name__}"
+                ),
+                error_details={
+                    "expected_type": "AgentResult",
+                    "actual_type": type(result).__name__
+                }
+            )
+        
+        return result
+    
+    def _create_exception_result(self, exc: Exception) -> AgentResult:
+        """
+        Convert an exception into a standardized FAILURE result.
+        """
+        return AgentResult.trusted(
+            status=ResultStatus.FAILURE,
+            data=None,
+            message=f"Execution error: {str(exc)}",
+            error_details={
+                "exception_type": type(exc).__name__,
+                "exception_message": str(exc),
+                "traceback": self._get_exception_traceback(exc)
+            }
+        )
+    
+    @staticmethod
+    def _create_cancelled_result(skill_name: str) -> AgentResult:
+        """
+        Create standardized result for tasks cancelled by a batch abort.
+        """
+        return AgentResult.trusted(
+            status=ResultStatus.SKIPPED,
+            data=None,
+            message=f"Cancelled: batch aborted before {skill_name} completed",
+            metadata={
+                "skill_name": skill_name,
+                "cancelled": True
+            }
+        )
+    
+    @staticmethod
+    def _create_timeout_result(skill_name: str, timeout_s: float) -> AgentResult:
+        """
+        Create standardized FAILURE result for a skill that ran out of time.
+        
+        timeout_s is 0.0 when the context deadline had already passed
+        (before the skill started, or while a batch waited on it).
+        """
+        if timeout_s > 0:
+            message = f"Timed out: {skill_name} exceeded {timeout_s:.3f}s budget"
+        else:
+            message = f"Timed out: deadline expired for {skill_name}"
+        logger.warning(f"⚠ {message}")
+        
+        return AgentResult.trusted(
+            status=ResultStatus.FAILURE,
+            data=None,
+            message=message,
+            error_details={
+                "timeout": True,
+                "timeout_s": timeout_s,
+                "exception_type": "TimeoutError"
+            },
+            metadata={"skill_name": skill_name}
+        )
+    
+    @staticmethod
+    def _create_rejected_result(
+        skill_name: str,
+        rejection: AdmissionRejected
+    ) -> AgentResult:
+        """
+        Create standardized result for tasks refused by admission control.
+        """
+        retry_after_ms = (
+            rejection.retry_after_s * 1000
+            if rejection.retry_after_s is not None else None
+        )
+        logger.warning(f"⊘ Rejected {skill_name}: {rejection.reason}")
+        
+        return AgentResult.trusted(
+            status=ResultStatus.REJECTED,
+            data=None,
+            message=f"Rejected by admission control: {rejection.reason}",
+            error_details={
+                "reason": rejection.reason,
+                "retry_after_ms": retry_after_ms
+            },
+            metadata={"skill_name": skill_name}
+        )
+    
+    def _create_not_found_result(self, skill_name: str) -> AgentResult:
+        """
+        Create standardized result for missing skills.
+        
+        Includes helpful diagnostic information. Both lookups are served
+        by the registry's index, so a burst of misses stays cheap even
+        for very large registries (available_skills is a shared,
+        immutable snapshot).
+        """
+        return AgentResult.trusted(
+            status=ResultStatus.FAILURE,
+            data=None,
+            message=f"Skill not found: {skill_name}",
+            metadata={
+                "requested_skill": skill_name,
+                "available_skills": self._registry.skill_names(),
+                "suggestions": self._registry.suggest_skills(skill_name)
+            }
+        )
+    
+    @staticmethod
     def _get_exception_traceback(exc: Exception) -> str:
         """
         Extract formatted traceback from exception.
@@ -337,21 +1616,162 @@ class AgentOrchestrator:
                 # do work
             print(timer.elapsed_ms)
         """
-        class Timer:
-            def __init__(self):
-                self.start = time.perf_counter()
-                self.elapsed_ms = 0.0
-            
-            def stop(self):
-                self.elapsed_ms = (time.perf_counter() - self.start) * 1000
-        
-        timer = Timer()
+        timer = _Timer()
         try:
             yield timer
         finally:
             timer.stop()
 
 
+# ============================================================================
+# Execution Helpers
+# ============================================================================
+
+class _Timer:
+    """Wall-clock stopwatch used by _measure_execution."""
+    
+    __slots__ = ("start", "elapsed_ms")
+    
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.elapsed_ms = 0.0
+    
+    def stop(self):
+        self.elapsed_ms = (time.perf_counter() - self.start) * 1000
+
+
+class _DaemonWorkers:
+    """
+    Bounded, reused pool of daemon threads.
+    
+    ThreadPoolExecutor workers are joined at interpreter exit, so a hung
+    skill would block shutdown; these threads are daemons. At most
+    max_workers are started (on demand); further calls queue.
+    """
+    
+    def __init__(self, max_workers: int, thread_name_prefix: str):
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+        
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._idle = threading.Semaphore(0)
+        self._threads = 0
+        self._lock = threading.Lock()
+    
+    def try_submit(self, fn: Callable[..., Any], *args: Any) -> Future | None:
+        """Like submit, but None unless a worker is idle or can be started."""
+        if not self._idle.acquire(blocking=False):
+            with self._lock:
+                if self._threads >= self._max_workers:
+                    return None
+                self._start_worker()
+        
+        future: Future = Future()
+        self._queue.put((future, fn, args))
+        return future
+    
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Queue fn(*args); cancel the future to drop it before it starts."""
+        future: Future = Future()
+        self._queue.put((future, fn, args))
+        
+        # Reuse an idle worker, else grow up to the cap
+        if self._idle.acquire(blocking=False):
+            return future
+        with self._lock:
+            if self._threads < self._max_workers:
+                self._start_worker()
+        return future
+    
+    def _start_worker(self) -> None:
+        # Lock held
+        self._threads += 1
+        threading.Thread(
+            target=self._work,
+            name=f"{self._thread_name_prefix}-{self._threads}",
+            daemon=True
+        ).start()
+    
+    def _work(self) -> None:
+        while True:
+            future, fn, args = self._queue.get()
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args))
+                except BaseException as e:
+                    future.set_exception(e)
+            del future, fn, args
+            self._idle.release()
+
+
+async def _aclose(stream: AsyncIterator[AgentResult]) -> None:
+    """Close an async generator (if it is one) to run its cleanup."""
+    aclose = getattr(stream, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+def _bind_middleware(
+    middleware: ExecutionMiddleware,
+    next_handler: SkillHandler
+) -> SkillHandler:
+    """Close over one middleware and the handler it delegates to."""
+    def handler(context: AgentContext) -> AgentResult:
+        return middleware(context, next_handler)
+    
+    return handler
+
+
+def _release_abandoned_permit(
+    waiter: "asyncio.Future[Permit | LimiterSlot]"
+) -> None:
+    """Release a permit or slot granted to a caller that stopped waiting."""
+    if not waiter.cancelled() and waiter.exception() is None:
+        waiter.result().release()
+
+
+def _mark_hedged(
+    hedger: Hedger,
+    skill_name: str,
+    result: AgentResult,
+    hedge_won: bool
+) -> AgentResult:
+    """Record the winner of a hedged request on the hedger and result."""
+    hedger.record_winner(skill_name, hedge_won)
+    result.metadata["hedged"] = True
+    result.metadata["hedge_won"] = hedge_won
+    return result
+
+
+def _effective_budget(
+    timeout_s: float | None,
+    remaining_s: float | None
+) -> float:
+    """Smaller of a skill timeout and a deadline's remaining time."""
+    if timeout_s is None:
+        return remaining_s
+    if remaining_s is None:
+        return timeout_s
+    return min(timeout_s, remaining_s)
+
+
+def _bind_span(name: str, handler: SkillHandler) -> SkillHandler:
+    """Run a handler inside a child span of the current trace."""
+    def traced_handler(context: AgentContext) -> AgentResult:
+        with child_span(name):
+            return handler(context)
+    
+    return traced_handler
+
+
+def _middleware_name(middleware: ExecutionMiddleware) -> str:
+    """Readable span name: factory name for closures, else qualname."""
+    name = getattr(middleware, "__qualname__", type(middleware).__name__)
+    return name.split(".<locals>.", 1)[0]
+
+
 # ============================================================================
 # Built-in Middleware
 # ============================================================================
@@ -369,39 +1789,88 @@ def logging_middleware(context: AgentContext, next_handler: Callable) -> AgentRe
     return result
 
 
+class _DictCache:
+    """
+    CacheBackend over a caller-owned dict (deprecated caching_middleware
+    argument).
+    
+    Fills the dict exactly as before, so callers reading it keep working.
+    Copies on read and write with their own metadata, like ResultCache,
+    so the orchestrator's timing annotations never reach stored results.
+    """
+    
+    def __init__(self, entries: dict[str, AgentResult]):
+        self.entries = entries
+    
+    def get(self, key: str) -> AgentResult | None:
+        result = self.entries.get(key)
+        if result is None:
+            return None
+        return result.model_copy(update={"metadata": dict(result.metadata)})
+    
+    def put(self, key: str, result: AgentResult) -> None:
+        self.entries[key] = result.model_copy(
+            update={"metadata": dict(result.metadata)}
+        )
+
+
 def caching_middleware(
-    cache: dict[str, AgentResult],
-    cache_key_fn: Callable[[AgentContext], str] = None
+    cache: CacheBackend | None = None,
+    cache_key_fn: Callable[[AgentContext], str] = None,
+    exclude_params: tuple[str, ...] = ()
 ):
     """
-    Middleware factory that caches results.
+    Middleware factory that caches successful results.
+    
+    Args:
+        cache: Shared CacheBackend, e.g. ResultCache or SQLiteResultCache
+               (default: a new bounded ResultCache).
+               Plain dicts are deprecated: they are still populated
+               (unbounded, no TTL) for one release, then unsupported.
+        cache_key_fn: Context -> key function (default: task + canonical
+                      parameter digest)
+        exclude_params: Parameters ignored by the default key function
+    
+    The cache is exposed as ``middleware.cache`` for stats inspection.
     
     Example:
-        cache = {}
+        cache = ResultCache(max_entries=10_000, ttl_seconds=300)
         middleware = caching_middleware(cache)
         orchestrator.add_middleware(middleware)
     """
+    if isinstance(cache, dict):
+        warnings.warn(
+            "Passing a dict to caching_middleware is deprecated and will "
+            "stop working in the next release; pass a ResultCache instead",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        cache = _DictCache(cache)
+    
+    if cache is None:
+        cache = ResultCache()
+    
     if cache_key_fn is None:
-        # Default: cache by task name and sorted parameters
-        def cache_key_fn(ctx):
-            params_str = str(sorted(ctx.parameters.items()))
-            return f"{ctx.task}:{params_str}"
+        def cache_key_fn(ctx: AgentContext) -> str:
+            return ctx.cache_key(exclude_params)
     
     def middleware(context: AgentContext, next_handler: Callable) -> AgentResult:
         key = cache_key_fn(context)
         
-        if key in cache:
+        cached_result = cache.get(key)
+        if cached_result is not None:
             logger.debug(f"⚡ Cache hit: {key}")
-            return cache[key]
+            return cached_result
         
         result = next_handler(context)
         
         if result.success:
-            cache[key] = result
+            cache.put(key, result)
             logger.debug(f"💾 Cached result: {key}")
         
         return result
     
+    middleware.cache = cache
     return middleware
 
 
@@ -7,10 +7,15 @@ Skills need not import these protocols—they simply match the structural shape.
 PEP 544: Protocol classes provide structural subtyping (static duck typing).
 """
 
-from typing import Protocol, Any, runtime_checkable
-from pydantic import BaseModel, Field, ConfigDict
+import time
+from typing import (
+    Protocol, Any, AsyncIterator, Iterable, Mapping, runtime_checkable
+)
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr, TypeAdapter
 from enum import Enum
 
+from .hashing import canonical_digest
+
 
 # ============================================================================
 # Domain Models (Pydantic v2)
@@ -54,11 +59,216 @@ class AgentContext(BaseModel):
         description="Execution priority for resource allocation"
     )
     
+    deadline: float | None = Field(
+        default=None,
+        description=(
+            "Absolute deadline as a Unix timestamp (time.time()); "
+            "None means unbounded. Wall-clock so it survives process "
+            "and network hops."
+        )
+    )
+    
     model_config = ConfigDict(
         frozen=True,  # Immutable after creation
         validate_assignment=True,  # Validate on field updates (if unfrozen)
         extra="forbid"  # Reject unexpected fields
     )
+    
+    # Memoized parameter digests: (parameters dict, {excluded: digest}).
+    # Tied to the parameters object so copies with new parameters
+    # never reuse a stale digest. A cache, not state: __eq__ ignores it.
+    _key_memo: tuple[dict, dict[frozenset, str]] | None = PrivateAttr(
+        default=None
+    )
+    
+    def __eq__(self, other: object) -> bool:
+        # Pydantic also compares private attributes, which would make
+        # equality depend on whether cache_key() has been called
+        if not isinstance(other, AgentContext):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+    
+    def cache_key(self, exclude: Iterable[str] = ()) -> str:
+        """
+        Content-addressed key for this task and its parameters.
+        
+        Nested dicts, lists, and sets are hashed canonically (see
+        hashing.py), so insertion order and unorderable values do not
+        affect the key. The digest is computed once per context and
+        excluded-parameter set.
+        
+        The memo is keyed on the identity of the parameters dict, so
+        parameters must not be mutated in place once the key has been
+        taken (the context is frozen; treat its dicts as read-only too).
+        Use derive() to change parameters: the copy gets a fresh key.
+        
+        Args:
+            exclude: Parameter names left out of the key (e.g. request
+                     IDs or tracing tokens that don't affect the result)
+        
+        Returns:
+            "<task>:<hex digest>"
+        """
+        excluded = frozenset(exclude)
+        
+        # Read/write the private slot directly: pydantic's private
+        # attribute __getattr__ costs more than the memo lookup itself
+        private = self.__pydantic_private__
+        memo = private.get("_key_memo")
+        if memo is None or memo[0] is not self.parameters:
+            memo = (self.parameters, {})
+            private["_key_memo"] = memo
+        
+        digest = memo[1].get(excluded)
+        if digest is None:
+            params = self.parameters
+            if excluded:
+                params = {
+                    k: v for k, v in params.items() if k not in excluded
+                }
+            digest = canonical_digest(params)
+            memo[1][excluded] = digest
+        
+        return f"{self.task}:{digest}"
+    
+    def remaining(self) -> float | None:
+        """
+        Seconds left before the deadline (never negative).
+        
+        Returns:
+            None if the context has no deadline
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.time())
+    
+    @property
+    def expired(self) -> bool:
+        """
+        True once the deadline has passed.
+        
+        Long-running skills should check this between steps and return
+        early (cooperative cancellation).
+        """
+        return self.deadline is not None and time.time() >= self.deadline
+    
+    def with_timeout(self, seconds: float) -> "AgentContext":
+        """
+        Copy of this context that must finish within seconds from now.
+        
+        An existing, earlier deadline is kept: budgets only shrink as
+        they propagate to downstream calls.
+        """
+        deadline = time.time() + seconds
+        if self.deadline is not None:
+            deadline = min(deadline, self.deadline)
+        return self.derive(deadline=deadline)
+    
+    def derive(
+        self,
+        parameters: Mapping[str, Any] | None = None,
+        metadata: Mapping[str, Any] | None = None,
+        **fields: Any
+    ) -> "AgentContext":
+        """
+        Copy-on-write variant of this context.
+        
+        Keys in parameters/metadata are added or replaced on top of this
+        context's dicts; everything not mentioned is shared with it, not
+        copied (nested values are shared by reference, so treat them as
+        read-only). Only the delta is validated. While parameters are
+        unchanged, the derived context also reuses the cache_key digest.
+        
+        Args:
+            parameters: Parameter keys to add or override
+            metadata: Metadata keys to add or override
+            **fields: Other fields to replace (task, priority, deadline)
+        
+        Raises:
+            pydantic.ValidationError: A new value is invalid or a field
+                                      does not exist
+        
+        Example:
+            def tenant_middleware(context, next_handler):
+                return next_handler(context.derive(metadata={"tenant": "acme"}))
+        """
+        values = dict(self.__dict__)
+        fields_set = set(self.__pydantic_fields_set__)
+        
+        if parameters:
+            values["parameters"] = {
+                **self.parameters, **_STR_KEYED.validate_python(parameters)
+            }
+            fields_set.add("parameters")
+        if metadata:
+            values["metadata"] = {
+                **self.metadata, **_STR_KEYED.validate_python(metadata)
+            }
+            fields_set.add("metadata")
+        
+        # The memo is keyed on the parameters object, so sharing it is
+        # safe: a derived context with new parameters just recomputes
+        private = self.__pydantic_private__
+        derived = _construct(
+            type(self),
+            values,
+            fields_set,
+            extra=None,
+            private={"_key_memo": private.get("_key_memo") if private else None}
+        )
+        
+        for name, value in fields.items():
+            self.__pydantic_validator__.validate_assignment(derived, name, value)
+        
+        return derived
+    
+    @classmethod
+    def trusted(
+        cls,
+        task: str,
+        parameters: dict[str, Any] | None = None,
+        metadata: dict[str, Any] | None = None,
+        priority: TaskPriority = TaskPriority.NORMAL,
+        deadline: float | None = None
+    ) -> "AgentContext":
+        """
+        Build a context from values already known to be valid.
+        
+        Skips Pydantic validation (whose cost grows with the size of
+        parameters and metadata, which it copies); for internal hot paths
+        only. Data entering the system goes through the regular
+        constructor or model_validate (see codec.py).
+        
+        Values are stored as given: no coercion (priority must be a
+        TaskPriority) and no copying of the dicts.
+        """
+        fields_set = {"task"}
+        if parameters is None:
+            parameters = {}
+        else:
+            fields_set.add("parameters")
+        if metadata is None:
+            metadata = {}
+        else:
+            fields_set.add("metadata")
+        if priority is not TaskPriority.NORMAL:
+            fields_set.add("priority")
+        if deadline is not None:
+            fields_set.add("deadline")
+        
+        return _construct(
+            cls,
+            {
+                "task": task,
+                "parameters": parameters,
+                "metadata": metadata,
+                "priority": priority,
+                "deadline": deadline
+            },
+            fields_set,
+            extra=None,
+            private={"_key_memo": None}
+        )
 
 
 class ResultStatus(str, Enum):
@@ -67,6 +277,7 @@ class ResultStatus(str, Enum):
     FAILURE = "failure"
     PARTIAL = "partial"
     SKIPPED = "skipped"
+    REJECTED = "rejected"  # Refused by admission control; safe to retry later
 
 
 class AgentResult(BaseModel):
@@ -109,6 +320,87 @@ class AgentResult(BaseModel):
     def success(self) -> bool:
         """Convenience property for boolean success check."""
         return self.status in (ResultStatus.SUCCESS, ResultStatus.PARTIAL)
+    
+    @classmethod
+    def trusted(
+        cls,
+        status: ResultStatus,
+        message: str,
+        data: Any = None,
+        metadata: dict[str, Any] | None = None,
+        error_details: dict[str, Any] | None = None,
+        **extra: Any
+    ) -> "AgentResult":
+        """
+        Build a result from values already known to be valid.
+        
+        Used by the orchestrator, decorators and resilience layers for
+        the results they create themselves (errors, timeouts, skips),
+        which need no validation. Results returned by skills are still
+        type-checked, and results read from the wire or disk are fully
+        validated.
+        
+        Values are stored as given: no coercion (status must be a
+        ResultStatus) and no copying of the dicts.
+        """
+        fields_set = {"status", "message"}
+        if data is not None:
+            fields_set.add("data")
+        if metadata is None:
+            metadata = {}
+        else:
+            fields_set.add("metadata")
+        if error_details is not None:
+            fields_set.add("error_details")
+        if extra:
+            fields_set.update(extra)
+        
+        return _construct(
+            cls,
+            {
+                "status": status,
+                "data": data,
+                "message": message,
+                "metadata": metadata,
+                "error_details": error_details
+            },
+            fields_set,
+            extra=extra,
+            private=None
+        )
+
+
+def _construct(
+    cls: type[BaseModel],
+    values: dict[str, Any],
+    fields_set: set[str],
+    extra: dict[str, Any] | None,
+    private: dict[str, Any] | None
+) -> Any:
+    """
+    Instantiate a model from trusted field values.
+    
+    Fills the same four slots as BaseModel.__init__ without running the
+    validator (BaseModel.model_construct also resolves defaults and
+    aliases, which makes it slower than validation for small models).
+    """
+    instance = _new_object(cls)
+    _set_dict(instance, values)
+    _set_fields_set(instance, fields_set)
+    _set_extra(instance, extra)
+    _set_private(instance, private)
+    return instance
+
+
+# Validates parameter/metadata deltas in AgentContext.derive
+_STR_KEYED = TypeAdapter(dict[str, Any])
+
+# Slot setters, bound once (cheaper than object.__setattr__ by name)
+_new_object = object.__new__
+_set_dict = BaseModel.__dict__["__dict__"].__set__
+_set_fields_set = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+_set_extra = BaseModel.__dict__["__pydantic_extra__"].__set__
+_set_private = BaseModel.__dict__["__pydantic_private__"].__set__
 
 
 # ============================================================================
@@ -185,6 +477,34 @@ class StreamingAgentSkill(Protocol):
         ...
 
 
+@runtime_checkable
+class BatchAgentSkill(Protocol):
+    """
+    Structural contract for skills that process many contexts per call.
+    
+    Use when per-call overhead dominates: vectorized NumPy work, one bulk
+    query instead of N point lookups, batched model inference. With
+    AgentOrchestrator(batching=BatchPolicy(...)), concurrent requests for
+    the skill are collected into micro-batches (see batching.py).
+    
+    A module may define execute_many alongside execute, or on its own
+    (the registry then derives execute from it).
+    """
+    
+    def execute_many(self, contexts: list[AgentContext]) -> list[AgentResult]:
+        """
+        Execute the skill for a batch of contexts.
+        
+        Returns:
+            One AgentResult per context, in the same order
+        
+        Raises:
+            Should NOT raise exceptions. An exception (or a result list of
+            the wrong length) fails every request in the batch.
+        """
+        ...
+
+
 @runtime_checkable
 class ValidatableSkill(Protocol):
     """
@@ -223,6 +543,9 @@ class SkillMetadata(Protocol):
             - tags: list[str]  # Categorization tags
             - version: str
             - author: str
+            - idempotent: bool  # Safe to run twice (enables hedging)
+            - max_batch_size: int  # Micro-batch limits for BatchAgentSkill
+            - max_wait_ms: float
         """
         ...
 
@@ -236,6 +559,7 @@ from typing import Callable, Awaitable
 # Type aliases for common skill function signatures
 SyncSkillFunc = Callable[[AgentContext], AgentResult]
 AsyncSkillFunc = Callable[[AgentContext], Awaitable[AgentResult]]
+BatchSkillFunc = Callable[[list[AgentContext]], list[AgentResult]]
 
 
 # ============================================================================
@@ -286,6 +610,68 @@ def is_valid_skill_signature(func: Callable) -> bool:
     return True
 
 
+def is_valid_stream_skill_signature(func: Callable) -> bool:
+    """
+    Runtime check if a function matches StreamingAgentSkill protocol.
+    
+    Streaming skills must be async generator functions
+    (``async def`` containing ``yield``) accepting a single context.
+    
+    Args:
+        func: Function to validate
+        
+    Returns:
+        True if function signature matches protocol
+    """
+    import inspect
+    
+    if not inspect.isasyncgenfunction(func):
+        return False
+    
+    try:
+        sig = inspect.signature(func)
+    except (ValueError, TypeError):
+        return False
+    
+    params = [p for p in sig.parameters.values() 
+              if p.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                           inspect.Parameter.POSITIONAL_ONLY)]
+    
+    if len(params) != 1:
+        return False
+    
+    return params[0].annotation in (inspect.Parameter.empty, AgentContext)
+
+
+def is_valid_batch_skill_signature(func: Callable) -> bool:
+    """
+    Runtime check if a function matches BatchAgentSkill protocol.
+    
+    Batch skills (sync or async) accept a single list of contexts.
+    
+    Args:
+        func: Function to validate
+        
+    Returns:
+        True if function signature matches protocol
+    """
+    import inspect
+    
+    if not callable(func):
+        return False
+    
+    try:
+        sig = inspect.signature(func)
+    except (ValueError, TypeError):
+        return False
+    
+    params = [p for p in sig.parameters.values() 
+              if p.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                           inspect.Parameter.POSITIONAL_ONLY)]
+    
+    return len(params) == 1
+
+
 def validate_skill_result(result: Any) -> bool:
     """
     Runtime check if a value matches AgentResult structure.
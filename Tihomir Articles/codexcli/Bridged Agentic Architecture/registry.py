@@ -8,21 +8,27 @@ Single Responsibility: This class ONLY discovers and registers skills.
 Validation, execution, and orchestration are separate concerns.
 """
 
+import dataclasses
 import inspect
 import importlib.util
 from pathlib import Path
 from types import ModuleType
-from typing import Callable, Dict, List
+from typing import Any, Callable, Dict, List
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from .protocols import (
     AgentContext, 
     AgentResult, 
     AgentSkill,
+    BatchSkillFunc,
+    SkillMetadata,
     SyncSkillFunc,
-    is_valid_skill_signature
+    is_valid_batch_skill_signature,
+    is_valid_skill_signature,
+    is_valid_stream_skill_signature
 )
+from .skill_index import SkillIndex
 
 
 # ============================================================================
@@ -48,6 +54,9 @@ class SkillInfo:
     function: Callable
     signature: inspect.Signature
     docstring: str | None
+    streaming: bool = False
+    batch: bool = False
+    metadata: dict[str, Any] = field(default_factory=dict)
     
     def __repr__(self) -> str:
         return f"SkillInfo(name={self.name}, path={self.module_path.name})"
@@ -69,6 +78,8 @@ class SkillRegistry:
     Performance:
     - O(N) initialization where N = number of skill files
     - O(1) lookup after initialization
+    - Listing, prefix/tag lookup and typo suggestions are served from an
+      incrementally maintained SkillIndex (no per-call sort or scan)
     - Skills loaded lazily to reduce startup time
     """
     
@@ -76,7 +87,9 @@ class SkillRegistry:
         self, 
         skills_dir: Path | str,
         naming_convention: str = "execute",
-        eager_load: bool = True
+        eager_load: bool = True,
+        stream_naming_convention: str = "execute_stream",
+        batch_naming_convention: str = "execute_many"
     ):
         """
         Initialize registry and discover skills.
@@ -86,10 +99,19 @@ class SkillRegistry:
             naming_convention: Expected function name in skill modules
             eager_load: If True, import all modules at init (fail-fast)
                        If False, import modules on first use (lazy)
+            stream_naming_convention: Function name of streaming skills
+                                      (StreamingAgentSkill protocol)
+            batch_naming_convention: Function name of batch skills
+                                     (BatchAgentSkill protocol)
         """
         self.skills_dir = Path(skills_dir)
         self.naming_convention = naming_convention
+        self.stream_naming_convention = stream_naming_convention
+        self.batch_naming_convention = batch_naming_convention
         self._skills: Dict[str, SkillInfo] = {}
+        self._stream_skills: Dict[str, SkillInfo] = {}
+        self._batch_skills: Dict[str, SkillInfo] = {}
+        self._index = SkillIndex()
         self._load_errors: Dict[str, Exception] = {}
         
         if not self.skills_dir.exists():
@@ -116,6 +138,49 @@ class SkillRegistry:
         skill_info = self._skills.get(name)
         return skill_info.function if skill_info else None
     
+    def get_stream_skill(self, name: str) -> Callable | None:
+        """
+        Retrieve streaming skill function (async generator) by name.
+        
+        Returns:
+            Streaming skill function if found, None otherwise
+            
+        Performance: O(1) dictionary lookup
+        """
+        skill_info = self._stream_skills.get(name)
+        return skill_info.function if skill_info else None
+    
+    def list_stream_skills(self) -> List[str]:
+        """
+        Get all registered streaming skill names.
+        
+        Returns:
+            Sorted list of streaming skill identifiers
+        """
+        return sorted(self._stream_skills.keys())
+    
+    def get_batch_skill(self, name: str) -> BatchSkillFunc | None:
+        """
+        Retrieve a skill's execute_many function by name.
+        
+        Returns:
+            Batch function if the skill implements BatchAgentSkill,
+            None otherwise
+            
+        Performance: O(1) dictionary lookup
+        """
+        skill_info = self._batch_skills.get(name)
+        return skill_info.function if skill_info else None
+    
+    def list_batch_skills(self) -> List[str]:
+        """
+        Get all skill names that implement BatchAgentSkill.
+        
+        Returns:
+            Sorted list of batch skill identifiers
+        """
+        return sorted(self._batch_skills.keys())
+    
     def list_skills(self) -> List[str]:
         """
         Get all registered skill names.
@@ -123,7 +188,45 @@ class SkillRegistry:
         Returns:
             Sorted list of skill identifiers
         """
-        return sorted(self._skills.keys())
+        return list(self._index.names())
+    
+    def skill_names(self) -> tuple[str, ...]:
+        """
+        Sorted, immutable snapshot of registered skill names.
+        
+        Performance: O(1) while no skill is (re)registered; prefer this
+        over list_skills() on hot paths
+        """
+        return self._index.names()
+    
+    def find_skills(
+        self,
+        prefix: str | None = None,
+        tag: str | None = None
+    ) -> List[str]:
+        """
+        Skills matching a name prefix and/or a metadata tag.
+        
+        Returns:
+            Sorted list of skill identifiers (all skills if neither
+            filter is given)
+        """
+        if tag is None:
+            return self._index.with_prefix(prefix or "")
+        
+        tagged = self._index.with_tag(tag)
+        if prefix is None:
+            return tagged
+        return [name for name in tagged if name.startswith(prefix)]
+    
+    def suggest_skills(self, name: str, limit: int = 3) -> List[str]:
+        """
+        Registered skills similar to an unknown name ("did you mean").
+        
+        Completions and near misses by edit distance, closest first.
+        See SkillIndex.suggest.
+        """
+        return self._index.suggest(name, limit)
     
     def get_skill_info(self, name: str) -> SkillInfo | None:
         """
@@ -133,6 +236,17 @@ class SkillRegistry:
         """
         return self._skills.get(name)
     
+    def get_skill_metadata(self, name: str) -> dict[str, Any]:
+        """
+        Module-level metadata declared by a skill (SkillMetadata protocol).
+        
+        Returns:
+            The dict returned by the module's get_metadata(), or {} if the
+            skill is unknown or declares none
+        """
+        skill_info = self._skills.get(name) or self._stream_skills.get(name)
+        return skill_info.metadata if skill_info else {}
+    
     def reload_skill(self, name: str) -> bool:
         """
         Reload a single skill from disk (for development).
@@ -140,7 +254,7 @@ class SkillRegistry:
         Returns:
             True if reload successful, False otherwise
         """
-        skill_info = self._skills.get(name)
+        skill_info = self._skills.get(name) or self._stream_skills.get(name)
         if not skill_info:
             logger.warning(f"Cannot reload unknown skill: {name}")
             return False
@@ -201,6 +315,8 @@ class SkillRegistry:
         
         logger.info(
             f"✓ Registered {len(self._skills)} skills, "
+            f"{len(self._stream_skills)} streaming skills, "
+            f"{len(self._batch_skills)} batch skills, "
             f"{len(self._load_errors)} errors"
         )
     
@@ -241,25 +357,44 @@ class SkillRegistry:
         Inspect module and register all valid skill functions.
         
         Validation:
-        1. Function name matches convention
-        2. Signature matches AgentSkill protocol
+        1. Function name matches convention (execute, execute_stream
+           or execute_many)
+        2. Signature matches AgentSkill / StreamingAgentSkill /
+           BatchAgentSkill protocol
         3. Not already registered (prevents duplicates)
         
+        A module with execute_many but no execute also registers a
+        derived single-context execute, so it is usable everywhere a
+        regular skill is.
+        
         Args:
             module: Imported Python module to inspect
         """
         module_path = Path(module.__file__)
+        metadata = self._read_metadata(module, module_path)
         
         # Get all functions in module
         functions = inspect.getmembers(module, inspect.isfunction)
         
         found_skill = False
         for func_name, func in functions:
-            if func_name != self.naming_convention:
+            streaming = batch = False
+            if func_name == self.naming_convention:
+                target = self._skills
+            elif func_name == self.stream_naming_convention:
+                streaming = True
+                target = self._stream_skills
+            elif func_name == self.batch_naming_convention:
+                batch = True
+                target = self._batch_skills
+            else:
                 continue
             
             # Validate signature
-            if not self._validate_skill_signature(func, module_path):
+            if batch:
+                if not self._validate_batch_signature(func, module_path):
+                    continue
+            elif not self._validate_skill_signature(func, module_path, streaming):
                 continue
             
             # Register skill
@@ -269,23 +404,85 @@ class SkillRegistry:
                 module_path=module_path,
                 function=func,
                 signature=inspect.signature(func),
-                docstring=inspect.getdoc(func)
+                docstring=inspect.getdoc(func),
+                streaming=streaming,
+                batch=batch,
+                metadata=metadata
             )
             
-            self._skills[skill_name] = skill_info
-            logger.info(f"✓ Registered: {skill_name}")
+            target[skill_name] = skill_info
+            if target is self._skills:
+                self._index.add(skill_name, _tags(metadata))
+            kind = ' streaming' if streaming else ' batch' if batch else ''
+            logger.info(f"✓ Registered{kind}: {skill_name}")
             found_skill = True
         
+        skill_name = module_path.stem
+        batch_info = self._batch_skills.get(skill_name)
+        if (batch_info is not None and batch_info.module_path == module_path
+                and not hasattr(module, self.naming_convention)):
+            self._skills[skill_name] = dataclasses.replace(
+                batch_info,
+                function=_single_from_batch(batch_info.function),
+                batch=False
+            )
+            self._index.add(skill_name, _tags(metadata))
+        
         if not found_skill:
             logger.warning(
-                f"⚠ No '{self.naming_convention}' function found in "
+                f"⚠ No '{self.naming_convention}', "
+                f"'{self.stream_naming_convention}' or "
+                f"'{self.batch_naming_convention}' function found in "
                 f"{module_path.name}"
             )
     
+    @staticmethod
+    def _read_metadata(module: ModuleType, module_path: Path) -> dict[str, Any]:
+        """
+        Call the module's get_metadata() if it satisfies SkillMetadata.
+        
+        A broken get_metadata() is logged and treated as no metadata;
+        it never prevents the skill from registering.
+        """
+        if not isinstance(module, SkillMetadata):
+            return {}
+        
+        try:
+            metadata = module.get_metadata()
+        except Exception as e:
+            logger.warning(
+                f"⚠ get_metadata() failed in {module_path.name}: {e}"
+            )
+            return {}
+        
+        if not isinstance(metadata, dict):
+            logger.warning(
+                f"⚠ get_metadata() in {module_path.name} returned "
+                f"{type(metadata).__name__}, expected dict"
+            )
+            return {}
+        
+        return metadata
+    
+    @staticmethod
+    def _validate_batch_signature(func: Callable, module_path: Path) -> bool:
+        """
+        Validate function matches BatchAgentSkill protocol.
+        """
+        if not is_valid_batch_skill_signature(func):
+            logger.warning(
+                f"⚠ Invalid signature in {module_path.name}::{func.__name__}\n"
+                f"   Expected: execute_many(contexts: list[AgentContext])"
+                f" -> list[AgentResult]"
+            )
+            return False
+        return True
+    
     def _validate_skill_signature(
         self, 
         func: Callable,
-        module_path: Path
+        module_path: Path,
+        streaming: bool = False
     ) -> bool:
         """
         Validate function matches AgentSkill protocol.
@@ -296,10 +493,21 @@ class SkillRegistry:
         Args:
             func: Function to validate
             module_path: Path for error reporting
+            streaming: Validate against StreamingAgentSkill instead
             
         Returns:
             True if valid, False otherwise (with logged warnings)
         """
+        if streaming:
+            if not is_valid_stream_skill_signature(func):
+                logger.warning(
+                    f"⚠ Invalid signature in {module_path.name}::{func.__name__}\n"
+                    f"   Expected: async def execute_stream(context: AgentContext)"
+                    f" -> AsyncIterator[AgentResult]"
+                )
+                return False
+            return True
+        
         if not is_valid_skill_signature(func):
             logger.warning(
                 f"⚠ Invalid signature in {module_path.name}::{func.__name__}\n"
@@ -328,6 +536,31 @@ class SkillRegistry:
         return True
 
 
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def _tags(metadata: dict[str, Any]) -> tuple[str, ...]:
+    """Tags declared in skill metadata (a single string is one tag)."""
+    tags = metadata.get("tags") or ()
+    if isinstance(tags, str):
+        return (tags,)
+    return tuple(str(tag) for tag in tags)
+
+
+def _single_from_batch(execute_many: BatchSkillFunc) -> Callable:
+    """Derive a single-context execute from a batch function."""
+    if inspect.iscoroutinefunction(execute_many):
+        async def execute(context: AgentContext) -> AgentResult:
+            return (await execute_many([context]))[0]
+    else:
+        def execute(context: AgentContext) -> AgentResult:
+            return execute_many([context])[0]
+    
+    execute.__doc__ = execute_many.__doc__
+    return execute
+
+
 # ============================================================================
 # Factory Functions
 # ============================================================================
@@ -0,0 +1,530 @@
+"""
+Resilience: Adaptive Concurrency Limits and Circuit Breakers per Skill
+
+Keeps one degraded skill from tying up workers that the rest of a batch
+needs. Both mechanisms learn from the outcomes that the orchestrator's
+error containment already produces (FAILURE results, never exceptions),
+so skills need no changes.
+
+Single Responsibility: This module ONLY decides whether a call may
+proceed and learns from its outcome. AgentOrchestrator wires it around
+each skill via ``AgentOrchestrator(registry, resilience=...)``.
+
+Mechanisms:
+- AIMD concurrency limit: grows by one while the skill is healthy and
+  busy, shrinks multiplicatively on failures or slow calls. Calls over
+  the limit wait briefly, then are REJECTED.
+- Circuit breaker: CLOSED -> OPEN when the failure rate or slow-call
+  rate over a sliding window crosses its threshold; OPEN calls fail fast
+  for open_seconds; then HALF_OPEN lets a few probes through (at most
+  half_open_max_calls at once). half_open_successes successful probes
+  close the circuit; any failed or slow probe re-opens it. Outcomes of
+  calls admitted before the last state change are ignored, so a slow
+  call from the CLOSED period can neither close nor re-open a circuit.
+
+Open Circuit Fallback:
+    The last successful result for the same cache key (if a fallback
+    cache is configured), marked ``metadata["circuit_open"] = True``;
+    otherwise a SKIPPED result.
+
+Usage:
+    resilience = ResilienceManager(
+        breaker=BreakerConfig(failure_rate_threshold=0.5, open_seconds=10),
+        limiter=LimiterConfig(initial_limit=8, latency_threshold_ms=2000),
+        fallback_cache=ResultCache(max_entries=10_000)
+    )
+    orchestrator = AgentOrchestrator(registry, resilience=resilience)
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from .admission import AdmissionRejected
+from .cache import CacheBackend
+from .protocols import AgentContext, AgentResult, ResultStatus
+
+
+# ============================================================================
+# Logging Configuration
+# ============================================================================
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Configuration
+# ============================================================================
+
+@dataclass(frozen=True)
+class LimiterConfig:
+    """
+    AIMD concurrency limit parameters.
+
+    A call counts as "dropped" (triggers a decrease) if it fails or takes
+    longer than latency_threshold_ms.
+    """
+    initial_limit: int = 10
+    min_limit: int = 1
+    max_limit: int = 200
+    backoff_ratio: float = 0.9
+    latency_threshold_ms: float | None = None
+    queue_timeout_s: float = 1.0
+
+    def __post_init__(self):
+        if not 1 <= self.min_limit <= self.initial_limit <= self.max_limit:
+            raise ValueError(
+                "Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit"
+            )
+        if not 0.0 < self.backoff_ratio < 1.0:
+            raise ValueError(
+                f"backoff_ratio must be in (0, 1), got {self.backoff_ratio}"
+            )
+
+
+@dataclass(frozen=True)
+class BreakerConfig:
+    """
+    Circuit breaker parameters.
+
+    Rates are evaluated over the last window_size calls, once at least
+    min_calls have been recorded. A HALF_OPEN circuit closes after
+    half_open_successes successful probes, running at most
+    half_open_max_calls at a time.
+    """
+    failure_rate_threshold: float = 0.5
+    slow_call_rate_threshold: float = 1.0
+    slow_call_ms: float | None = None
+    window_size: int = 20
+    min_calls: int = 10
+    open_seconds: float = 30.0
+    half_open_max_calls: int = 1
+    half_open_successes: int = 3
+
+    def __post_init__(self):
+        if self.min_calls > self.window_size:
+            raise ValueError("min_calls must be <= window_size")
+        if self.half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be >= 1")
+        if self.half_open_successes < 1:
+            raise ValueError("half_open_successes must be >= 1")
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+# ============================================================================
+# AIMD Limiter
+# ============================================================================
+
+class LimiterSlot:
+    """
+    One admitted call. Report its outcome with release().
+
+    Releasing without an outcome (e.g. abandoned or rejected downstream)
+    frees the slot without adjusting the limit.
+    """
+
+    __slots__ = ("_limiter", "_released")
+
+    def __init__(self, limiter: "AIMDLimiter"):
+        self._limiter = limiter
+        self._released = False
+
+    def release(
+        self,
+        success: bool | None = None,
+        latency_ms: float = 0.0
+    ) -> None:
+        if not self._released:
+            self._released = True
+            self._limiter._release(success, latency_ms)
+
+
+class AIMDLimiter:
+    """
+    Additive-increase / multiplicative-decrease concurrency limit.
+
+    The limit only grows while at least half of it is in use, so an idle
+    skill does not accumulate headroom it has never proven it can take.
+    """
+
+    def __init__(self, name: str, config: LimiterConfig = LimiterConfig()):
+        self.name = name
+        self.config = config
+        self._limit = float(config.initial_limit)
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def try_acquire(self) -> LimiterSlot | None:
+        """Take a slot if below the limit, else None."""
+        with self._condition:
+            if self._in_flight < int(self._limit):
+                self._in_flight += 1
+                return LimiterSlot(self)
+            return None
+
+    def acquire(self, timeout_s: float | None = None) -> LimiterSlot:
+        """
+        Take a slot, waiting up to timeout_s (default from config).
+
+        Raises:
+            AdmissionRejected: No slot freed up in time
+        """
+        timeout_s = self.config.queue_timeout_s if timeout_s is None else timeout_s
+        deadline = time.monotonic() + timeout_s
+
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise AdmissionRejected(
+                        f"adaptive concurrency limit reached for {self.name} "
+                        f"({int(self._limit)} in flight)"
+                    )
+                self._condition.wait(remaining)
+            self._in_flight += 1
+            return LimiterSlot(self)
+
+    def _release(self, success: bool | None, latency_ms: float) -> None:
+        with self._condition:
+            in_flight = self._in_flight
+            self._in_flight -= 1
+
+            if success is not None:
+                threshold = self.config.latency_threshold_ms
+                dropped = not success or (
+                    threshold is not None and latency_ms > threshold
+                )
+                previous = int(self._limit)
+
+                if dropped:
+                    self._limit = max(
+                        float(self.config.min_limit),
+                        self._limit * self.config.backoff_ratio
+                    )
+                elif in_flight * 2 >= self._limit:
+                    self._limit = min(
+                        float(self.config.max_limit), self._limit + 1
+                    )
+
+                if int(self._limit) < previous:
+                    logger.debug(
+                        f"↓ {self.name} concurrency limit "
+                        f"{previous} → {int(self._limit)}"
+                    )
+
+            self._condition.notify()
+
+
+# ============================================================================
+# Circuit Breaker
+# ============================================================================
+
+class BreakerTicket:
+    """
+    One call admitted by CircuitBreaker.allow(), stamped with the state
+    it was admitted in. Only its first record() or release_probe()
+    counts.
+    """
+
+    __slots__ = ("generation", "probe", "_settled")
+
+    def __init__(self, generation: int, probe: bool):
+        self.generation = generation
+        self.probe = probe
+        self._settled = False
+
+
+class CircuitBreaker:
+    """
+    Sliding-window circuit breaker driven by failure and slow-call rates.
+
+    Thread-safe. Every ticket from allow() must be passed to record() or
+    release_probe(), so HALF_OPEN probe accounting stays correct.
+    """
+
+    def __init__(self, name: str, config: BreakerConfig = BreakerConfig()):
+        self.name = name
+        self.config = config
+        self._state = CircuitState.CLOSED
+        self._window: deque[tuple[bool, bool]] = deque(maxlen=config.window_size)
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+        # Bumped on every transition; tickets from older states are stale
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            return self._state
+
+    def allow(self) -> BreakerTicket | None:
+        """A ticket if a call may proceed now, else None."""
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                return BreakerTicket(self._generation, probe=False)
+
+            self._maybe_half_open(time.monotonic())
+
+            if (self._state is CircuitState.HALF_OPEN
+                    and self._probes < self.config.half_open_max_calls):
+                self._probes += 1
+                return BreakerTicket(self._generation, probe=True)
+            return None
+
+    def record(
+        self,
+        ticket: BreakerTicket,
+        success: bool,
+        latency_ms: float
+    ) -> None:
+        """Record the outcome of the call ticket admitted."""
+        slow_ms = self.config.slow_call_ms
+        slow = slow_ms is not None and latency_ms > slow_ms
+
+        with self._lock:
+            if not self._settle(ticket):
+                return  # Admitted before the last transition
+
+            if ticket.probe:
+                self._probes -= 1
+                if success and not slow:
+                    self._probe_successes += 1
+                    if self._probe_successes >= self.config.half_open_successes:
+                        self._transition(CircuitState.CLOSED)
+                else:
+                    self._transition(CircuitState.OPEN)
+                return
+
+            self._window.append((success, slow))
+            if len(self._window) < self.config.min_calls:
+                return
+
+            calls = len(self._window)
+            failure_rate = sum(not ok for ok, _ in self._window) / calls
+            slow_rate = sum(is_slow for _, is_slow in self._window) / calls
+
+            if (failure_rate >= self.config.failure_rate_threshold
+                    or slow_rate >= self.config.slow_call_rate_threshold):
+                self._transition(CircuitState.OPEN)
+
+    def release_probe(self, ticket: BreakerTicket) -> None:
+        """Return the ticket of a call that never ran (or told nothing)."""
+        with self._lock:
+            if self._settle(ticket) and ticket.probe:
+                self._probes -= 1
+
+    # ========================================================================
+    # Implementation (Private, lock held)
+    # ========================================================================
+
+    def _settle(self, ticket: BreakerTicket) -> bool:
+        """Mark ticket used; True if it belongs to the current state."""
+        if ticket._settled:
+            return False
+        ticket._settled = True
+        return ticket.generation == self._generation
+
+    def _maybe_half_open(self, now: float) -> None:
+        if (self._state is CircuitState.OPEN
+                and now - self._opened_at >= self.config.open_seconds):
+            self._transition(CircuitState.HALF_OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        previous, self._state = self._state, state
+        self._generation += 1
+        self._probes = 0
+        self._probe_successes = 0
+
+        if state is CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+            logger.warning(
+                f"⚡ Circuit OPEN for {self.name} "
+                f"(was {previous.value}, retry in {self.config.open_seconds}s)"
+            )
+        elif state is CircuitState.CLOSED:
+            self._window.clear()
+            logger.info(f"✓ Circuit CLOSED for {self.name}")
+        else:
+            logger.info(f"⚙ Circuit HALF_OPEN for {self.name}, probing")
+
+
+# ============================================================================
+# Resilience Manager
+# ============================================================================
+
+class ResilienceManager:
+    """
+    Per-skill circuit breakers, AIMD limiters, and open-circuit fallback.
+
+    Pass None for breaker or limiter to disable that mechanism.
+    """
+
+    def __init__(
+        self,
+        breaker: BreakerConfig | None = BreakerConfig(),
+        limiter: LimiterConfig | None = LimiterConfig(),
+        fallback_cache: CacheBackend | None = None,
+        overrides: dict[str, tuple[BreakerConfig | None, LimiterConfig | None]]
+        | None = None
+    ):
+        """
+        Args:
+            breaker: Default breaker configuration
+            limiter: Default limiter configuration
+            fallback_cache: Stores each skill's successful results and
+                            serves them while its circuit is open
+            overrides: Per-skill (breaker, limiter) configurations
+        """
+        self.breaker_config = breaker
+        self.limiter_config = limiter
+        self.fallback_cache = fallback_cache
+        self.overrides = dict(overrides or {})
+
+        self._breakers: dict[str, CircuitBreaker | None] = {}
+        self._limiters: dict[str, AIMDLimiter | None] = {}
+        self._lock = threading.Lock()
+
+    # ========================================================================
+    # Public API
+    # ========================================================================
+
+    def breaker(self, skill_name: str) -> CircuitBreaker | None:
+        """The skill's breaker (created on first use), or None if disabled."""
+        try:
+            return self._breakers[skill_name]
+        except KeyError:
+            pass
+        with self._lock:
+            if skill_name not in self._breakers:
+                config = self.overrides.get(
+                    skill_name, (self.breaker_config, None)
+                )[0]
+                self._breakers[skill_name] = (
+                    CircuitBreaker(skill_name, config) if config else None
+                )
+            return self._breakers[skill_name]
+
+    def limiter(self, skill_name: str) -> AIMDLimiter | None:
+        """The skill's limiter (created on first use), or None if disabled."""
+        try:
+            return self._limiters[skill_name]
+        except KeyError:
+            pass
+        with self._lock:
+            if skill_name not in self._limiters:
+                config = self.overrides.get(
+                    skill_name, (None, self.limiter_config)
+                )[1]
+                self._limiters[skill_name] = (
+                    AIMDLimiter(skill_name, config) if config else None
+                )
+            return self._limiters[skill_name]
+
+    def record(
+        self,
+        skill_name: str,
+        context: AgentContext,
+        result: AgentResult,
+        latency_ms: float,
+        slot: LimiterSlot | None = None,
+        ticket: BreakerTicket | None = None
+    ) -> None:
+        """
+        Feed an outcome to the breaker and limiter; keep successes for
+        fallback.
+
+        REJECTED results say nothing about the skill's health: the slot
+        and any half-open probe are returned without learning from them.
+        """
+        if result.status == ResultStatus.REJECTED:
+            self.abandon(skill_name, slot, ticket)
+            return
+
+        if slot is not None:
+            slot.release(result.success, latency_ms)
+        if ticket is not None:
+            self.breaker(skill_name).record(ticket, result.success, latency_ms)
+
+        if (self.fallback_cache is not None and result.success
+                and not result.metadata.get("circuit_open")):
+            self.fallback_cache.put(self._fallback_key(skill_name, context),
+                                    result)
+
+    def abandon(
+        self,
+        skill_name: str,
+        slot: LimiterSlot | None = None,
+        ticket: BreakerTicket | None = None
+    ) -> None:
+        """Return the slot and probe of an admitted call that never finished."""
+        if slot is not None:
+            slot.release()
+        if ticket is not None:
+            self.breaker(skill_name).release_probe(ticket)
+
+    def fallback(self, skill_name: str, context: AgentContext) -> AgentResult:
+        """Result returned instead of calling a skill with an open circuit."""
+        if self.fallback_cache is not None:
+            cached = self.fallback_cache.get(
+                self._fallback_key(skill_name, context)
+            )
+            if cached is not None:
+                return cached.model_copy(update={"metadata": {
+                    **cached.metadata,
+                    "circuit_open": True,
+                    "fallback": "cache"
+                }})
+
+        return AgentResult.trusted(
+            status=ResultStatus.SKIPPED,
+            data=None,
+            message=f"Skipped {skill_name}: circuit open",
+            metadata={
+                "skill_name": skill_name,
+                "circuit_open": True,
+                "fallback": "skipped"
+            }
+        )
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Breaker state and concurrency limit per skill."""
+        with self._lock:
+            names = sorted(set(self._breakers) | set(self._limiters))
+        summary = {}
+        for name in names:
+            breaker = self._breakers.get(name)
+            limiter = self._limiters.get(name)
+            summary[name] = {
+                "circuit": breaker.state.value if breaker else None,
+                "limit": limiter.limit if limiter else None,
+                "in_flight": limiter.in_flight if limiter else None,
+            }
+        return summary
+
+    # ========================================================================
+    # Implementation (Private)
+    # ========================================================================
+
+    @staticmethod
+    def _fallback_key(skill_name: str, context: AgentContext) -> str:
+        return f"{skill_name}:{context.cache_key()}"
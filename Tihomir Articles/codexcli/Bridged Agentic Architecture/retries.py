@@ -0,0 +1,241 @@
+"""
+Retries: Backoff Policies with Jitter and Retry Budgets
+
+Decides whether and when a failed attempt runs again. The waiting itself
+is left to the caller, so each execution path can wait without holding
+a worker:
+- PriorityScheduler re-enqueues the task with a delay (no thread sleeps)
+- execute_task_async awaits asyncio.sleep
+- decorators.retry sleeps in-call (sync) or awaits (async skills)
+
+Single Responsibility: This module ONLY computes retry decisions. It
+never executes skills.
+
+Backoff:
+    Exponential, capped at max_delay_s, with jitter:
+    - "full":  uniform(0, backoff)          (default; best de-correlation)
+    - "equal": backoff/2 + uniform(0, backoff/2)
+    - "none":  backoff                      (deterministic)
+
+Retry Budget:
+    Every request deposits ``ratio`` tokens once, on its first attempt;
+    every retry withdraws one (retries themselves earn nothing).
+    Retries therefore stay below ``ratio`` of traffic once a failure
+    spreads, instead of multiplying load by max_attempts. A small
+    ``min_per_second`` allowance keeps low-traffic skills retryable.
+
+Usage:
+    orchestrator = AgentOrchestrator(
+        registry,
+        retry_policy=RetryPolicy(max_attempts=4, base_delay_s=0.05),
+        retry_budget=RetryBudget(ratio=0.1)
+    )
+"""
+
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Literal
+
+from .admission import TokenBucket
+from .protocols import AgentContext, AgentResult, ResultStatus
+
+
+# ============================================================================
+# Logging Configuration
+# ============================================================================
+
+logger = logging.getLogger(__name__)
+
+
+JitterMode = Literal["full", "equal", "none"]
+
+
+# ============================================================================
+# Domain Models
+# ============================================================================
+
+@dataclass(frozen=True)
+class RetryDecision:
+    """
+    Outcome of RetryPolicy.decide.
+
+    reason is set when retrying stops: "succeeded", "not_retryable",
+    "max_attempts", "deadline" or "budget".
+    """
+    retry: bool
+    delay_s: float = 0.0
+    reason: str | None = None
+
+
+@dataclass(frozen=True)
+class RetryBudgetStats:
+    """Point-in-time retry budget counters."""
+    requests: int
+    retries: int
+    exhausted: int
+    balance: float
+
+
+# ============================================================================
+# Retry Policy
+# ============================================================================
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Exponential backoff with jitter.
+
+    attempt numbers start at 1 (the first execution).
+    """
+    max_attempts: int = 3
+    base_delay_s: float = 0.1
+    max_delay_s: float = 10.0
+    jitter: JitterMode = "full"
+    retry_on: frozenset[ResultStatus] = frozenset({ResultStatus.FAILURE})
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError(f"max_attempts must be >= 1, got {self.max_attempts}")
+        if self.base_delay_s < 0 or self.max_delay_s < 0:
+            raise ValueError("Retry delays must be >= 0")
+        if self.jitter not in ("full", "equal", "none"):
+            raise ValueError(f"Unknown jitter mode: {self.jitter!r}")
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before the attempt after ``attempt``, with jitter applied."""
+        cap = min(self.max_delay_s, self.base_delay_s * (2 ** (attempt - 1)))
+        if self.jitter == "full":
+            return random.uniform(0.0, cap)
+        if self.jitter == "equal":
+            return cap / 2 + random.uniform(0.0, cap / 2)
+        return cap
+
+    def decide(
+        self,
+        result: AgentResult,
+        attempt: int,
+        context: AgentContext | None = None,
+        budget: "RetryBudget | None" = None
+    ) -> RetryDecision:
+        """
+        Whether to retry after ``attempt`` produced ``result``.
+
+        A retry is refused if the delay would overrun the context
+        deadline; the budget is only charged for retries that will
+        actually happen.
+        """
+        if result.success:
+            return RetryDecision(False, reason="succeeded")
+        if result.status not in self.retry_on:
+            return RetryDecision(False, reason="not_retryable")
+        if attempt >= self.max_attempts:
+            return RetryDecision(False, reason="max_attempts")
+
+        delay = self.backoff(attempt)
+
+        remaining = context.remaining() if context is not None else None
+        if remaining is not None and remaining <= delay:
+            return RetryDecision(False, reason="deadline")
+
+        if budget is not None and not budget.try_withdraw():
+            return RetryDecision(False, reason="budget")
+
+        return RetryDecision(True, delay_s=delay)
+
+
+# ============================================================================
+# Retry Budget
+# ============================================================================
+
+class RetryBudget:
+    """
+    Caps retries at a fraction of request volume.
+
+    Thread-safe; share one instance across everything that retries on
+    behalf of the same orchestrator.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        min_per_second: float = 1.0,
+        max_balance: float = 100.0
+    ):
+        """
+        Args:
+            ratio: Retries allowed per request (0.1: at most ~10% extra load)
+            min_per_second: Retries always allowed regardless of volume
+            max_balance: Cap on banked retry tokens, so a long healthy
+                         period cannot fund an unbounded retry burst
+        """
+        if ratio < 0:
+            raise ValueError(f"ratio must be >= 0, got {ratio}")
+        if min_per_second < 0:
+            raise ValueError(
+                f"min_per_second must be >= 0, got {min_per_second}"
+            )
+
+        self.ratio = ratio
+        self.max_balance = max_balance
+        self._allowance = (
+            TokenBucket(min_per_second, max(1.0, min_per_second))
+            if min_per_second > 0 else None
+        )
+        self._balance = 0.0
+        self._requests = 0
+        self._retries = 0
+        self._exhausted = 0
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """Record one new request; call on first attempts only."""
+        with self._lock:
+            self._requests += 1
+            self._balance = min(self.max_balance, self._balance + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        """Spend one retry token if available."""
+        with self._lock:
+            if self._balance >= 1.0:
+                self._balance -= 1.0
+            elif not (self._allowance is not None
+                      and self._allowance.take(time.monotonic())):
+                self._exhausted += 1
+                if self._exhausted == 1 or self._exhausted % 100 == 0:
+                    logger.warning(
+                        f"⚠ Retry budget exhausted "
+                        f"({self._exhausted} retries refused so far)"
+                    )
+                return False
+            self._retries += 1
+            return True
+
+    def stats(self) -> RetryBudgetStats:
+        """Snapshot budget counters."""
+        with self._lock:
+            return RetryBudgetStats(
+                requests=self._requests,
+                retries=self._retries,
+                exhausted=self._exhausted,
+                balance=self._balance
+            )
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def annotate_attempts(
+    result: AgentResult,
+    attempts: int,
+    decision: RetryDecision
+) -> AgentResult:
+    """Record retry bookkeeping on the final result of a retried task."""
+    if attempts > 1 or decision.reason in ("deadline", "budget"):
+        result.metadata["retry_attempts"] = attempts
+        if not result.success:
+            result.metadata["retry_stopped"] = decision.reason
+    return result
@@ -0,0 +1,463 @@
+"""
+Priority Scheduler: Weighted-Fair Dispatch Driven by TaskPriority
+
+Feeds a fixed pool of worker threads from per-priority queues so that
+CRITICAL and HIGH tasks do not wait behind long LOW batches, while LOW
+tasks are still guaranteed a share of the workers.
+
+Single Responsibility: The scheduler only decides WHEN and in WHICH ORDER
+tasks run. Execution itself is delegated to AgentOrchestrator.execute_task.
+
+Scheduling Model:
+- One FIFO queue per TaskPriority
+- Stride scheduling across queues: each priority advances a virtual
+  clock by 1/weight per dispatch, and the non-empty queue with the
+  smallest clock runs next. With default weights, contended LOW work
+  still receives 1/15 of dispatches—it can be delayed, never starved.
+- Reservations hold back worker slots for higher priorities, so a flood
+  of low-priority work cannot occupy every worker.
+- Retries (orchestrator.retry_policy): a failed attempt is parked on a
+  timer heap for its backoff delay and re-enqueued at its priority; no
+  worker sleeps while it waits. The task's future resolves only with
+  the final attempt.
+
+Usage:
+    with PriorityScheduler(orchestrator, workers=8) as scheduler:
+        future = scheduler.submit("analyze_data", context)
+        result = future.result()
+
+        # Also usable as a BatchExecutor
+        results = orchestrator.execute_batch(tasks, executor=scheduler)
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .executors import collect_batch_results
+from .protocols import AgentContext, AgentResult, TaskPriority
+from .retries import RetryPolicy, annotate_attempts
+
+if TYPE_CHECKING:
+    from .orchestrator import AgentOrchestrator
+
+
+# ============================================================================
+# Logging Configuration
+# ============================================================================
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Defaults
+# ============================================================================
+
+# Highest priority first; also used to break virtual-clock ties
+PRIORITY_ORDER: tuple[TaskPriority, ...] = (
+    TaskPriority.CRITICAL,
+    TaskPriority.HIGH,
+    TaskPriority.NORMAL,
+    TaskPriority.LOW,
+)
+
+DEFAULT_PRIORITY_WEIGHTS: dict[TaskPriority, int] = {
+    TaskPriority.CRITICAL: 8,
+    TaskPriority.HIGH: 4,
+    TaskPriority.NORMAL: 2,
+    TaskPriority.LOW: 1,
+}
+
+
+# ============================================================================
+# Domain Models
+# ============================================================================
+
+@dataclass
+class _QueuedTask:
+    """A task waiting in a priority queue."""
+    skill_name: str
+    context: AgentContext
+    future: Future
+    enqueued_at: float
+    attempt: int = 1
+    last_result: AgentResult | None = None
+
+
+@dataclass
+class PriorityStats:
+    """Queue and wait-time statistics for one priority level."""
+    queue_depth: int = 0
+    in_flight: int = 0
+    completed: int = 0
+    retried: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+
+    @property
+    def mean_wait_ms(self) -> float:
+        """Average time tasks spent queued before starting."""
+        return self.total_wait_ms / self.completed if self.completed else 0.0
+
+
+@dataclass
+class SchedulerMetrics:
+    """
+    Point-in-time snapshot of scheduler state.
+
+    Returned by PriorityScheduler.metrics(); safe to keep and compare.
+    """
+    workers: int
+    idle_workers: int
+    delayed: int = 0
+    by_priority: dict[TaskPriority, PriorityStats] = field(default_factory=dict)
+
+    @property
+    def queue_depth(self) -> int:
+        """Total number of queued (not yet started) tasks."""
+        return sum(s.queue_depth for s in self.by_priority.values())
+
+
+# ============================================================================
+# Priority Scheduler
+# ============================================================================
+
+class PriorityScheduler:
+    """
+    Priority queue feeding a worker pool with weighted-fair dequeueing.
+
+    Design Principles:
+    - SRP: Only ordering and dispatch; execution stays in the orchestrator
+    - OCP: Weights and reservations are configuration, not code
+    - LSP: Satisfies the BatchExecutor protocol for execute_batch
+
+    Thread Safety:
+        All queue state is guarded by a single Condition. Skills execute
+        outside the lock.
+    """
+
+    def __init__(
+        self,
+        orchestrator: AgentOrchestrator,
+        workers: int = 4,
+        weights: dict[TaskPriority, int] | None = None,
+        reservations: dict[TaskPriority, int] | None = None,
+        retry_policy: RetryPolicy | None = None
+    ):
+        """
+        Initialize the scheduler and start its worker threads.
+
+        Args:
+            orchestrator: Orchestrator that executes dequeued tasks
+            workers: Number of worker threads
+            weights: Relative dispatch share per priority
+                     (default: DEFAULT_PRIORITY_WEIGHTS)
+            reservations: Worker slots held back for a priority level.
+                          A task may only start if enough idle workers
+                          remain for every higher priority's unused
+                          reservation, e.g. {CRITICAL: 1, HIGH: 1}.
+            retry_policy: Backoff for failed attempts
+                          (default: orchestrator.retry_policy; retries
+                          draw on orchestrator.retry_budget)
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+
+        weights = {**DEFAULT_PRIORITY_WEIGHTS, **(weights or {})}
+        if any(w < 1 for w in weights.values()):
+            raise ValueError("Priority weights must be >= 1")
+
+        reservations = dict(reservations or {})
+        if sum(reservations.values()) >= workers:
+            raise ValueError(
+                f"Reservations ({sum(reservations.values())}) must leave "
+                f"at least one unreserved worker (workers={workers})"
+            )
+
+        self._orchestrator = orchestrator
+        self._workers = workers
+        self._reservations = reservations
+        self._retry_policy = retry_policy or orchestrator.retry_policy
+
+        # Stride scheduling: each dispatch advances the queue's pass
+        # by its stride; smallest pass runs next
+        self._strides = {p: 1.0 / weights[p] for p in PRIORITY_ORDER}
+        self._passes = {p: 0.0 for p in PRIORITY_ORDER}
+        self._virtual_time = 0.0
+
+        self._queues: dict[TaskPriority, deque[_QueuedTask]] = {
+            p: deque() for p in PRIORITY_ORDER
+        }
+        self._stats = {p: PriorityStats() for p in PRIORITY_ORDER}
+        # Retries waiting out their backoff: (ready_at, seq, task)
+        self._delayed: list[tuple[float, int, _QueuedTask]] = []
+        self._delay_seq = itertools.count()
+        self._running = 0
+        self._shutdown = False
+        self._condition = threading.Condition()
+
+        self._threads = [
+            threading.Thread(
+                target=self._worker_loop,
+                name=f"priority-worker-{i}",
+                daemon=True
+            )
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    # ========================================================================
+    # Public API
+    # ========================================================================
+
+    def submit(self, skill_name: str, context: AgentContext) -> Future:
+        """
+        Queue a task for execution at its context priority.
+
+        Returns:
+            Future resolving to the task's AgentResult. Cancelling the
+            future before a worker picks it up removes it from the run.
+        """
+        future: Future = Future()
+        task = _QueuedTask(skill_name, context, future, time.perf_counter())
+
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit to a shut-down scheduler")
+            self._enqueue(task)
+            self._condition.notify()
+
+        return future
+
+    def run_batch(
+        self,
+        orchestrator: AgentOrchestrator,
+        tasks: list[tuple[str, AgentContext]]
+    ) -> list[AgentResult]:
+        """
+        BatchExecutor protocol: schedule tasks and return ordered results.
+        """
+        if orchestrator is not self._orchestrator:
+            raise ValueError(
+                "PriorityScheduler is bound to a different orchestrator"
+            )
+
+        futures = {
+            self.submit(skill_name, context): index
+            for index, (skill_name, context) in enumerate(tasks)
+        }
+        return collect_batch_results(orchestrator, tasks, futures)
+
+    def metrics(self) -> SchedulerMetrics:
+        """
+        Snapshot queue depths, in-flight counts, and wait-time statistics.
+        """
+        with self._condition:
+            return SchedulerMetrics(
+                workers=self._workers,
+                idle_workers=self._workers - self._running,
+                delayed=len(self._delayed),
+                by_priority={
+                    p: PriorityStats(**vars(stats))
+                    for p, stats in self._stats.items()
+                }
+            )
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        """
+        Stop accepting tasks and let workers exit.
+
+        Args:
+            wait: Block until worker threads have finished
+            cancel_pending: Cancel queued tasks and pending retries
+                            instead of draining them
+        """
+        with self._condition:
+            self._shutdown = True
+            if cancel_pending:
+                for priority, queue in self._queues.items():
+                    while queue:
+                        queue.popleft().future.cancel()
+                    self._stats[priority].queue_depth = 0
+                # Retried futures are already running: settle them with
+                # the last failed attempt instead
+                while self._delayed:
+                    task = heapq.heappop(self._delayed)[2]
+                    task.future.set_result(task.last_result)
+            self._condition.notify_all()
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def __enter__(self) -> "PriorityScheduler":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+
+    # ========================================================================
+    # Scheduling Implementation (Private)
+    # ========================================================================
+
+    def _worker_loop(self) -> None:
+        """Take the next eligible task, run it, repeat until shutdown."""
+        while True:
+            with self._condition:
+                task = self._next_task()
+                while task is None:
+                    if (self._shutdown and not self._has_queued()
+                            and not self._delayed):
+                        return
+                    self._condition.wait(self._next_retry_in())
+                    task = self._next_task()
+
+            self._run(task)
+
+    def _next_task(self) -> _QueuedTask | None:
+        """
+        Pick the next task by stride order, respecting reservations.
+
+        Must be called with the condition held. Cancelled tasks are
+        discarded as they surface; retries whose delay has elapsed are
+        moved back into their queues first.
+        """
+        self._promote_due_retries()
+
+        idle = self._workers - self._running
+        if idle <= 0:
+            return None
+
+        candidates = sorted(
+            (p for p in PRIORITY_ORDER if self._queues[p]),
+            key=lambda p: (self._passes[p], PRIORITY_ORDER.index(p))
+        )
+
+        for priority in candidates:
+            if idle - self._reserved_above(priority) < 1:
+                continue
+
+            queue = self._queues[priority]
+            while queue:
+                task = queue.popleft()
+                self._stats[priority].queue_depth -= 1
+                # Retries were marked running on their first attempt
+                if task.attempt > 1 or task.future.set_running_or_notify_cancel():
+                    self._virtual_time = self._passes[priority]
+                    self._passes[priority] += self._strides[priority]
+                    self._stats[priority].in_flight += 1
+                    self._running += 1
+                    return task
+
+        return None
+
+    def _reserved_above(self, priority: TaskPriority) -> int:
+        """
+        Idle slots that must stay free for higher priorities.
+
+        A reservation only holds back slots not already used by tasks
+        of that priority.
+        """
+        rank = PRIORITY_ORDER.index(priority)
+        return sum(
+            max(0, self._reservations.get(p, 0) - self._stats[p].in_flight)
+            for p in PRIORITY_ORDER[:rank]
+        )
+
+    def _has_queued(self) -> bool:
+        return any(self._queues.values())
+
+    def _enqueue(self, task: _QueuedTask) -> None:
+        """Append to the task's priority queue (condition held)."""
+        priority = task.context.priority
+        if not self._queues[priority]:
+            # Re-entering contention: don't bank credit from idle time
+            self._passes[priority] = max(
+                self._passes[priority], self._virtual_time
+            )
+        self._queues[priority].append(task)
+        self._stats[priority].queue_depth += 1
+
+    def _promote_due_retries(self) -> None:
+        """Re-enqueue retries whose backoff has elapsed (condition held)."""
+        now = time.perf_counter()
+        while self._delayed and self._delayed[0][0] <= now:
+            task = heapq.heappop(self._delayed)[2]
+            task.enqueued_at = now
+            self._enqueue(task)
+
+    def _next_retry_in(self) -> float | None:
+        """Seconds until the earliest delayed retry (None: none pending)."""
+        if not self._delayed:
+            return None
+        return max(0.0, self._delayed[0][0] - time.perf_counter())
+
+    def _schedule_retry(self, task: _QueuedTask, result: AgentResult) -> bool:
+        """
+        Park a failed attempt for its backoff delay, if the policy allows.
+
+        Returns:
+            True if the task will run again (its future stays pending)
+        """
+        decision = self._retry_policy.decide(
+            result, task.attempt, task.context,
+            self._orchestrator.retry_budget
+        )
+        if not decision.retry:
+            annotate_attempts(result, task.attempt, decision)
+            return False
+
+        logger.warning(
+            f"⚠ Attempt {task.attempt} failed for {task.skill_name}, "
+            f"re-enqueueing in {decision.delay_s:.3f}s"
+        )
+        task.attempt += 1
+        task.last_result = result
+        with self._condition:
+            heapq.heappush(self._delayed, (
+                time.perf_counter() + decision.delay_s,
+                next(self._delay_seq),
+                task
+            ))
+            self._stats[task.context.priority].retried += 1
+            # Idle workers must re-arm their wait for the new timer
+            self._condition.notify_all()
+        return True
+
+    def _run(self, task: _QueuedTask) -> None:
+        """Execute a dequeued task and settle its future."""
+        priority = task.context.priority
+        wait_ms = (time.perf_counter() - task.enqueued_at) * 1000
+
+        metrics = self._orchestrator.metrics
+        if metrics is not None:
+            metrics.observe_queue_wait(task.skill_name, wait_ms)
+
+        try:
+            result = self._orchestrator.execute_task(
+                task.skill_name, task.context, task.attempt
+            )
+            result.metadata["queue_wait_ms"] = wait_ms
+            if not (self._retry_policy is not None
+                    and self._schedule_retry(task, result)):
+                task.future.set_result(result)
+        except BaseException as e:
+            task.future.set_exception(e)
+        finally:
+            with self._condition:
+                stats = self._stats[priority]
+                stats.in_flight -= 1
+                stats.completed += 1
+                stats.total_wait_ms += wait_ms
+                stats.max_wait_ms = max(stats.max_wait_ms, wait_ms)
+                self._running -= 1
+                self._condition.notify_all()
@@ -0,0 +1,587 @@
+"""
+Orchestrator Server: A Warm Registry and Orchestrator Behind a Socket
+
+Runs one long-lived SkillRegistry and AgentOrchestrator and serves
+execute_task and batch requests over a Unix domain socket or a local
+TCP port. Short-lived callers pay a connect and a round trip instead of
+skill discovery and imports.
+
+Single Responsibility: This module ONLY moves requests and results
+between connections and the orchestrator. Execution semantics (error
+containment, middleware, limits) are the orchestrator's.
+
+Wire Protocol (codec.py frames; one JSON object per frame):
+    Request:  {"id": 1, "op": "execute", "skill": "...", "context": {...}}
+              {"id": 2, "op": "batch", "tasks": [{"skill": ..., "context": ...}],
+               "max_concurrency": 10}
+              {"id": 3, "op": "skills"}
+              {"id": 4, "op": "ping"}
+    Response: {"id": 1, "ok": true, "result": {...}}
+              {"id": 2, "ok": true, "results": [...]}
+              {"id": 3, "ok": true, "skills": [...]}
+              {"id": 4, "ok": true}
+              {"id": n, "ok": false, "error": "..."}
+
+Connections:
+- Keep-alive: a connection serves any number of requests
+- Pipelining: clients may send requests without waiting; responses are
+  written as they complete (possibly out of order) and matched by id
+- Backpressure: at most max_pipeline requests per connection are in
+  flight; the server stops reading that connection until one finishes
+
+Usage:
+    python -m core.server skills/ --socket /tmp/agents.sock
+    python -m core.server skills/ --port 8765
+
+    with BlockingClient("/tmp/agents.sock") as client:
+        result = client.execute("analyze_data", AgentContext(task="stats"))
+
+    async with await Client.connect("/tmp/agents.sock") as client:
+        results = await asyncio.gather(*(client.execute(name, ctx) for ...))
+"""
+
+import argparse
+import asyncio
+import itertools
+import logging
+import os
+import signal
+import socket
+import sys
+from pathlib import Path
+from typing import Any
+
+from .codec import (
+    DEFAULT_MAX_FRAME_BYTES,
+    JSON_BACKEND,
+    FrameTooLarge,
+    context_to_dict,
+    encode_frame,
+    read_frame,
+    read_frame_blocking,
+    result_from_dict,
+    result_to_dict,
+    task_from_dict,
+)
+from .orchestrator import AgentOrchestrator
+from .protocols import AgentContext, AgentResult
+from .registry import SkillRegistry
+
+
+# ============================================================================
+# Logging Configuration
+# ============================================================================
+
+logger = logging.getLogger(__name__)
+
+
+# Unix socket path (str) or (host, port)
+Address = str | tuple[str, int]
+
+
+class ServerError(Exception):
+    """The server could not process a request (reported as ok=false)."""
+
+
+# ============================================================================
+# Server
+# ============================================================================
+
+class OrchestratorServer:
+    """
+    Serves an orchestrator over framed, pipelined connections.
+
+    Design Principles:
+    - Warm state: registry and orchestrator are built once per process
+    - Containment: a bad request yields an error response, a broken
+      connection closes only itself
+    - Bounded: per-connection in-flight limit and frame size limit
+    """
+
+    def __init__(
+        self,
+        orchestrator: AgentOrchestrator,
+        max_pipeline: int = 128,
+        max_frame_bytes: int = DEFAULT_MAX_FRAME_BYTES
+    ):
+        """
+        Args:
+            orchestrator: Orchestrator that executes requests
+            max_pipeline: Maximum in-flight requests per connection
+            max_frame_bytes: Largest accepted request frame
+        """
+        if max_pipeline < 1:
+            raise ValueError(f"max_pipeline must be >= 1, got {max_pipeline}")
+
+        self.orchestrator = orchestrator
+        self.max_pipeline = max_pipeline
+        self.max_frame_bytes = max_frame_bytes
+        self._server: asyncio.AbstractServer | None = None
+        self._unix_path: Path | None = None
+        self.connections = 0
+        self.requests = 0
+
+    # ========================================================================
+    # Lifecycle
+    # ========================================================================
+
+    async def start_unix(self, path: Path | str) -> None:
+        """Listen on a Unix domain socket (a stale socket file is replaced)."""
+        path = Path(path)
+        if path.is_socket():
+            path.unlink()
+        self._server = await asyncio.start_unix_server(
+            self._handle_connection, path=str(path)
+        )
+        self._unix_path = path
+        logger.info(f"🚀 Serving on unix:{path} (json={JSON_BACKEND})")
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 8765) -> None:
+        """Listen on a TCP port (loopback by default)."""
+        self._server = await asyncio.start_server(
+            self._handle_connection, host=host, port=port
+        )
+        bound = self._server.sockets[0].getsockname()
+        logger.info(
+            f"🚀 Serving on tcp:{bound[0]}:{bound[1]} (json={JSON_BACKEND})"
+        )
+
+    @property
+    def address(self) -> Address | None:
+        """Bound address (useful with port=0)."""
+        if self._server is None:
+            return None
+        if self._unix_path is not None:
+            return str(self._unix_path)
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return (host, port)
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            raise RuntimeError("Call start_unix() or start_tcp() first")
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop accepting connections and remove the socket file."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._unix_path is not None:
+            self._unix_path.unlink(missing_ok=True)
+            self._unix_path = None
+        logger.info(
+            f"✓ Server closed ({self.connections} connections, "
+            f"{self.requests} requests)"
+        )
+
+    # ========================================================================
+    # Connection Handling (Private)
+    # ========================================================================
+
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        _set_nodelay(writer)
+
+        slots = asyncio.Semaphore(self.max_pipeline)
+        write_lock = asyncio.Lock()
+        in_flight: set[asyncio.Task] = set()
+
+        try:
+            while True:
+                message = await read_frame(reader, self.max_frame_bytes)
+                if message is None:
+                    break
+
+                await slots.acquire()
+                self.requests += 1
+                task = asyncio.create_task(
+                    self._respond(message, writer, write_lock, slots)
+                )
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+
+        except (FrameTooLarge, ValueError) as e:
+            logger.warning(f"⚠ Closing connection after bad frame: {e}")
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass  # Peer went away
+
+        finally:
+            # Let pipelined requests that already started finish
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _respond(
+        self,
+        message: Any,
+        writer: asyncio.StreamWriter,
+        write_lock: asyncio.Lock,
+        slots: asyncio.Semaphore
+    ) -> None:
+        request_id = message.get("id") if isinstance(message, dict) else None
+        try:
+            try:
+                response = await self._dispatch(message)
+                frame = encode_frame(response)
+            except Exception as e:
+                frame = encode_frame({
+                    "id": request_id,
+                    "ok": False,
+                    "error": f"{type(e).__name__}: {e}"
+                })
+
+            async with write_lock:
+                writer.write(frame)
+                await writer.drain()
+
+        except ConnectionError:
+            pass  # Peer closed before reading its response
+        finally:
+            slots.release()
+
+    async def _dispatch(self, message: Any) -> dict[str, Any]:
+        if not isinstance(message, dict):
+            raise ValueError("Request must be a JSON object")
+
+        request_id = message.get("id")
+        op = message.get("op", "execute")
+
+        if op == "execute":
+            skill_name, context = task_from_dict(message)
+            result = await self.orchestrator.execute_task_async(
+                skill_name, context
+            )
+            return {"id": request_id, "ok": True, "result": result_to_dict(result)}
+
+        if op == "batch":
+            tasks = [task_from_dict(task) for task in message.get("tasks", ())]
+            results = await self.orchestrator.execute_batch_async(
+                tasks, max_concurrency=int(message.get("max_concurrency", 10))
+            )
+            return {
+                "id": request_id,
+                "ok": True,
+                "results": [result_to_dict(r) for r in results]
+            }
+
+        if op == "skills":
+            return {
+                "id": request_id,
+                "ok": True,
+                "skills": self.orchestrator.list_available_skills()
+            }
+
+        if op == "ping":
+            return {"id": request_id, "ok": True}
+
+        raise ValueError(f"Unknown op: {op!r}")
+
+
+# ============================================================================
+# Async Client
+# ============================================================================
+
+class Client:
+    """
+    Pipelined asyncio client. Safe to share across tasks: concurrent
+    calls are multiplexed over one connection and matched by request id.
+    """
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        max_frame_bytes: int = DEFAULT_MAX_FRAME_BYTES
+    ):
+        self._reader = reader
+        self._writer = writer
+        self._max_frame_bytes = max_frame_bytes
+        self._ids = itertools.count(1)
+        self._pending: dict[int, asyncio.Future] = {}
+        self._write_lock = asyncio.Lock()
+        self._read_task = asyncio.create_task(self._read_loop())
+
+    @classmethod
+    async def connect(cls, address: Address, **kwargs: Any) -> "Client":
+        """Connect to a Unix socket path or a (host, port) pair."""
+        if isinstance(address, str):
+            reader, writer = await asyncio.open_unix_connection(address)
+        else:
+            reader, writer = await asyncio.open_connection(*address)
+            _set_nodelay(writer)
+        return cls(reader, writer, **kwargs)
+
+    # ========================================================================
+    # Public API
+    # ========================================================================
+
+    async def execute(
+        self,
+        skill_name: str,
+        context: AgentContext | None = None
+    ) -> AgentResult:
+        response = await self._request(_execute_message(skill_name, context))
+        return result_from_dict(response["result"])
+
+    async def execute_batch(
+        self,
+        tasks: list[tuple[str, AgentContext]],
+        max_concurrency: int = 10
+    ) -> list[AgentResult]:
+        response = await self._request(_batch_message(tasks, max_concurrency))
+        return [result_from_dict(r) for r in response["results"]]
+
+    async def list_skills(self) -> list[str]:
+        return (await self._request({"op": "skills"}))["skills"]
+
+    async def ping(self) -> None:
+        await self._request({"op": "ping"})
+
+    async def close(self) -> None:
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+        await asyncio.gather(self._read_task, return_exceptions=True)
+
+    async def __aenter__(self) -> "Client":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    # ========================================================================
+    # Implementation (Private)
+    # ========================================================================
+
+    async def _request(self, message: dict[str, Any]) -> dict[str, Any]:
+        if self._read_task.done():
+            raise ConnectionError("Connection to server is closed")
+
+        request_id = next(self._ids)
+        message["id"] = request_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+
+        try:
+            async with self._write_lock:
+                self._writer.write(encode_frame(message))
+                await self._writer.drain()
+            response = await future
+        finally:
+            self._pending.pop(request_id, None)
+
+        if not response.get("ok"):
+            raise ServerError(response.get("error", "unknown error"))
+        return response
+
+    async def _read_loop(self) -> None:
+        error: BaseException = ConnectionError("Server closed the connection")
+        try:
+            while True:
+                response = await read_frame(self._reader, self._max_frame_bytes)
+                if response is None:
+                    break
+                future = self._pending.get(response.get("id"))
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except Exception as e:
+            error = e
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+
+
+# ============================================================================
+# Blocking Client
+# ============================================================================
+
+class BlockingClient:
+    """
+    Minimal synchronous client for scripts and short-lived CLIs.
+
+    One request at a time; no event loop is started.
+    """
+
+    def __init__(
+        self,
+        address: Address,
+        timeout: float | None = None,
+        max_frame_bytes: int = DEFAULT_MAX_FRAME_BYTES
+    ):
+        if isinstance(address, str):
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock.settimeout(timeout)
+        self._sock.connect(address)
+        self._max_frame_bytes = max_frame_bytes
+        self._ids = itertools.count(1)
+
+    def execute(
+        self,
+        skill_name: str,
+        context: AgentContext | None = None
+    ) -> AgentResult:
+        response = self._request(_execute_message(skill_name, context))
+        return result_from_dict(response["result"])
+
+    def execute_batch(
+        self,
+        tasks: list[tuple[str, AgentContext]],
+        max_concurrency: int = 10
+    ) -> list[AgentResult]:
+        response = self._request(_batch_message(tasks, max_concurrency))
+        return [result_from_dict(r) for r in response["results"]]
+
+    def list_skills(self) -> list[str]:
+        return self._request({"op": "skills"})["skills"]
+
+    def ping(self) -> None:
+        self._request({"op": "ping"})
+
+    def close(self) -> None:
+        self._sock.close()
+
+    def __enter__(self) -> "BlockingClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _request(self, message: dict[str, Any]) -> dict[str, Any]:
+        message["id"] = next(self._ids)
+        self._sock.sendall(encode_frame(message))
+        response = read_frame_blocking(self._sock, self._max_frame_bytes)
+        if response is None:
+            raise ConnectionError("Server closed the connection")
+        if not response.get("ok"):
+            raise ServerError(response.get("error", "unknown error"))
+        return response
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def _execute_message(
+    skill_name: str,
+    context: AgentContext | None
+) -> dict[str, Any]:
+    message: dict[str, Any] = {"op": "execute", "skill": skill_name}
+    if context is not None:
+        message["context"] = context_to_dict(context)
+    return message
+
+
+def _batch_message(
+    tasks: list[tuple[str, AgentContext]],
+    max_concurrency: int
+) -> dict[str, Any]:
+    return {
+        "op": "batch",
+        "max_concurrency": max_concurrency,
+        "tasks": [
+            {"skill": skill_name, "context": context_to_dict(context)}
+            for skill_name, context in tasks
+        ]
+    }
+
+
+def _set_nodelay(writer: asyncio.StreamWriter) -> None:
+    sock = writer.get_extra_info("socket")
+    if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+# ============================================================================
+# Entry Point
+# ============================================================================
+
+async def serve(
+    orchestrator: AgentOrchestrator,
+    socket_path: Path | str | None = None,
+    host: str = "127.0.0.1",
+    port: int | None = None,
+    max_pipeline: int = 128
+) -> None:
+    """Serve until SIGINT/SIGTERM."""
+    server = OrchestratorServer(orchestrator, max_pipeline=max_pipeline)
+    if socket_path is not None:
+        await server.start_unix(socket_path)
+    else:
+        await server.start_tcp(host, 8765 if port is None else port)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # pragma: no cover - Windows
+            pass
+
+    try:
+        await stop.wait()
+    finally:
+        await server.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m core.server",
+        description="Serve a warm skill registry and orchestrator."
+    )
+    parser.add_argument("skills_dir", type=Path, help="Skills directory")
+    where = parser.add_mutually_exclusive_group(required=True)
+    where.add_argument("--socket", type=Path, help="Unix domain socket path")
+    where.add_argument("--port", type=int, help="TCP port")
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="TCP bind address (default: 127.0.0.1)"
+    )
+    parser.add_argument(
+        "--max-pipeline",
+        type=int,
+        default=128,
+        help="In-flight requests per connection (default: 128)"
+    )
+    parser.add_argument(
+        "--log-tasks",
+        action="store_true",
+        help="Log every execution (off by default for throughput)"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=os.environ.get("LOG_LEVEL", "INFO"),
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+
+    registry = SkillRegistry(args.skills_dir)
+    orchestrator = AgentOrchestrator(registry, enable_logging=args.log_tasks)
+
+    asyncio.run(serve(
+        orchestrator,
+        socket_path=args.socket,
+        host=args.host,
+        port=args.port,
+        max_pipeline=args.max_pipeline
+    ))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,382 @@
+"""
+Skill Index: Sorted Names, Prefix/Tag Lookup and Typo Suggestions
+
+Incrementally maintained lookup structures behind SkillRegistry, so that
+listing skills and answering "did you mean ...?" on a miss stay cheap
+with tens of thousands of registered skills.
+
+Single Responsibility: This module ONLY indexes skill names (and tags).
+It never loads or executes skills.
+
+Structures:
+- Sorted name array: additions are buffered and merged on the next read
+  (one timsort over pre-sorted runs), so bulk discovery is not O(N^2).
+  Reads return a cached immutable snapshot.
+- Prefix lookup: bisect into the sorted array, O(log N + k)
+- Tag lookup: tag -> names
+- Trigram index: padded 3-grams -> names, used as an exact filter for
+  edit-distance suggestions (q-gram count lemma: a name within edit
+  distance d of the query shares at least |grams(query)| - 4d grams;
+  only the rarest posting lists are scanned)
+
+Suggestions:
+    1. Names starting with the query ("analyze" -> "analyze_data")
+    2. Names the query starts with ("analyze_data_v2" -> "analyze_data")
+    3. Names within a small edit distance, closest first
+    Results are memoized per query until the index changes, so a storm
+    of identical typos costs one computation.
+
+Usage:
+    index = SkillIndex()
+    index.add("analyze_data", tags=["analytics"])
+    index.suggest("analyse_data")        # ['analyze_data']
+    index.with_prefix("analy")           # ['analyze_data']
+    index.with_tag("analytics")          # ['analyze_data']
+"""
+
+import threading
+from bisect import bisect_left
+from collections import Counter
+from typing import Iterable
+
+
+# Memoized suggestion results kept per index
+_SUGGESTION_CACHE_SIZE = 1024
+
+# Trigrams a single edit can destroy (an adjacent transposition touches 4)
+_GRAMS_PER_EDIT = 4
+
+
+# ============================================================================
+# Skill Index
+# ============================================================================
+
+class SkillIndex:
+    """
+    Name index with prefix, tag and fuzzy lookup.
+
+    Thread-safe. Names are case-sensitive; suggestions compare
+    case-insensitively.
+    """
+
+    def __init__(self, names: Iterable[str] = ()):
+        self._names: set[str] = set()
+        self._sorted: list[str] = []
+        self._pending: list[str] = []
+        self._snapshot: tuple[str, ...] | None = ()
+        self._tags: dict[str, set[str]] = {}
+        self._name_tags: dict[str, frozenset[str]] = {}
+        self._grams: dict[str, set[str]] = {}
+        self._by_length: dict[int, set[str]] = {}
+        self._suggestions: dict[tuple[str, int, int], list[str]] = {}
+        self._lock = threading.RLock()
+
+        for name in names:
+            self.add(name)
+
+    # ========================================================================
+    # Maintenance
+    # ========================================================================
+
+    def add(self, name: str, tags: Iterable[str] = ()) -> None:
+        """Index a name (re-adding replaces its tags)."""
+        with self._lock:
+            self._suggestions.clear()
+
+            if name not in self._names:
+                self._names.add(name)
+                if (not self._pending and
+                        (not self._sorted or name > self._sorted[-1])):
+                    self._sorted.append(name)
+                else:
+                    self._pending.append(name)
+                self._snapshot = None
+
+                key = name.lower()
+                for gram in _trigrams(key):
+                    self._grams.setdefault(gram, set()).add(name)
+                self._by_length.setdefault(len(key), set()).add(name)
+
+            self._set_tags(name, frozenset(tags))
+
+    def remove(self, name: str) -> bool:
+        """
+        Drop a name from the index.
+
+        Returns:
+            True if the name was indexed
+        """
+        with self._lock:
+            if name not in self._names:
+                return False
+
+            self._suggestions.clear()
+            self._names.discard(name)
+            self._merge_pending()
+            del self._sorted[bisect_left(self._sorted, name)]
+            self._snapshot = None
+
+            key = name.lower()
+            for gram in _trigrams(key):
+                _discard(self._grams, gram, name)
+            _discard(self._by_length, len(key), name)
+            self._set_tags(name, frozenset())
+            return True
+
+    # ========================================================================
+    # Lookup
+    # ========================================================================
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def names(self) -> tuple[str, ...]:
+        """
+        All names, sorted.
+
+        Performance: O(1) while the index is unchanged (shared snapshot)
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is None:
+                self._merge_pending()
+                self._snapshot = tuple(self._sorted)
+            return self._snapshot
+
+    def with_prefix(self, prefix: str, limit: int | None = None) -> list[str]:
+        """Names starting with prefix, sorted. O(log N + k)."""
+        names = self.names()
+        start = bisect_left(names, prefix)
+        stop = len(names) if limit is None else min(len(names), start + limit)
+        end = start
+        while end < stop and names[end].startswith(prefix):
+            end += 1
+        return list(names[start:end])
+
+    def with_tag(self, tag: str) -> list[str]:
+        """Names declaring tag, sorted."""
+        with self._lock:
+            return sorted(self._tags.get(tag, ()))
+
+    def tags(self) -> list[str]:
+        """All known tags, sorted."""
+        with self._lock:
+            return sorted(self._tags)
+
+    def suggest(
+        self,
+        query: str,
+        limit: int = 3,
+        max_distance: int | None = None
+    ) -> list[str]:
+        """
+        Names similar to query (see module docstring for ranking).
+
+        Args:
+            query: Unknown name, typically a typo
+            limit: Maximum suggestions
+            max_distance: Largest edit distance considered (default:
+                          1, or 2 for queries of 8+ characters)
+        """
+        if max_distance is None:
+            max_distance = min(2, max(1, len(query) // 4))
+
+        cache_key = (query, limit, max_distance)
+        with self._lock:
+            cached = self._suggestions.get(cache_key)
+            if cached is not None:
+                return list(cached)
+
+            suggestions = self._compute_suggestions(query, limit, max_distance)
+
+            if len(self._suggestions) >= _SUGGESTION_CACHE_SIZE:
+                self._suggestions.clear()
+            self._suggestions[cache_key] = suggestions
+            return list(suggestions)
+
+    # ========================================================================
+    # Implementation (Private)
+    # ========================================================================
+
+    def _merge_pending(self) -> None:
+        if self._pending:
+            # Timsort merges the two sorted runs in near-linear time
+            self._pending.sort()
+            self._sorted.extend(self._pending)
+            self._sorted.sort()
+            self._pending.clear()
+
+    def _set_tags(self, name: str, tags: frozenset[str]) -> None:
+        for tag in self._name_tags.pop(name, frozenset()) - tags:
+            _discard(self._tags, tag, name)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(name)
+        if tags:
+            self._name_tags[name] = tags
+
+    def _compute_suggestions(
+        self,
+        query: str,
+        limit: int,
+        max_distance: int
+    ) -> list[str]:
+        suggestions: list[str] = []
+        seen: set[str] = set()
+
+        def take(names: Iterable[str]) -> bool:
+            for name in names:
+                if name != query and name not in seen:
+                    seen.add(name)
+                    suggestions.append(name)
+                    if len(suggestions) >= limit:
+                        return True
+            return False
+
+        # 1. Completions of the query
+        if query and take(self.with_prefix(query, limit + 1)):
+            return suggestions
+
+        # 2. Names the query extends, longest first
+        if take(query[:end] for end in range(len(query) - 1, 0, -1)
+                if query[:end] in self._names):
+            return suggestions
+
+        # 3. Edit-distance neighbours
+        key = query.lower()
+        ranked = []
+        for name in self._candidates(key, max_distance):
+            distance = bounded_edit_distance(key, name.lower(), max_distance)
+            if distance is not None:
+                ranked.append((distance, name))
+        ranked.sort()
+        take(name for _, name in ranked)
+        return suggestions
+
+    def _candidates(self, key: str, max_distance: int) -> Iterable[str]:
+        """Names that may be within max_distance of key (no false negatives)."""
+        grams = _trigrams(key)
+        required = len(grams) - _GRAMS_PER_EDIT * max_distance
+
+        if required <= 0:
+            # Too short for the gram filter: fall back to a length window
+            return [
+                name
+                for length in range(len(key) - max_distance,
+                                    len(key) + max_distance + 1)
+                for name in self._by_length.get(length, ())
+            ]
+
+        # A qualifying name must appear in at least one of the rarest
+        # len(grams) - required + 1 posting lists; count only those
+        postings = sorted(
+            (self._grams.get(gram, frozenset()) for gram in grams), key=len
+        )
+        split = len(postings) - required + 1
+        counts: Counter[str] = Counter()
+        for names in postings[:split]:
+            counts.update(names)
+        for names in postings[split:]:
+            counts.update(names.intersection(counts))
+        return [name for name, count in counts.items() if count >= required]
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def _trigrams(text: str) -> set[str]:
+    """Padded trigrams (two leading, one trailing boundary marker)."""
+    padded = f"\0\0{text}\0"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _discard(index: dict, key, name: str) -> None:
+    """Remove name from a postings set, dropping the set once empty."""
+    names = index.get(key)
+    if names is not None:
+        names.discard(name)
+        if not names:
+            del index[key]
+
+
+def bounded_edit_distance(a: str, b: str, max_distance: int) -> int | None:
+    """
+    Edit distance between a and b if it is <= max_distance.
+
+    Optimal string alignment distance: insertions, deletions,
+    substitutions and adjacent transpositions ("ecoh" -> "echo") each
+    cost 1. Shared prefixes and suffixes are skipped and only the
+    diagonal band of width 2 * max_distance + 1 is computed.
+
+    Returns:
+        The distance, or None as soon as it is known to exceed the bound
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+
+    start = 0
+    shortest = min(len(a), len(b))
+    while start < shortest and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < shortest - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    a = a[start:len(a) - end]
+    b = b[start:len(b) - end]
+
+    if len(a) > len(b):
+        a, b = b, a
+    if not a:
+        return len(b) if len(b) <= max_distance else None
+
+    # Each edit changes at most one character in each direction, so the
+    # character multiset difference bounds the distance from below
+    difference = Counter(a)
+    difference.subtract(b)
+    surplus = sum(count for count in difference.values() if count > 0)
+    if max(surplus, surplus + len(b) - len(a)) > max_distance:
+        return None
+
+    # Cells outside the band exceed the bound; clamp them to "too far"
+    too_far = max_distance + 1
+    width = len(a)
+    before = None
+    previous = [j if j <= max_distance else too_far for j in range(width + 1)]
+    previous_min = 0
+
+    for i in range(1, len(b) + 1):
+        char_b = b[i - 1]
+        current = [too_far] * (width + 1)
+        if i <= max_distance:
+            current[0] = i
+        row_min = current[0]
+
+        for j in range(max(1, i - max_distance), min(width, i + max_distance) + 1):
+            char_a = a[j - 1]
+            cost = previous[j - 1] + (char_a != char_b)
+            if previous[j] + 1 < cost:
+                cost = previous[j] + 1
+            if current[j - 1] + 1 < cost:
+                cost = current[j - 1] + 1
+            if (before is not None and j > 1 and char_a == b[i - 2]
+                    and a[j - 2] == char_b and before[j - 2] + 1 < cost):
+                cost = before[j - 2] + 1
+            if cost > too_far:
+                cost = too_far
+            current[j] = cost
+            if cost < row_min:
+                row_min = cost
+
+        # Transpositions reach back two rows, so both must exceed the bound
+        if row_min > max_distance and previous_min > max_distance:
+            return None
+        before, previous, previous_min = previous, current, row_min
+
+    distance = previous[width]
+    return distance if distance <= max_distance else None
@@ -0,0 +1,47 @@
+"""
+Test configuration: make this checkout importable as the core package.
+
+The framework modules live at the top of this directory and import each
+other relatively, as the core/ package of a project (see README). When
+the checkout is not itself named core/ (or sits in no such project),
+register it under that name so `from core.protocols import ...` works
+from any working directory.
+
+Fixtures:
+    make_registry: Write skill modules to a temporary directory and
+                   return a SkillRegistry over them
+"""
+
+import sys
+import textwrap
+import types
+from pathlib import Path
+
+import pytest
+
+CORE_DIR = Path(__file__).resolve().parent.parent
+
+try:
+    import core  # noqa: F401 - the real package, when one is importable
+except ImportError:
+    core = types.ModuleType("core")
+    core.__path__ = [str(CORE_DIR)]
+    sys.modules["core"] = core
+
+
+@pytest.fixture
+def make_registry(tmp_path):
+    """
+    make_registry(name=source, ...) -> SkillRegistry
+
+    Module-level state of a skill is reachable through
+    registry.get_skill(name).__globals__.
+    """
+    from core.registry import SkillRegistry
+
+    def make(**skills: str) -> SkillRegistry:
+        for name, source in skills.items():
+            (tmp_path / f"{name}.py").write_text(textwrap.dedent(source))
+        return SkillRegistry(tmp_path)
+
+    return make
@@ -0,0 +1,172 @@
+"""
+Admission control tests: token buckets, concurrency caps and rejection.
+"""
+
+import threading
+import time
+
+import pytest
+
+from core.admission import (
+    AdmissionController,
+    AdmissionRejected,
+    Limit,
+    TokenBucket,
+)
+from core.orchestrator import AgentOrchestrator
+from core.protocols import AgentContext, ResultStatus
+
+# Blocks until the test sets the gate
+BLOCKER = """
+    import threading
+    from core.protocols import AgentContext, AgentResult, ResultStatus
+
+    gate = threading.Event()
+
+    def execute(context: AgentContext) -> AgentResult:
+        gate.wait(5)
+        return AgentResult(status=ResultStatus.SUCCESS, message="ok")
+"""
+
+
+def tenant(name: str) -> AgentContext:
+    return AgentContext(task="t", metadata={"tenant": name})
+
+
+class TestTokenBucket:
+    """Refill arithmetic with explicit time."""
+
+    def test_bursts_then_refills_at_rate(self):
+        bucket = TokenBucket(rate=10, capacity=2, now=0.0)
+        assert bucket.take(0.0) and bucket.take(0.0)
+        assert not bucket.take(0.0)
+        assert bucket.wait_time(0.0) == pytest.approx(0.1)
+
+        assert bucket.take(0.1)
+        assert bucket.wait_time(10.0) == 0.0
+        assert bucket.tokens == 2  # Capped at capacity
+
+
+class TestAdmissionController:
+    """Permits under skill and tenant limits."""
+
+    def test_rate_limit_rejects_when_no_token_arrives_in_time(self):
+        controller = AdmissionController(
+            skill_limits={"s": Limit(rate_per_second=1, burst=2)},
+            queue_timeout_s=0.05
+        )
+        context = AgentContext(task="t")
+        controller.acquire("s", context).release()
+        controller.acquire("s", context).release()
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            controller.acquire("s", context)
+        assert rejected.value.retry_after_s == pytest.approx(1.0, abs=0.05)
+        assert controller.stats().rejected == 1
+
+    def test_short_token_wait_is_queued(self):
+        controller = AdmissionController(
+            skill_limits={"s": Limit(rate_per_second=50, burst=1)},
+            queue_timeout_s=1.0
+        )
+        context = AgentContext(task="t")
+        controller.acquire("s", context).release()
+
+        start = time.perf_counter()
+        controller.acquire("s", context).release()
+        assert 0.01 < time.perf_counter() - start < 0.5
+        assert controller.stats().queued == 1
+
+    def test_concurrency_slot_is_handed_to_a_waiter(self):
+        controller = AdmissionController(
+            skill_limits={"s": Limit(max_concurrency=1)}, queue_timeout_s=2.0
+        )
+        context = AgentContext(task="t")
+        permit = controller.acquire("s", context)
+        assert controller.try_acquire("s", context) is None
+
+        threading.Timer(0.05, permit.release).start()
+        with controller.acquire("s", context):
+            assert controller.stats().in_flight == 1
+        assert controller.stats().in_flight == 0
+
+    def test_full_queue_rejects_immediately(self):
+        controller = AdmissionController(
+            skill_limits={"s": Limit(max_concurrency=1)},
+            max_queue=0, queue_timeout_s=5.0
+        )
+        context = AgentContext(task="t")
+        with controller.acquire("s", context):
+            start = time.perf_counter()
+            with pytest.raises(AdmissionRejected, match="queue full"):
+                controller.acquire("s", context)
+            assert time.perf_counter() - start < 0.5
+
+    def test_tenants_are_limited_separately(self):
+        controller = AdmissionController(
+            default_tenant_limit=Limit(max_concurrency=1), max_queue=0
+        )
+        held = controller.acquire("s", tenant("a"))
+        assert controller.try_acquire("s", tenant("a")) is None
+        assert controller.try_acquire("s", tenant("b")) is not None
+        # Tasks without a tenant are only skill-limited
+        assert controller.try_acquire("s", AgentContext(task="t")) is not None
+        held.release()
+
+    def test_permit_needs_every_gate(self):
+        controller = AdmissionController(
+            skill_limits={"s": Limit(max_concurrency=2)},
+            default_tenant_limit=Limit(max_concurrency=1),
+            max_queue=0
+        )
+        controller.acquire("s", tenant("a"))
+        assert controller.try_acquire("s", tenant("a")) is None
+        controller.acquire("s", tenant("b"))
+        # Skill cap reached even though tenant c is idle
+        assert controller.try_acquire("s", tenant("c")) is None
+
+    def test_release_is_idempotent(self):
+        controller = AdmissionController(
+            skill_limits={"s": Limit(max_concurrency=1)}
+        )
+        permit = controller.acquire("s", AgentContext(task="t"))
+        permit.release()
+        permit.release()
+        assert controller.stats().in_flight == 0
+
+    def test_rejects_invalid_limits(self):
+        with pytest.raises(ValueError):
+            Limit(rate_per_second=0)
+        with pytest.raises(ValueError):
+            AdmissionController(max_queue=-1)
+
+
+class TestOrchestratorAdmission:
+    """REJECTED results through the orchestrator."""
+
+    def test_over_limit_task_is_rejected(self, make_registry):
+        registry = make_registry(blocker=BLOCKER)
+        gate = registry.get_skill("blocker").__globals__["gate"]
+        orchestrator = AgentOrchestrator(registry, admission=AdmissionController(
+            skill_limits={"blocker": Limit(max_concurrency=1)}, max_queue=0
+        ))
+
+        first = threading.Thread(
+            target=orchestrator.execute_task,
+            args=("blocker", AgentContext(task="t"))
+        )
+        first.start()
+        try:
+            deadline = time.monotonic() + 5
+            while orchestrator.admission.stats().in_flight == 0:
+                assert time.monotonic() < deadline
+                time.sleep(0.005)
+
+            result = orchestrator.execute_task("blocker", AgentContext(task="t"))
+            assert result.status == ResultStatus.REJECTED
+            assert "reason" in result.error_details
+        finally:
+            gate.set()
+            first.join(5)
+
+        assert orchestrator.execute_task("blocker", AgentContext(task="t")).success
@@ -0,0 +1,120 @@
+"""
+Concurrent batch execution tests: ordering, concurrency cap, critical abort.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from core.orchestrator import AgentOrchestrator
+from core.protocols import AgentContext, ResultStatus, TaskPriority
+
+# Sleeps for parameters["delay"] and tracks how many calls overlap
+SLEEPER = """
+    import asyncio
+    from core.protocols import AgentContext, AgentResult, ResultStatus
+
+    running = 0
+    peak = 0
+
+    async def execute(context: AgentContext) -> AgentResult:
+        global running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            await asyncio.sleep(context.parameters.get("delay", 0.0))
+        finally:
+            running -= 1
+        return AgentResult(
+            status=ResultStatus.SUCCESS, data=context.task, message="ok"
+        )
+"""
+
+SYNC_SLEEPER = """
+    import time
+    from core.protocols import AgentContext, AgentResult, ResultStatus
+
+    def execute(context: AgentContext) -> AgentResult:
+        time.sleep(context.parameters.get("delay", 0.0))
+        return AgentResult(
+            status=ResultStatus.SUCCESS, data=context.task, message="ok"
+        )
+"""
+
+FAILS = """
+    from core.protocols import AgentContext, AgentResult, ResultStatus
+
+    async def execute(context: AgentContext) -> AgentResult:
+        return AgentResult(status=ResultStatus.FAILURE, message="down")
+"""
+
+
+def task(skill_name: str, name: str, delay: float = 0.0, **fields):
+    return skill_name, AgentContext(task=name, parameters={"delay": delay}, **fields)
+
+
+class TestExecuteBatchAsync:
+    """execute_batch_async."""
+
+    def test_results_follow_input_order(self, make_registry):
+        orchestrator = AgentOrchestrator(
+            make_registry(sleeper=SLEEPER, sync_sleeper=SYNC_SLEEPER)
+        )
+        # Earlier tasks finish last
+        tasks = [
+            task("sleeper" if i % 2 else "sync_sleeper", f"t{i}", 0.05 - i * 0.01)
+            for i in range(5)
+        ]
+        results = asyncio.run(orchestrator.execute_batch_async(tasks))
+        assert [r.data for r in results] == [f"t{i}" for i in range(5)]
+
+    def test_runs_concurrently_up_to_the_cap(self, make_registry):
+        registry = make_registry(sleeper=SLEEPER)
+        orchestrator = AgentOrchestrator(registry)
+        tasks = [task("sleeper", f"t{i}", 0.05) for i in range(12)]
+
+        start = time.perf_counter()
+        results = asyncio.run(
+            orchestrator.execute_batch_async(tasks, max_concurrency=4)
+        )
+        elapsed = time.perf_counter() - start
+
+        assert all(r.success for r in results)
+        assert registry.get_skill("sleeper").__globals__["peak"] == 4
+        # Three waves of four, not twelve calls in a row
+        assert elapsed < 12 * 0.05
+
+    def test_critical_failure_skips_outstanding_tasks(self, make_registry):
+        orchestrator = AgentOrchestrator(
+            make_registry(sleeper=SLEEPER, fails=FAILS)
+        )
+        tasks = [
+            task("sleeper", "slow", 5.0),
+            task("fails", "critical", priority=TaskPriority.CRITICAL),
+            task("sleeper", "fast", 0.0),
+        ]
+
+        start = time.perf_counter()
+        results = asyncio.run(orchestrator.execute_batch_async(tasks))
+
+        assert time.perf_counter() - start < 2.0
+        assert len(results) == 3
+        assert results[0].status == ResultStatus.SKIPPED
+        assert results[1].status == ResultStatus.FAILURE
+        assert results[2].success
+
+    def test_non_critical_failure_does_not_abort(self, make_registry):
+        orchestrator = AgentOrchestrator(
+            make_registry(sleeper=SLEEPER, fails=FAILS)
+        )
+        tasks = [task("fails", "f"), task("sleeper", "s", 0.02)]
+        results = asyncio.run(orchestrator.execute_batch_async(tasks))
+        assert [r.status for r in results] == [
+            ResultStatus.FAILURE, ResultStatus.SUCCESS
+        ]
+
+    def test_rejects_invalid_concurrency(self, make_registry):
+        orchestrator = AgentOrchestrator(make_registry(sleeper=SLEEPER))
+        with pytest.raises(ValueError):
+            asyncio.run(orchestrator.execute_batch_async([], max_concurrency=0))
@@ -0,0 +1,130 @@
+"""
+Batch runner tests: ordered and as-completed output, invalid lines, CLI.
+"""
+
+import asyncio
+import io
+import json
+
+import pytest
+
+from core.batch_runner import main, run_jsonl
+from core.orchestrator import AgentOrchestrator
+
+# Echoes its task after an async sleep of parameters["delay"]; tracks
+# how many tasks run at once
+ECHO = """
+    import asyncio
+    from core.protocols import AgentContext, AgentResult, ResultStatus
+
+    running = 0
+    peak = 0
+
+    async def execute(context: AgentContext) -> AgentResult:
+        global running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            await asyncio.sleep(context.parameters.get("delay", 0.0))
+        finally:
+            running -= 1
+        status = context.parameters.get("status", "success")
+        return AgentResult(
+            status=ResultStatus(status), data=context.task, message=status
+        )
+"""
+
+
+def task_line(name: str, delay: float = 0.0, **parameters) -> str:
+    return json.dumps({
+        "skill": "echo",
+        "context": {"task": name, "parameters": {"delay": delay, **parameters}},
+    })
+
+
+def run(orchestrator, lines: list[str], **options):
+    source = io.BytesIO("\n".join(lines).encode() + b"\n")
+    sink = io.BytesIO()
+    stats = asyncio.run(run_jsonl(orchestrator, source, sink, **options))
+    output = [json.loads(line) for line in sink.getvalue().splitlines()]
+    return stats, output
+
+
+@pytest.fixture
+def echo_registry(make_registry):
+    return make_registry(echo=ECHO)
+
+
+class TestRunJsonl:
+    """run_jsonl."""
+
+    def test_ordered_output_follows_input(self, echo_registry):
+        orchestrator = AgentOrchestrator(echo_registry)
+        lines = [task_line(f"t{i}", 0.05 - i * 0.01) for i in range(5)]
+
+        stats, output = run(orchestrator, lines, concurrency=5)
+
+        assert [r["index"] for r in output] == [0, 1, 2, 3, 4]
+        assert [r["result"]["data"] for r in output] == [f"t{i}" for i in range(5)]
+        assert (stats.tasks, stats.succeeded, stats.failed) == (5, 5, 0)
+
+    def test_unordered_output_is_as_completed(self, echo_registry):
+        orchestrator = AgentOrchestrator(echo_registry)
+        lines = [task_line("slow", 0.2), task_line("fast", 0.0)]
+
+        _, output = run(orchestrator, lines, concurrency=2, ordered=False)
+
+        assert [r["index"] for r in output] == [1, 0]
+        assert output[0]["result"]["data"] == "fast"
+
+    def test_invalid_lines_fail_without_aborting(self, echo_registry):
+        orchestrator = AgentOrchestrator(echo_registry)
+        lines = [task_line("a"), "{not json", "", '{"context": {}}', task_line("b")]
+
+        stats, output = run(orchestrator, lines)
+
+        assert [r["index"] for r in output] == [0, 1, 2, 3]
+        assert [r["skill"] for r in output] == ["echo", None, None, "echo"]
+        assert output[1]["result"]["status"] == "failure"
+        assert "line 2" in output[1]["result"]["message"]
+        assert "line 4" in output[2]["result"]["message"]
+        assert (stats.tasks, stats.failed, stats.invalid) == (4, 2, 2)
+
+    def test_failed_results_are_counted(self, echo_registry):
+        orchestrator = AgentOrchestrator(echo_registry)
+        stats, _ = run(orchestrator, [task_line("a", status="failure"), task_line("b")])
+        assert (stats.succeeded, stats.failed, stats.invalid) == (1, 1, 0)
+
+    def test_concurrency_is_bounded(self, echo_registry):
+        orchestrator = AgentOrchestrator(echo_registry)
+        lines = [task_line(f"t{i}", 0.01) for i in range(40)]
+
+        for ordered in (True, False):
+            stats, output = run(orchestrator, lines, concurrency=3, ordered=ordered)
+            assert stats.tasks == len(output) == 40
+
+        peak = echo_registry.get_skill("echo").__globals__["peak"]
+        assert peak == 3
+
+    def test_rejects_invalid_limits(self, echo_registry):
+        orchestrator = AgentOrchestrator(echo_registry)
+        with pytest.raises(ValueError):
+            run(orchestrator, [], concurrency=0)
+        with pytest.raises(ValueError):
+            run(orchestrator, [], concurrency=4, window=2)
+
+
+class TestCommandLine:
+    """python -m core.batch_runner."""
+
+    def test_files_in_and_out(self, echo_registry, tmp_path, capsys):
+        tasks = tmp_path / "tasks.jsonl"
+        tasks.write_text("\n".join([task_line("a"), task_line("b")]) + "\n")
+        results = tmp_path / "results.jsonl"
+
+        assert main([str(echo_registry.skills_dir), str(tasks),
+                     "-o", str(results), "--unordered"]) == 0
+
+        output = [json.loads(line) for line in results.read_text().splitlines()]
+        assert sorted(r["result"]["data"] for r in output) == ["a", "b"]
+        assert "2 tasks (2 succeeded" in capsys.readouterr().err
@@ -0,0 +1,144 @@
+"""
+Micro-batching tests: grouping, fan-out and plan reuse.
+"""
+
+import asyncio
+
+import pytest
+
+from core.batching import BatchPolicy, MicroBatcher
+from core.orchestrator import AgentOrchestrator
+from core.protocols import AgentContext, AgentResult, ResultStatus
+
+DOUBLER = """
+    import asyncio
+    from core.protocols import AgentContext, AgentResult, ResultStatus
+
+    batch_sizes = []
+
+    def get_metadata():
+        return {"max_batch_size": 4}
+
+    async def execute_many(contexts: list[AgentContext]) -> list[AgentResult]:
+        batch_sizes.append(len(contexts))
+        await asyncio.sleep(0.01)
+        if any(c.parameters.get("boom") for c in contexts):
+            raise RuntimeError("bulk call failed")
+        return [
+            AgentResult(status=ResultStatus.SUCCESS, data=c.parameters["x"] * 2,
+                        message="ok")
+            for c in contexts
+        ]
+"""
+
+
+def ok(value) -> AgentResult:
+    return AgentResult(status=ResultStatus.SUCCESS, data=value, message="ok")
+
+
+async def run_all(orchestrator, contexts):
+    return await asyncio.gather(*(
+        orchestrator.execute_task_async("doubler", context) for context in contexts
+    ))
+
+
+class TestMicroBatcher:
+    """Batch formation without an orchestrator."""
+
+    def test_full_batches_dispatch_without_waiting(self):
+        calls = []
+
+        def execute_many(contexts):
+            calls.append(len(contexts))
+            return [ok(c.parameters["x"]) for c in contexts]
+
+        batcher = MicroBatcher(
+            "s", execute_many, BatchPolicy(max_batch_size=3, max_wait_ms=10_000)
+        )
+        futures = [
+            batcher.submit(AgentContext(task="t", parameters={"x": i}))
+            for i in range(6)
+        ]
+
+        assert [f.result(timeout=5).data for f in futures] == list(range(6))
+        assert calls == [3, 3]
+        batcher.close()
+
+    def test_cancelled_requests_are_dropped(self):
+        calls = []
+
+        def execute_many(contexts):
+            calls.append([c.parameters["x"] for c in contexts])
+            return [ok(None) for _ in contexts]
+
+        batcher = MicroBatcher("s", execute_many, BatchPolicy(max_wait_ms=50))
+        kept = batcher.submit(AgentContext(task="t", parameters={"x": 1}))
+        dropped = batcher.submit(AgentContext(task="t", parameters={"x": 2}))
+        dropped.cancel()
+
+        kept.result(timeout=5)
+        assert calls == [[1]]
+        batcher.close()
+
+    def test_closed_batcher_refuses_requests(self):
+        batcher = MicroBatcher("s", lambda contexts: [])
+        batcher.close()
+        with pytest.raises(RuntimeError):
+            batcher.submit(AgentContext(task="t"))
+
+
+class TestOrchestratorBatching:
+    """Batched execution through execute_task_async."""
+
+    def test_concurrent_requests_share_batches(self, make_registry):
+        registry = make_registry(doubler=DOUBLER)
+        orchestrator = AgentOrchestrator(
+            registry, batching=BatchPolicy(max_batch_size=64, max_wait_ms=50)
+        )
+        contexts = [AgentContext(task="t", parameters={"x": i}) for i in range(10)]
+
+        results = asyncio.run(run_all(orchestrator, contexts))
+
+        # Each caller gets its own result; the skill caps batches at 4
+        assert [r.data for r in results] == [i * 2 for i in range(10)]
+        sizes = registry.get_batch_skill("doubler").__globals__["batch_sizes"]
+        assert sum(sizes) == 10 and max(sizes) == 4 and len(sizes) < 10
+
+    def test_failed_batch_fails_each_request(self, make_registry):
+        orchestrator = AgentOrchestrator(
+            make_registry(doubler=DOUBLER),
+            batching=BatchPolicy(max_wait_ms=50)
+        )
+        contexts = [
+            AgentContext(task="t", parameters={"x": 1}),
+            AgentContext(task="t", parameters={"x": 2, "boom": True}),
+        ]
+
+        results = asyncio.run(run_all(orchestrator, contexts))
+
+        assert [r.status for r in results] == [ResultStatus.FAILURE] * 2
+
+    def test_middleware_plan_is_compiled_once(self, make_registry):
+        orchestrator = AgentOrchestrator(
+            make_registry(doubler=DOUBLER), batching=BatchPolicy(max_wait_ms=1)
+        )
+        orchestrator.add_middleware(lambda context, next_handler: next_handler(context))
+
+        compiled = []
+        compile_chain = orchestrator._compile_middleware_chain
+
+        def counting_compile(*args, **kwargs):
+            compiled.append(args)
+            return compile_chain(*args, **kwargs)
+
+        orchestrator._compile_middleware_chain = counting_compile
+
+        async def run():
+            for i in range(5):
+                result = await orchestrator.execute_task_async(
+                    "doubler", AgentContext(task="t", parameters={"x": i})
+                )
+                assert result.data == i * 2
+
+        asyncio.run(run())
+        assert len(compiled) == 1
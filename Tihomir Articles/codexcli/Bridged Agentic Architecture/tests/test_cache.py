@@ -0,0 +1,170 @@
+"""
+ResultCache, @cached and caching_middleware tests.
+"""
+
+import time
+
+import pytest
+
+from core.cache import ResultCache
+from core.decorators import cached
+from core.orchestrator import AgentOrchestrator, caching_middleware
+from core.protocols import AgentContext, AgentResult, ResultStatus
+
+COUNTER = """
+    from core.protocols import AgentContext, AgentResult, ResultStatus
+
+    calls = []
+
+    def execute(context: AgentContext) -> AgentResult:
+        calls.append(context.parameters)
+        return AgentResult(status=ResultStatus.SUCCESS, data=len(calls), message="ok")
+"""
+
+
+def ok(value=None) -> AgentResult:
+    return AgentResult(status=ResultStatus.SUCCESS, data=value, message="ok")
+
+
+class TestResultCache:
+    """LRU and TTL eviction, copy semantics."""
+
+    def test_lru_eviction(self):
+        cache = ResultCache(max_entries=2)
+        cache.put("a", ok(1))
+        cache.put("b", ok(2))
+        cache.get("a")          # "b" is now least recently used
+        cache.put("c", ok(3))
+
+        assert "a" in cache and "c" in cache and "b" not in cache
+        assert cache.stats().evictions == 1
+
+    def test_ttl_expiry(self):
+        cache = ResultCache(ttl_seconds=0.05)
+        cache.put("a", ok(1))
+        assert cache.get("a").data == 1
+
+        time.sleep(0.06)
+        assert cache.get("a") is None
+        assert cache.stats().expirations == 1 and len(cache) == 0
+
+    def test_byte_budget(self):
+        cache = ResultCache(max_entries=None, max_bytes=400)
+        for i in range(10):
+            cache.put(str(i), ok("x" * 50))
+        assert 0 < len(cache) < 10
+        assert cache.stats().size_bytes <= 400
+
+        cache.put("huge", ok("x" * 1000))
+        assert "huge" not in cache
+
+    def test_copies_on_read_and_write(self):
+        cache = ResultCache()
+        result = ok(1)
+        cache.put("a", result)
+        result.metadata["late"] = True
+
+        hit = cache.get("a")
+        hit.metadata["caller"] = True
+
+        assert cache.get("a").metadata.keys() == {"cached_at"}
+
+    def test_rejects_invalid_bounds(self):
+        with pytest.raises(ValueError):
+            ResultCache(max_entries=0)
+        with pytest.raises(ValueError):
+            ResultCache(ttl_seconds=0)
+
+
+class TestCachedDecorator:
+    """@cached on a skill function."""
+
+    def test_second_call_is_served_from_cache(self):
+        calls = []
+
+        @cached(ttl_seconds=60)
+        def execute(context: AgentContext) -> AgentResult:
+            calls.append(context)
+            return ok(len(calls))
+
+        first = execute(AgentContext(task="t", parameters={"x": 1}))
+        second = execute(AgentContext(task="t", parameters={"x": 1}))
+        other = execute(AgentContext(task="t", parameters={"x": 2}))
+
+        assert (first.data, second.data, other.data) == (1, 1, 2)
+        assert first.metadata["cache_hit"] is False
+        assert second.metadata["cache_hit"] is True
+        assert execute.cache.stats().hits == 1
+
+    def test_failures_are_not_cached(self):
+        calls = []
+
+        @cached()
+        def execute(context: AgentContext) -> AgentResult:
+            calls.append(context)
+            return AgentResult(status=ResultStatus.FAILURE, message="no")
+
+        for _ in range(2):
+            execute(AgentContext(task="t"))
+        assert len(calls) == 2
+
+    def test_zero_ttl_is_deprecated_and_caches_nothing(self):
+        calls = []
+
+        with pytest.warns(DeprecationWarning):
+            @cached(ttl_seconds=0)
+            def execute(context: AgentContext) -> AgentResult:
+                calls.append(context)
+                return ok(len(calls))
+
+        assert execute(AgentContext(task="t")).data == 1
+        assert execute(AgentContext(task="t")).data == 2
+        assert execute.cache is None
+
+    def test_shares_a_cache_with_middleware(self, make_registry):
+        shared = ResultCache()
+        registry = make_registry(counter=COUNTER)
+        orchestrator = AgentOrchestrator(registry)
+        orchestrator.add_middleware(caching_middleware(shared))
+
+        @cached(cache=shared)
+        def execute(context: AgentContext) -> AgentResult:
+            raise AssertionError("should be served from the shared cache")
+
+        context = AgentContext(task="t", parameters={"x": 1})
+        assert orchestrator.execute_task("counter", context).data == 1
+        assert execute(context).data == 1
+
+
+class TestCachingMiddleware:
+    """caching_middleware through the orchestrator."""
+
+    def test_hits_skip_the_skill(self, make_registry):
+        registry = make_registry(counter=COUNTER)
+        orchestrator = AgentOrchestrator(registry)
+        middleware = caching_middleware(ResultCache())
+        orchestrator.add_middleware(middleware)
+
+        for _ in range(3):
+            result = orchestrator.execute_task(
+                "counter", AgentContext(task="t", parameters={"x": 1})
+            )
+
+        assert result.data == 1
+        assert len(registry.get_skill("counter").__globals__["calls"]) == 1
+        assert middleware.cache.stats().hits == 2
+
+    def test_deprecated_dict_stores_clean_copies(self, make_registry):
+        orchestrator = AgentOrchestrator(
+            make_registry(counter=COUNTER), enable_timing=True
+        )
+        entries: dict = {}
+        with pytest.warns(DeprecationWarning):
+            orchestrator.add_middleware(caching_middleware(entries))
+
+        result = orchestrator.execute_task("counter", AgentContext(task="t"))
+
+        stored = next(iter(entries.values()))
+        assert stored is not result
+        assert "execution_time_ms" in result.metadata
+        assert "execution_time_ms" not in stored.metadata
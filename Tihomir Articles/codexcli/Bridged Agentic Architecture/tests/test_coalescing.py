@@ -0,0 +1,188 @@
+"""
+Single-flight request coalescing tests.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core.coalescing import SingleFlight
+from core.orchestrator import AgentOrchestrator
+from core.protocols import AgentContext, AgentResult, ResultStatus
+
+SLOW = """
+    import time
+    from core.protocols import AgentContext, AgentResult, ResultStatus
+
+    calls = []
+
+    def execute(context: AgentContext) -> AgentResult:
+        calls.append(context.parameters)
+        time.sleep(context.parameters.get("sleep", 0.2))
+        return AgentResult(status=ResultStatus.SUCCESS, data=len(calls), message="ok")
+"""
+
+
+def ok(value=None) -> AgentResult:
+    return AgentResult(status=ResultStatus.SUCCESS, data=value, message="ok")
+
+
+class TestSingleFlight:
+    """Leader/follower semantics."""
+
+    def test_concurrent_identical_calls_execute_once(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def leader_fn():
+            started.set()
+            release.wait(5)
+            return ok("shared")
+
+        with ThreadPoolExecutor(4) as pool:
+            leader = pool.submit(flight.do, "k", leader_fn)
+            started.wait(5)
+            followers = [pool.submit(flight.do, "k", lambda: ok("own")) for _ in range(3)]
+            time.sleep(0.05)
+            release.set()
+            results = [leader.result(5)] + [f.result(5) for f in followers]
+
+        assert [r.data for r in results] == ["shared"] * 4
+        assert "coalesced" not in results[0].metadata
+        assert all(r.metadata["coalesced"] for r in results[1:])
+        assert flight.stats().executions == 1 and flight.stats().coalesced == 3
+
+    def test_follower_gives_up_at_its_timeout(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        with ThreadPoolExecutor(1) as pool:
+            leader = pool.submit(flight.do, "k", lambda: release.wait(5) and ok())
+            time.sleep(0.02)
+
+            start = time.monotonic()
+            with pytest.raises(TimeoutError):
+                flight.do("k", ok, timeout=0.05)
+            assert time.monotonic() - start < 1.0
+
+            release.set()
+            assert leader.result(5).success
+
+    def test_followers_retry_after_leader_cancellation(self):
+        flight = SingleFlight()
+
+        async def main():
+            leader_started = asyncio.Event()
+
+            async def slow():
+                leader_started.set()
+                await asyncio.sleep(10)
+                return ok("leader")
+
+            async def fast():
+                return ok("retried")
+
+            leader = asyncio.create_task(flight.do_async("k", slow))
+            await leader_started.wait()
+            async_follower = asyncio.create_task(flight.do_async("k", fast))
+            sync_follower = asyncio.create_task(
+                asyncio.to_thread(flight.do, "k", lambda: ok("sync retried"))
+            )
+            await asyncio.sleep(0.05)
+
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await async_follower, await sync_follower
+
+        async_result, sync_result = asyncio.run(main())
+
+        # Neither follower sees the leader's CancelledError
+        assert async_result.success and sync_result.success
+        assert {async_result.data, sync_result.data} <= {"retried", "sync retried"}
+
+    def test_cancelled_follower_leaves_shared_call_alone(self):
+        flight = SingleFlight()
+
+        async def main():
+            async def slow():
+                await asyncio.sleep(0.1)
+                return ok("leader")
+
+            leader = asyncio.create_task(flight.do_async("k", slow))
+            await asyncio.sleep(0.01)
+            follower = asyncio.create_task(flight.do_async("k", slow))
+            other = asyncio.create_task(flight.do_async("k", slow))
+            await asyncio.sleep(0.01)
+
+            follower.cancel()
+            return await leader, await other
+
+        leader_result, other_result = asyncio.run(main())
+        assert leader_result.data == other_result.data == "leader"
+
+    def test_leader_exception_reaches_followers(self):
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def failing():
+            started.set()
+            time.sleep(0.05)
+            raise ValueError("bad")
+
+        with ThreadPoolExecutor(2) as pool:
+            leader = pool.submit(flight.do, "k", failing)
+            started.wait(5)
+            follower = pool.submit(flight.do, "k", ok)
+            with pytest.raises(ValueError):
+                leader.result(5)
+            with pytest.raises(ValueError):
+                follower.result(5)
+
+
+class TestOrchestratorCoalescing:
+    """coalesce_requests=True on execute_task."""
+
+    def test_identical_tasks_share_one_execution(self, make_registry):
+        registry = make_registry(slow=SLOW)
+        orchestrator = AgentOrchestrator(registry, coalesce_requests=True)
+
+        with ThreadPoolExecutor(4) as pool:
+            results = list(pool.map(
+                lambda _: orchestrator.execute_task(
+                    "slow", AgentContext(task="t", parameters={"sleep": 0.2})
+                ),
+                range(4)
+            ))
+
+        assert all(r.success for r in results)
+        assert len(registry.get_skill("slow").__globals__["calls"]) == 1
+
+    def test_follower_deadline_is_honoured(self, make_registry):
+        orchestrator = AgentOrchestrator(
+            make_registry(slow=SLOW), coalesce_requests=True
+        )
+        parameters = {"sleep": 0.5}
+
+        with ThreadPoolExecutor(1) as pool:
+            leader = pool.submit(
+                orchestrator.execute_task, "slow",
+                AgentContext(task="t", parameters=parameters)
+            )
+            time.sleep(0.05)
+
+            start = time.monotonic()
+            follower = orchestrator.execute_task(
+                "slow",
+                AgentContext(task="t", parameters=parameters).with_timeout(0.05)
+            )
+            waited = time.monotonic() - start
+
+            assert follower.status == ResultStatus.FAILURE
+            assert follower.error_details["timeout"] is True
+            assert waited < 0.4
+            assert leader.result(5).success
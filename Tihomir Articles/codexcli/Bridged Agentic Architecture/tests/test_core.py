@@ -0,0 +1,77 @@
+"""
+Core framework tests.
+
+Run from the project root (the directory containing core/ and tests/):
+    pytest tests/test_core.py -v
+"""
+
+from enum import Enum
+
+from core.hashing import canonical_digest
+from core.protocols import AgentContext
+
+
+class TestProtocols:
+    """AgentContext contract."""
+
+    def test_cache_key_does_not_change_equality(self):
+        a = AgentContext(task="t", parameters={"x": 1})
+        b = AgentContext(task="t", parameters={"x": 1})
+        assert a == b
+
+        a.cache_key()
+        b.cache_key(exclude=["x"])
+
+        assert a == b
+        assert b == a
+
+    def test_equality_still_compares_fields(self):
+        context = AgentContext(task="t", parameters={"x": 1})
+        context.cache_key()
+
+        assert context != AgentContext(task="t", parameters={"x": 2})
+        assert context != AgentContext(task="u", parameters={"x": 1})
+        assert context == context.derive(parameters={"x": 1})
+
+    def test_cache_key_ignores_insertion_order(self):
+        a = AgentContext(task="t", parameters={"a": [1, {"p": 1, "q": 2}], "b": {3, 4}})
+        b = AgentContext(task="t", parameters={"b": {4, 3}, "a": [1, {"q": 2, "p": 1}]})
+        assert a.cache_key() == b.cache_key()
+
+    def test_derive_gets_a_fresh_cache_key(self):
+        context = AgentContext(task="t", parameters={"x": 1})
+        key = context.cache_key()
+        assert context.derive(parameters={"x": 2}).cache_key() != key
+
+
+class TestHashing:
+    """canonical_digest type distinctions on both encoding paths."""
+
+    def test_scalars_never_collide(self):
+        values = [1, 1.0, True, "1", None, "None", [1], ["1"], {"a": 1}, {"a": "1"}]
+        assert len({canonical_digest(v) for v in values}) == len(values)
+
+    def test_fallback_path_matches_order_independence(self):
+        # Non-string keys and sets are not plain JSON
+        a = {1: "a", "x": {"b", "c"}}
+        b = {"x": {"c", "b"}, 1: "a"}
+        assert canonical_digest(a) == canonical_digest(b)
+        assert canonical_digest(a) != canonical_digest({"1": "a", "x": ["b", "c"]})
+
+    def test_json_lookalikes_never_collide(self):
+        # orjson writes these like null / a list / a plain string
+        values = [None, float("nan"), float("inf"), float("-inf"), [1, 2], (1, 2)]
+        keys = {
+            AgentContext(task="t", parameters={"x": v}).cache_key() for v in values
+        }
+        assert len(keys) == len(values)
+
+    def test_enum_is_not_keyed_like_its_value(self):
+        class Color(Enum):
+            RED = "red"
+
+        assert canonical_digest({"c": Color.RED}) != canonical_digest({"c": "red"})
+
+    def test_non_finite_floats_are_stable(self):
+        assert canonical_digest({"x": float("nan")}) == canonical_digest({"x": float("nan")})
+        assert canonical_digest([float("inf")]) != canonical_digest([float("-inf")])
@@ -0,0 +1,144 @@
+"""
+Deadline and timeout tests: budgets, cancellation and the timeout workers.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from core.executors import ThreadPoolBatchExecutor
+from core.orchestrator import AgentOrchestrator
+from core.protocols import AgentContext, ResultStatus
+
+# Sleeps for parameters["delay"]; counts calls that started and finished
+SLEEPER = """
+    import time
+    from core.protocols import AgentContext, AgentResult, ResultStatus
+
+    started = []
+    finished = []
+
+    def execute(context: AgentContext) -> AgentResult:
+        started.append(context.task)
+        time.sleep(context.parameters.get("delay", 0.0))
+        finished.append(context.task)
+        return AgentResult(status=ResultStatus.SUCCESS, message="ok")
+"""
+
+ASYNC_SLEEPER = """
+    import asyncio
+    from core.protocols import AgentContext, AgentResult, ResultStatus
+
+    cancelled = []
+
+    async def execute(context: AgentContext) -> AgentResult:
+        try:
+            await asyncio.sleep(context.parameters.get("delay", 0.0))
+        except asyncio.CancelledError:
+            cancelled.append(context.task)
+            raise
+        return AgentResult(status=ResultStatus.SUCCESS, message="ok")
+"""
+
+
+def sleep_for(delay: float, name: str = "t") -> AgentContext:
+    return AgentContext(task=name, parameters={"delay": delay})
+
+
+def assert_timed_out(result) -> None:
+    assert result.status == ResultStatus.FAILURE
+    assert result.error_details["timeout"] is True
+
+
+@pytest.fixture
+def sleepers(make_registry):
+    return make_registry(sleeper=SLEEPER, async_sleeper=ASYNC_SLEEPER)
+
+
+class TestAgentContextDeadline:
+    """remaining(), expired and with_timeout()."""
+
+    def test_no_deadline(self):
+        context = AgentContext(task="t")
+        assert context.remaining() is None and not context.expired
+
+    def test_with_timeout_only_shrinks(self):
+        context = AgentContext(task="t").with_timeout(10)
+        assert 9 < context.remaining() <= 10
+
+        assert context.with_timeout(1).remaining() <= 1
+        assert context.with_timeout(100).deadline == context.deadline
+
+    def test_expired_deadline(self):
+        context = AgentContext(task="t", deadline=time.time() - 1)
+        assert context.expired and context.remaining() == 0.0
+
+
+class TestOrchestratorTimeouts:
+    """Per-skill timeouts and context deadlines."""
+
+    def test_sync_skill_over_its_timeout(self, sleepers):
+        orchestrator = AgentOrchestrator(sleepers, skill_timeouts={"sleeper": 0.05})
+
+        start = time.perf_counter()
+        result = orchestrator.execute_task("sleeper", sleep_for(1.0))
+
+        assert time.perf_counter() - start < 0.5
+        assert_timed_out(result)
+        assert orchestrator.execute_task("sleeper", sleep_for(0.0)).success
+
+    def test_async_skill_is_cancelled(self, sleepers):
+        orchestrator = AgentOrchestrator(sleepers, default_timeout_s=0.05)
+
+        result = asyncio.run(
+            orchestrator.execute_task_async("async_sleeper", sleep_for(5.0, "slow"))
+        )
+
+        assert_timed_out(result)
+        cancelled = sleepers.get_skill("async_sleeper").__globals__["cancelled"]
+        assert cancelled == ["slow"]
+
+    def test_deadline_shorter_than_timeout_wins(self, sleepers):
+        orchestrator = AgentOrchestrator(sleepers, default_timeout_s=10)
+        context = sleep_for(1.0).with_timeout(0.05)
+
+        start = time.perf_counter()
+        assert_timed_out(orchestrator.execute_task("sleeper", context))
+        assert time.perf_counter() - start < 0.5
+
+    def test_expired_deadline_never_runs_the_skill(self, sleepers):
+        orchestrator = AgentOrchestrator(sleepers)
+        context = AgentContext(task="late", deadline=time.time() - 1)
+
+        assert_timed_out(orchestrator.execute_task("sleeper", context))
+        assert "late" not in sleepers.get_skill("sleeper").__globals__["started"]
+
+    def test_queued_call_is_dropped_when_its_budget_runs_out(self, sleepers):
+        orchestrator = AgentOrchestrator(
+            sleepers, default_timeout_s=0.05, max_timeout_workers=1
+        )
+        state = sleepers.get_skill("sleeper").__globals__
+
+        # The hung call keeps the only worker; the next one waits in line
+        assert_timed_out(orchestrator.execute_task("sleeper", sleep_for(0.3, "hung")))
+        assert_timed_out(orchestrator.execute_task("sleeper", sleep_for(0.0, "queued")))
+
+        time.sleep(0.4)
+        assert state["finished"] == ["hung"]
+        assert "queued" not in state["started"]
+
+    def test_batch_does_not_wait_past_deadlines(self, sleepers):
+        orchestrator = AgentOrchestrator(sleepers)
+        tasks = [
+            ("sleeper", sleep_for(0.3).with_timeout(0.05)),
+            ("sleeper", sleep_for(0.0)),
+        ]
+
+        start = time.perf_counter()
+        with ThreadPoolBatchExecutor(max_workers=2) as executor:
+            results = orchestrator.execute_batch(tasks, executor=executor)
+            assert time.perf_counter() - start < 0.25
+
+        assert_timed_out(results[0])
+        assert results[1].success
@@ -0,0 +1,134 @@
+"""
+SQLiteResultCache tests: persistence, sharing across processes, eviction.
+"""
+
+import multiprocessing
+import time
+
+import pytest
+
+from core.disk_cache import SQLiteResultCache
+from core.orchestrator import AgentOrchestrator, caching_middleware
+from core.protocols import AgentContext, AgentResult, ResultStatus
+
+COUNTER = """
+    from core.protocols import AgentContext, AgentResult, ResultStatus
+
+    calls = []
+
+    def execute(context: AgentContext) -> AgentResult:
+        calls.append(context.parameters)
+        return AgentResult(status=ResultStatus.SUCCESS, data=len(calls), message="ok")
+"""
+
+
+def ok(value=None) -> AgentResult:
+    return AgentResult(status=ResultStatus.SUCCESS, data=value, message="ok")
+
+
+def put_from_child(path: str, key: str, value: str) -> None:
+    SQLiteResultCache(path).put(key, ok(value))
+
+
+@pytest.fixture
+def db(tmp_path):
+    return tmp_path / "cache" / "results.db"
+
+
+class TestSQLiteResultCache:
+    """Storage, TTL and capacity."""
+
+    def test_round_trip_survives_reopening(self, db):
+        cache = SQLiteResultCache(db)
+        cache.put("k", ok({"rows": [1, 2, 3]}))
+        cache.close()
+
+        reopened = SQLiteResultCache(db)
+        result = reopened.get("k")
+        assert result.data == {"rows": [1, 2, 3]}
+        assert "cached_at" in result.metadata
+        assert reopened.get("missing") is None
+
+        stats = reopened.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+    def test_shared_with_another_process(self, db):
+        cache = SQLiteResultCache(db)
+        child = multiprocessing.get_context("fork").Process(
+            target=put_from_child, args=(str(db), "k", "from child")
+        )
+        child.start()
+        child.join(10)
+
+        assert child.exitcode == 0
+        assert cache.get("k").data == "from child"
+
+    def test_entries_expire_after_ttl(self, db):
+        cache = SQLiteResultCache(db, ttl_seconds=0.05)
+        cache.put("a", ok(1))
+        cache.put("b", ok(2))
+        assert "a" in cache
+
+        time.sleep(0.06)
+        assert cache.get("a") is None
+        assert "b" not in cache
+        assert cache.purge_expired() == 1
+        assert len(cache) == 0
+        assert cache.stats().expirations == 2
+
+    def test_evicts_least_recently_used_over_max_entries(self, db):
+        cache = SQLiteResultCache(db, max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, ok(key))
+            time.sleep(0.01)
+
+        assert "a" not in cache and "b" in cache and "c" in cache
+        assert len(cache) == 2
+        assert cache.stats().evictions == 1
+
+    def test_byte_budget_counts_stored_size(self, db):
+        cache = SQLiteResultCache(db, max_bytes=4096, compress_threshold=None)
+        cache.put("big", ok("x" * 8192))
+        assert "big" not in cache
+
+        for i in range(10):
+            cache.put(f"k{i}", ok("x" * 1000))
+        assert 0 < cache.stats().size_bytes <= 4096
+
+    def test_large_payloads_are_compressed(self, db):
+        cache = SQLiteResultCache(db, compress_threshold=1024)
+        cache.put("k", ok("abc" * 10_000))
+
+        assert cache.stats().size_bytes < 30_000
+        assert cache.get("k").data == "abc" * 10_000
+
+    def test_unserializable_results_are_skipped(self, db):
+        cache = SQLiteResultCache(db)
+        cache.put("k", ok(object()))
+        assert "k" not in cache
+
+    def test_invalidate_and_clear(self, db):
+        cache = SQLiteResultCache(db)
+        cache.put("a", ok(1))
+        cache.put("b", ok(2))
+
+        assert cache.invalidate("a") and not cache.invalidate("a")
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_rejects_invalid_bounds(self, db):
+        with pytest.raises(ValueError):
+            SQLiteResultCache(db, max_entries=0)
+        with pytest.raises(ValueError):
+            SQLiteResultCache(db, ttl_seconds=0)
+
+    def test_orchestrators_share_results(self, db, make_registry):
+        registry = make_registry(counter=COUNTER)
+        context = AgentContext(task="t", parameters={"x": 1})
+
+        for _ in range(2):
+            orchestrator = AgentOrchestrator(registry)
+            orchestrator.add_middleware(caching_middleware(SQLiteResultCache(db)))
+            assert orchestrator.execute_task("counter", context).data == 1
+
+        assert len(registry.get_skill("counter").__globals__["calls"]) == 1
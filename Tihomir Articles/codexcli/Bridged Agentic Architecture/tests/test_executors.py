@@ -0,0 +1,132 @@
+"""
+Thread-pool and process-pool batch executor tests.
+"""
+
+import os
+
+import pytest
+
+from core.executors import (
+    BatchExecutor,
+    ProcessPoolBatchExecutor,
+    ThreadPoolBatchExecutor,
+    _PoolBatchExecutor,
+)
+from core.orchestrator import AgentOrchestrator
+from core.protocols import AgentContext, ResultStatus, TaskPriority
+
+WORKER = """
+    import os
+    import time
+    from core.protocols import AgentContext, AgentResult, ResultStatus
+
+    def execute(context: AgentContext) -> AgentResult:
+        time.sleep(context.parameters.get("sleep", 0.0))
+        if context.parameters.get("raise"):
+            raise RuntimeError("boom")
+        if context.parameters.get("fail"):
+            return AgentResult(status=ResultStatus.FAILURE, message="failed")
+        return AgentResult(status=ResultStatus.SUCCESS, message="ok", data={
+            "i": context.parameters.get("i"),
+            "pid": os.getpid(),
+        })
+"""
+
+
+def task(**parameters) -> tuple[str, AgentContext]:
+    priority = parameters.pop("priority", TaskPriority.NORMAL)
+    return "worker", AgentContext(task="t", parameters=parameters, priority=priority)
+
+
+class TestThreadPoolBatchExecutor:
+    """Ordering, containment and the CRITICAL abort."""
+
+    def test_results_keep_input_order(self, make_registry):
+        orchestrator = AgentOrchestrator(make_registry(worker=WORKER))
+        tasks = [task(i=i, sleep=0.05 * (5 - i)) for i in range(5)]
+
+        with ThreadPoolBatchExecutor(5) as executor:
+            results = orchestrator.execute_batch(tasks, executor=executor)
+
+        assert [r.data["i"] for r in results] == list(range(5))
+
+    def test_task_errors_are_contained(self, make_registry):
+        orchestrator = AgentOrchestrator(make_registry(worker=WORKER))
+
+        with ThreadPoolBatchExecutor(2) as executor:
+            results = orchestrator.execute_batch(
+                [task(i=0), task(i=1, **{"raise": True}), task(i=2)],
+                executor=executor
+            )
+
+        assert [r.status for r in results] == [
+            ResultStatus.SUCCESS, ResultStatus.FAILURE, ResultStatus.SUCCESS
+        ]
+
+    def test_critical_failure_skips_queued_and_keeps_running(self, make_registry):
+        orchestrator = AgentOrchestrator(make_registry(worker=WORKER))
+        tasks = [
+            task(i=0, fail=True, priority=TaskPriority.CRITICAL),
+            task(i=1, sleep=0.3),   # Running when the abort happens
+            task(i=2),              # Queued behind the two workers
+        ]
+
+        with ThreadPoolBatchExecutor(2) as executor:
+            results = orchestrator.execute_batch(tasks, executor=executor)
+
+        assert [r.status for r in results] == [
+            ResultStatus.FAILURE, ResultStatus.SUCCESS, ResultStatus.SKIPPED
+        ]
+
+    def test_serves_any_orchestrator(self, make_registry):
+        first = AgentOrchestrator(make_registry(worker=WORKER))
+        second = AgentOrchestrator(first.registry)
+
+        with ThreadPoolBatchExecutor(2) as executor:
+            assert first.execute_batch([task(i=0)], executor=executor)[0].success
+            assert second.execute_batch([task(i=1)], executor=executor)[0].success
+
+
+class TestProcessPoolBatchExecutor:
+    """Warm worker processes."""
+
+    def test_runs_in_worker_processes(self, make_registry):
+        orchestrator = AgentOrchestrator(make_registry(worker=WORKER))
+
+        with ProcessPoolBatchExecutor(max_workers=2) as executor:
+            results = orchestrator.execute_batch(
+                [task(i=i) for i in range(4)], executor=executor
+            )
+
+        assert [r.data["i"] for r in results] == list(range(4))
+        assert all(r.data["pid"] != os.getpid() for r in results)
+
+    def test_rejects_orchestrator_with_other_skills(self, make_registry, tmp_path):
+        orchestrator = AgentOrchestrator(make_registry(worker=WORKER))
+        other_dir = tmp_path / "other"
+        other_dir.mkdir()
+        (other_dir / "worker.py").write_text(
+            (tmp_path / "worker.py").read_text()
+        )
+        other = AgentOrchestrator(type(orchestrator.registry)(other_dir))
+
+        with ProcessPoolBatchExecutor(max_workers=1) as executor:
+            assert orchestrator.execute_batch([task(i=0)], executor=executor)[0].success
+            with pytest.raises(ValueError):
+                other.execute_batch([task(i=0)], executor=executor)
+
+            # A fresh pool is built for the new skills after shutdown()
+            executor.shutdown()
+            assert other.execute_batch([task(i=0)], executor=executor)[0].success
+
+
+class TestExecutorContract:
+    """Executors satisfy BatchExecutor; the pool base is abstract."""
+
+    def test_executors_are_batch_executors(self):
+        assert isinstance(ThreadPoolBatchExecutor(), BatchExecutor)
+        assert isinstance(ProcessPoolBatchExecutor(), BatchExecutor)
+
+    def test_pool_base_is_abstract(self):
+        with pytest.raises(TypeError):
+            _PoolBatchExecutor()
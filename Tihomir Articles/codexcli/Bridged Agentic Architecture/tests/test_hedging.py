@@ -0,0 +1,162 @@
+"""
+Hedged request tests: trigger, caps and winner selection.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from core.hedging import HedgePolicy, Hedger
+from core.metrics import MetricsRegistry
+from core.orchestrator import AgentOrchestrator
+from core.protocols import AgentContext
+
+# First call after warm-up (call 6) straggles; every other call is fast
+STRAGGLER = """
+    import itertools
+    import time
+    from core.protocols import AgentContext, AgentResult, ResultStatus
+
+    calls = itertools.count()
+    slow_calls = {5}
+
+    def get_metadata():
+        return {"idempotent": True}
+
+    def execute(context: AgentContext) -> AgentResult:
+        call = next(calls)
+        time.sleep(0.5 if call in slow_calls else 0.01)
+        return AgentResult(status=ResultStatus.SUCCESS, data=call, message="ok")
+"""
+
+ASYNC_STRAGGLER = STRAGGLER.replace(
+    "def execute", "async def execute"
+).replace(
+    "time.sleep(", "await asyncio.sleep("
+).replace(
+    "import time", "import asyncio"
+)
+
+
+def hedging_orchestrator(registry, **policy) -> AgentOrchestrator:
+    policy = {"min_samples": 5, "quantile": 0.5, "max_hedge_ratio": 1.0,
+              "max_burst": 100.0, **policy}
+    return AgentOrchestrator(
+        registry, metrics=MetricsRegistry(), hedging=HedgePolicy(**policy)
+    )
+
+
+def hedge_threads() -> int:
+    return sum(t.name.startswith("skill-hedge") for t in threading.enumerate())
+
+
+def warm_up(orchestrator, skill_name: str = "straggler") -> None:
+    for _ in range(5):
+        orchestrator.execute_task(skill_name, AgentContext(task="warm"))
+
+
+class TestHedger:
+    """Trigger and traffic caps, without an orchestrator."""
+
+    def test_no_delay_until_latency_is_learned(self):
+        metrics = MetricsRegistry()
+        hedger = Hedger(HedgePolicy(min_samples=3, min_delay_ms=1.0), metrics)
+        assert hedger.delay_for("s") is None
+
+        for _ in range(3):
+            metrics.observe_execution("s", "success", 40.0)
+        assert 0.03 < hedger.delay_for("s") < 0.05
+
+    def test_ratio_caps_hedges(self):
+        hedger = Hedger(HedgePolicy(max_hedge_ratio=0.5), MetricsRegistry())
+        hedger.delay_for("s")
+        assert not hedger.try_hedge("s")  # 0.5 tokens
+
+        hedger.delay_for("s")
+        assert hedger.try_hedge("s")
+        assert hedger.stats("s").hedges == 1 and hedger.stats("s").capped == 1
+
+    def test_outstanding_hedges_are_capped(self):
+        hedger = Hedger(
+            HedgePolicy(max_hedge_ratio=1.0, max_outstanding_hedges=1),
+            MetricsRegistry()
+        )
+        for _ in range(3):
+            hedger.delay_for("s")
+
+        assert hedger.try_hedge("s")
+        assert not hedger.try_hedge("s")
+        hedger.hedge_finished()
+        assert hedger.try_hedge("s")
+
+
+class TestHedgedExecution:
+    """Orchestrator races and winner selection."""
+
+    def test_hedge_wins_against_straggler(self, make_registry):
+        orchestrator = hedging_orchestrator(make_registry(straggler=STRAGGLER))
+        warm_up(orchestrator)
+
+        result = orchestrator.execute_task("straggler", AgentContext(task="t"))
+
+        assert result.success
+        assert result.metadata["hedged"] is True
+        assert result.metadata["hedge_won"] is True
+        assert result.data == 6  # The hedge's call, not the straggler's
+        assert orchestrator.hedger.stats("straggler").hedge_wins == 1
+
+    def test_fast_original_is_not_hedged(self, make_registry):
+        orchestrator = hedging_orchestrator(
+            make_registry(straggler=STRAGGLER), min_delay_ms=200.0
+        )
+        warm_up(orchestrator)
+        orchestrator.registry.get_skill("straggler").__globals__["slow_calls"] = set()
+
+        result = orchestrator.execute_task("straggler", AgentContext(task="t"))
+
+        assert "hedged" not in result.metadata
+        assert orchestrator.hedger.stats("straggler").hedges == 0
+
+    def test_async_hedge_wins_and_loser_is_cancelled(self, make_registry):
+        orchestrator = hedging_orchestrator(
+            make_registry(straggler=ASYNC_STRAGGLER)
+        )
+
+        async def run():
+            for _ in range(5):
+                await orchestrator.execute_task_async(
+                    "straggler", AgentContext(task="warm")
+                )
+            return await orchestrator.execute_task_async(
+                "straggler", AgentContext(task="t")
+            )
+
+        result = asyncio.run(run())
+
+        assert result.metadata["hedge_won"] is True
+        assert result.data == 6
+        assert orchestrator.hedger.outstanding == 0
+
+    def test_sync_attempts_run_on_a_bounded_pool(self, make_registry):
+        orchestrator = hedging_orchestrator(
+            make_registry(straggler=STRAGGLER),
+            max_sync_workers=3,
+            max_outstanding_hedges=1
+        )
+        warm_up(orchestrator)
+        orchestrator.registry.get_skill("straggler").__globals__["slow_calls"] = (
+            range(5, 1000)
+        )
+        threads_before = hedge_threads()
+
+        with ThreadPoolExecutor(12) as pool:
+            results = list(pool.map(
+                lambda _: orchestrator.execute_task(
+                    "straggler", AgentContext(task="t")
+                ),
+                range(12)
+            ))
+
+        assert all(r.success for r in results)
+        assert hedge_threads() - threads_before <= 3
+        assert orchestrator.hedger.stats("straggler").hedges <= 3
@@ -0,0 +1,138 @@
+"""
+Circuit breaker and AIMD limiter tests.
+"""
+
+import time
+
+import pytest
+
+from core.admission import AdmissionRejected
+from core.resilience import (
+    AIMDLimiter,
+    BreakerConfig,
+    CircuitBreaker,
+    CircuitState,
+    LimiterConfig,
+)
+
+
+def open_breaker(**overrides) -> CircuitBreaker:
+    """A breaker that opens after two failures and half-opens at once."""
+    config = dict(min_calls=2, window_size=2, open_seconds=0.0)
+    config.update(overrides)
+    breaker = CircuitBreaker("skill", BreakerConfig(**config))
+    for _ in range(2):
+        breaker.record(breaker.allow(), False, 1.0)
+    return breaker
+
+
+class TestCircuitBreaker:
+    """State transitions and probe accounting."""
+
+    def test_opens_on_failure_rate(self):
+        breaker = CircuitBreaker(
+            "skill", BreakerConfig(min_calls=4, window_size=4, open_seconds=60)
+        )
+        for success in (True, True, False):
+            breaker.record(breaker.allow(), success, 1.0)
+        assert breaker.state is CircuitState.CLOSED
+
+        breaker.record(breaker.allow(), False, 1.0)
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.allow() is None
+
+    def test_opens_on_slow_call_rate(self):
+        breaker = CircuitBreaker("skill", BreakerConfig(
+            min_calls=2, window_size=2, slow_call_ms=10,
+            slow_call_rate_threshold=1.0, open_seconds=60
+        ))
+        for _ in range(2):
+            breaker.record(breaker.allow(), True, 50.0)
+        assert breaker.state is CircuitState.OPEN
+
+    def test_half_open_limits_concurrent_probes(self):
+        breaker = open_breaker(half_open_max_calls=2)
+        assert breaker.state is CircuitState.HALF_OPEN
+
+        probes = [breaker.allow(), breaker.allow()]
+        assert all(p is not None and p.probe for p in probes)
+        assert breaker.allow() is None
+
+        breaker.release_probe(probes[0])
+        assert breaker.allow() is not None
+
+    def test_closes_after_enough_successful_probes(self):
+        breaker = open_breaker(half_open_successes=3)
+        for _ in range(2):
+            breaker.record(breaker.allow(), True, 1.0)
+            assert breaker.state is CircuitState.HALF_OPEN
+
+        breaker.record(breaker.allow(), True, 1.0)
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_failed_probe_reopens(self):
+        breaker = open_breaker(open_seconds=0.05)
+        time.sleep(0.06)
+        breaker.record(breaker.allow(), False, 1.0)
+        assert breaker.state is CircuitState.OPEN
+
+    def test_stale_results_do_not_count_as_probes(self):
+        breaker = CircuitBreaker("skill", BreakerConfig(
+            min_calls=2, window_size=2, half_open_successes=3, open_seconds=0.05
+        ))
+        admitted = [breaker.allow() for _ in range(5)]
+        for ticket in admitted[:2]:
+            breaker.record(ticket, False, 1.0)
+        time.sleep(0.06)
+
+        probe = breaker.allow()
+        assert probe is not None and breaker.state is CircuitState.HALF_OPEN
+
+        # Calls admitted while CLOSED finish after the circuit half-opened
+        for ticket in admitted[2:]:
+            breaker.record(ticket, True, 1.0)
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow() is None  # Still only one probe at a time
+
+    def test_ticket_counts_once(self):
+        breaker = open_breaker(half_open_successes=2)
+        probe = breaker.allow()
+        breaker.record(probe, True, 1.0)
+        breaker.record(probe, True, 1.0)
+        breaker.release_probe(probe)
+        assert breaker.state is CircuitState.HALF_OPEN
+
+        # Exactly one probe slot is free again, not more
+        assert breaker.allow() is not None
+        assert breaker.allow() is None
+
+
+class TestAIMDLimiter:
+    """Additive increase, multiplicative decrease."""
+
+    def test_grows_while_busy_and_shrinks_on_failure(self):
+        limiter = AIMDLimiter("skill", LimiterConfig(
+            initial_limit=4, min_limit=1, max_limit=10, backoff_ratio=0.5
+        ))
+        slots = [limiter.acquire() for _ in range(4)]
+        slots[0].release(success=True)
+        assert limiter.limit == 5
+
+        slots[1].release(success=False)
+        assert limiter.limit == 2
+
+        for slot in slots[2:]:
+            slot.release()
+        assert limiter.limit == 2 and limiter.in_flight == 0
+
+    def test_rejects_when_no_slot_frees_up(self):
+        limiter = AIMDLimiter("skill", LimiterConfig(
+            initial_limit=1, queue_timeout_s=0.01
+        ))
+        slot = limiter.acquire()
+        assert limiter.try_acquire() is None
+        with pytest.raises(AdmissionRejected):
+            limiter.acquire()
+
+        slot.release()
+        assert limiter.try_acquire() is not None
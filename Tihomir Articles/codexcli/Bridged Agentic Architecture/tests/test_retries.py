@@ -0,0 +1,140 @@
+"""
+Retry policy and retry budget tests.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from core.decorators import retry
+from core.orchestrator import AgentOrchestrator
+from core.protocols import AgentContext, AgentResult, ResultStatus
+from core.retries import RetryBudget, RetryPolicy
+from core.scheduler import PriorityScheduler
+
+ALWAYS_FAILS = """
+    from core.protocols import AgentContext, AgentResult, ResultStatus
+
+    def execute(context: AgentContext) -> AgentResult:
+        return AgentResult(status=ResultStatus.FAILURE, message="down")
+"""
+
+ASYNC_ALWAYS_FAILS = ALWAYS_FAILS.replace("def execute", "async def execute")
+
+FAILURE = AgentResult(status=ResultStatus.FAILURE, message="down")
+
+# No backoff, three attempts
+EAGER = RetryPolicy(max_attempts=3, base_delay_s=0.0, jitter="none")
+
+
+def assert_within_ratio(budget: RetryBudget) -> None:
+    stats = budget.stats()
+    assert stats.retries <= stats.requests * budget.ratio
+    assert stats.exhausted > 0
+
+
+class TestRetryPolicy:
+    """Backoff and retry decisions."""
+
+    def test_backoff_doubles_up_to_the_cap(self):
+        policy = RetryPolicy(base_delay_s=0.1, max_delay_s=0.3, jitter="none")
+        assert [policy.backoff(a) for a in (1, 2, 3, 4)] == [0.1, 0.2, 0.3, 0.3]
+
+    @pytest.mark.parametrize("jitter, low", [("full", 0.0), ("equal", 0.2)])
+    def test_jitter_stays_within_the_backoff(self, jitter, low):
+        policy = RetryPolicy(base_delay_s=0.4, jitter=jitter)
+        delays = [policy.backoff(1) for _ in range(200)]
+        assert all(low <= d <= 0.4 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_decide_reasons(self):
+        policy = RetryPolicy(max_attempts=2, base_delay_s=1.0, jitter="none")
+        success = AgentResult(status=ResultStatus.SUCCESS, message="ok")
+        rejected = AgentResult(status=ResultStatus.REJECTED, message="busy")
+
+        assert policy.decide(success, 1).reason == "succeeded"
+        assert policy.decide(rejected, 1).reason == "not_retryable"
+        assert policy.decide(FAILURE, 2).reason == "max_attempts"
+        assert policy.decide(
+            FAILURE, 1, AgentContext(task="t", deadline=time.time() + 0.5)
+        ).reason == "deadline"
+
+        decision = policy.decide(FAILURE, 1)
+        assert decision.retry and decision.delay_s == 1.0
+
+    def test_rejects_invalid_settings(self):
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+        with pytest.raises(ValueError):
+            RetryPolicy(jitter="random")
+
+
+class TestRetryBudget:
+    """Retries as a share of requests."""
+
+    def test_exhausts_without_deposits(self):
+        budget = RetryBudget(ratio=0.5, min_per_second=0)
+        assert not budget.try_withdraw()
+        assert EAGER.decide(FAILURE, 1, budget=budget).reason == "budget"
+
+        budget.deposit()
+        budget.deposit()
+        assert budget.try_withdraw()
+        assert not budget.try_withdraw()
+
+        stats = budget.stats()
+        assert (stats.requests, stats.retries, stats.exhausted) == (2, 1, 3)
+
+    def test_balance_is_capped(self):
+        budget = RetryBudget(ratio=1.0, min_per_second=0, max_balance=2.0)
+        for _ in range(10):
+            budget.deposit()
+        assert [budget.try_withdraw() for _ in range(3)] == [True, True, False]
+
+    def test_orchestrator_retries_do_not_deposit(self, make_registry):
+        budget = RetryBudget(ratio=0.5, min_per_second=0)
+        orchestrator = AgentOrchestrator(
+            make_registry(flaky=ALWAYS_FAILS, async_flaky=ASYNC_ALWAYS_FAILS),
+            retry_policy=EAGER, retry_budget=budget
+        )
+
+        for skill_name in ("flaky", "async_flaky"):
+            for _ in range(20):
+                asyncio.run(orchestrator.execute_task_async(
+                    skill_name, AgentContext(task="t")
+                ))
+        assert budget.stats().requests == 40
+        assert_within_ratio(budget)
+
+    def test_scheduler_retries_do_not_deposit(self, make_registry):
+        budget = RetryBudget(ratio=0.5, min_per_second=0)
+        orchestrator = AgentOrchestrator(
+            make_registry(flaky=ALWAYS_FAILS),
+            retry_policy=EAGER, retry_budget=budget
+        )
+        scheduler = PriorityScheduler(orchestrator, workers=2)
+        try:
+            futures = [
+                scheduler.submit("flaky", AgentContext(task="t"))
+                for _ in range(20)
+            ]
+            for future in futures:
+                future.result(timeout=5)
+        finally:
+            scheduler.shutdown()
+
+        assert budget.stats().requests == 20
+        assert_within_ratio(budget)
+
+    def test_decorator_deposits_once_per_call(self):
+        budget = RetryBudget(ratio=0.5, min_per_second=0)
+
+        @retry(policy=EAGER, budget=budget)
+        def execute(context: AgentContext) -> AgentResult:
+            return FAILURE
+
+        for _ in range(20):
+            execute(AgentContext(task="t"))
+        assert budget.stats().requests == 20
+        assert_within_ratio(budget)
@@ -0,0 +1,158 @@
+"""
+PriorityScheduler tests: dispatch order, fairness and reservations.
+"""
+
+import time
+
+import pytest
+
+from core.orchestrator import AgentOrchestrator
+from core.protocols import AgentContext, TaskPriority
+from core.scheduler import PriorityScheduler
+
+# Records the order tasks start in; tasks with parameters["hold"] block
+# until the test sets the gate
+RECORDER = """
+    import threading
+    from core.protocols import AgentContext, AgentResult, ResultStatus
+
+    gate = threading.Event()
+    started = []
+
+    def execute(context: AgentContext) -> AgentResult:
+        started.append((context.priority, context.task))
+        if context.parameters.get("hold"):
+            gate.wait(5)
+        return AgentResult(
+            status=ResultStatus.SUCCESS, data=context.task, message="ok"
+        )
+"""
+
+
+def context(priority: TaskPriority, name: str = "t", hold: bool = False):
+    return AgentContext(task=name, priority=priority, parameters={"hold": hold})
+
+
+def wait_until(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def recorder(make_registry):
+    registry = make_registry(recorder=RECORDER)
+    state = registry.get_skill("recorder").__globals__
+    yield AgentOrchestrator(registry), state
+    state["gate"].set()
+
+
+class TestPriorityScheduler:
+    """Dispatch order across priority queues."""
+
+    def test_higher_priority_runs_first_without_starving_low(self, recorder):
+        orchestrator, state = recorder
+        with PriorityScheduler(orchestrator, workers=1) as scheduler:
+            # Occupy the only worker while the queues fill up
+            blocker = scheduler.submit(
+                "recorder", context(TaskPriority.NORMAL, hold=True)
+            )
+            wait_until(lambda: state["started"])
+
+            futures = [
+                scheduler.submit("recorder", context(TaskPriority.LOW))
+                for _ in range(10)
+            ] + [
+                scheduler.submit("recorder", context(TaskPriority.CRITICAL))
+                for _ in range(40)
+            ]
+            state["gate"].set()
+            for future in [blocker, *futures]:
+                assert future.result(timeout=5).success
+
+        order = [priority for priority, _ in state["started"][1:]]
+        assert order[0] is TaskPriority.CRITICAL
+
+        # Weights 8:1 - LOW gets a share while CRITICAL is still queued
+        first = order[:27]
+        assert 2 <= first.count(TaskPriority.LOW) <= 4
+        last_critical = len(order) - 1 - order[::-1].index(TaskPriority.CRITICAL)
+        assert order.index(TaskPriority.LOW) < last_critical
+
+    def test_same_priority_is_fifo(self, recorder):
+        orchestrator, state = recorder
+        with PriorityScheduler(orchestrator, workers=1) as scheduler:
+            blocker = scheduler.submit(
+                "recorder", context(TaskPriority.NORMAL, hold=True)
+            )
+            wait_until(lambda: state["started"])
+            futures = [
+                scheduler.submit("recorder", context(TaskPriority.HIGH, f"h{i}"))
+                for i in range(5)
+            ]
+            state["gate"].set()
+            assert [f.result(timeout=5).data for f in futures] == [
+                f"h{i}" for i in range(5)
+            ]
+            blocker.result(timeout=5)
+
+        assert [name for _, name in state["started"][1:]] == [
+            f"h{i}" for i in range(5)
+        ]
+
+    def test_reservation_keeps_a_worker_for_critical(self, recorder):
+        orchestrator, state = recorder
+        with PriorityScheduler(
+            orchestrator, workers=2, reservations={TaskPriority.CRITICAL: 1}
+        ) as scheduler:
+            low = [
+                scheduler.submit("recorder", context(TaskPriority.LOW, hold=True))
+                for _ in range(3)
+            ]
+            wait_until(lambda: state["started"])
+            time.sleep(0.05)
+            assert scheduler.metrics().idle_workers == 1
+
+            critical = scheduler.submit(
+                "recorder", context(TaskPriority.CRITICAL, "c")
+            )
+            assert critical.result(timeout=2).data == "c"
+
+            state["gate"].set()
+            for future in low:
+                future.result(timeout=5)
+
+    def test_cancelled_task_never_runs(self, recorder):
+        orchestrator, state = recorder
+        with PriorityScheduler(orchestrator, workers=1) as scheduler:
+            blocker = scheduler.submit(
+                "recorder", context(TaskPriority.NORMAL, hold=True)
+            )
+            wait_until(lambda: state["started"])
+            doomed = scheduler.submit(
+                "recorder", context(TaskPriority.NORMAL, "doomed")
+            )
+            assert doomed.cancel()
+            state["gate"].set()
+            blocker.result(timeout=5)
+
+        assert "doomed" not in [name for _, name in state["started"]]
+        assert scheduler.metrics().queue_depth == 0
+
+    def test_run_batch_keeps_input_order(self, recorder):
+        orchestrator, _ = recorder
+        tasks = [
+            ("recorder", context(p, f"t{i}"))
+            for i, p in enumerate([TaskPriority.LOW, TaskPriority.CRITICAL] * 3)
+        ]
+        with PriorityScheduler(orchestrator, workers=2) as scheduler:
+            results = orchestrator.execute_batch(tasks, executor=scheduler)
+        assert [r.data for r in results] == [f"t{i}" for i in range(6)]
+
+    def test_rejects_reservations_without_a_free_worker(self, recorder):
+        orchestrator, _ = recorder
+        with pytest.raises(ValueError):
+            PriorityScheduler(
+                orchestrator, workers=2, reservations={TaskPriority.CRITICAL: 2}
+            )
@@ -0,0 +1,201 @@
+"""
+Server tests: framing, pipelining, backpressure and both clients.
+"""
+
+import asyncio
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from core.codec import FRAME_HEADER, FrameTooLarge, encode_frame, read_frame
+from core.orchestrator import AgentOrchestrator
+from core.protocols import AgentContext, ResultStatus
+from core.server import BlockingClient, Client, OrchestratorServer, ServerError
+
+# Echoes its task after an async sleep of parameters["delay"]
+ECHO = """
+    import asyncio
+    from core.protocols import AgentContext, AgentResult, ResultStatus
+
+    async def execute(context: AgentContext) -> AgentResult:
+        await asyncio.sleep(context.parameters.get("delay", 0.0))
+        return AgentResult(
+            status=ResultStatus.SUCCESS, data=context.task, message="ok"
+        )
+"""
+
+
+def echo(name: str, delay: float = 0.0) -> AgentContext:
+    return AgentContext(task=name, parameters={"delay": delay})
+
+
+@pytest.fixture
+def orchestrator(make_registry):
+    return AgentOrchestrator(make_registry(echo=ECHO))
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are limited to ~100 bytes; tmp_path can be longer
+    with tempfile.TemporaryDirectory(prefix="srv") as directory:
+        yield str(Path(directory) / "agents.sock")
+
+
+def serving(orchestrator, socket_path, **options):
+    """Run test(server) against a server listening on socket_path."""
+    def run(test):
+        async def main():
+            server = OrchestratorServer(orchestrator, **options)
+            await server.start_unix(socket_path)
+            try:
+                return await test(server)
+            finally:
+                await server.close()
+
+        return asyncio.run(main())
+
+    return run
+
+
+class TestFraming:
+    """Length-prefixed frames."""
+
+    def test_round_trip_and_clean_end(self):
+        async def run():
+            reader = asyncio.StreamReader()
+            reader.feed_data(encode_frame({"a": [1, 2]}) + encode_frame("b"))
+            reader.feed_eof()
+            return [await read_frame(reader) for _ in range(3)]
+
+        assert asyncio.run(run()) == [{"a": [1, 2]}, "b", None]
+
+    def test_oversized_frame_is_refused(self):
+        async def run():
+            reader = asyncio.StreamReader()
+            reader.feed_data(encode_frame("x" * 100))
+            reader.feed_eof()
+            await read_frame(reader, max_frame_bytes=10)
+
+        with pytest.raises(FrameTooLarge):
+            asyncio.run(run())
+
+
+class TestOrchestratorServer:
+    """Requests over a Unix socket."""
+
+    def test_client_operations(self, orchestrator, socket_path):
+        async def test(server):
+            async with await Client.connect(server.address) as client:
+                await client.ping()
+                assert await client.list_skills() == ["echo"]
+
+                result = await client.execute("echo", echo("hello"))
+                assert result.data == "hello"
+
+                results = await client.execute_batch(
+                    [("echo", echo(f"t{i}")) for i in range(3)]
+                )
+                assert [r.data for r in results] == ["t0", "t1", "t2"]
+
+                missing = await client.execute("nope", echo("x"))
+                assert missing.status == ResultStatus.FAILURE
+
+        serving(orchestrator, socket_path)(test)
+
+    def test_pipelined_responses_return_as_they_complete(
+        self, orchestrator, socket_path
+    ):
+        async def test(server):
+            reader, writer = await asyncio.open_unix_connection(server.address)
+            for request_id, delay in ((1, 0.2), (2, 0.0)):
+                writer.write(encode_frame({
+                    "id": request_id, "op": "execute", "skill": "echo",
+                    "context": {"task": f"r{request_id}",
+                                "parameters": {"delay": delay}},
+                }))
+            await writer.drain()
+
+            responses = [await read_frame(reader) for _ in range(2)]
+            writer.close()
+            return responses
+
+        responses = serving(orchestrator, socket_path)(test)
+        assert [r["id"] for r in responses] == [2, 1]
+        assert responses[0]["result"]["data"] == "r2"
+
+    def test_concurrent_calls_share_one_connection(self, orchestrator, socket_path):
+        async def test(server):
+            async with await Client.connect(server.address) as client:
+                start = time.perf_counter()
+                results = await asyncio.gather(*(
+                    client.execute("echo", echo(f"t{i}", 0.1)) for i in range(10)
+                ))
+                return time.perf_counter() - start, results, server.connections
+
+        elapsed, results, connections = serving(orchestrator, socket_path)(test)
+        assert [r.data for r in results] == [f"t{i}" for i in range(10)]
+        assert elapsed < 0.5 and connections == 1
+
+    def test_max_pipeline_limits_in_flight_requests(self, orchestrator, socket_path):
+        async def test(server):
+            async with await Client.connect(server.address) as client:
+                start = time.perf_counter()
+                await asyncio.gather(*(
+                    client.execute("echo", echo(f"t{i}", 0.05)) for i in range(4)
+                ))
+                return time.perf_counter() - start
+
+        elapsed = serving(orchestrator, socket_path, max_pipeline=1)(test)
+        assert elapsed >= 4 * 0.05
+
+    def test_bad_request_keeps_the_connection(self, orchestrator, socket_path):
+        async def test(server):
+            async with await Client.connect(server.address) as client:
+                with pytest.raises(ServerError, match="Unknown op"):
+                    await client._request({"op": "explode"})
+                await client.ping()
+
+        serving(orchestrator, socket_path)(test)
+
+    def test_oversized_frame_closes_only_that_connection(
+        self, orchestrator, socket_path
+    ):
+        async def test(server):
+            reader, writer = await asyncio.open_unix_connection(server.address)
+            writer.write(FRAME_HEADER.pack(1024))
+            await writer.drain()
+            assert await reader.read() == b""
+            writer.close()
+
+            async with await Client.connect(server.address) as client:
+                await client.ping()
+
+        serving(orchestrator, socket_path, max_frame_bytes=64)(test)
+
+
+class TestBlockingClient:
+    """Synchronous client against a TCP server on an ephemeral port."""
+
+    def test_round_trips(self, orchestrator):
+        loop = asyncio.new_event_loop()
+        server = OrchestratorServer(orchestrator)
+        loop.run_until_complete(server.start_tcp(port=0))
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            with BlockingClient(server.address, timeout=5) as client:
+                client.ping()
+                assert client.execute("echo", echo("sync")).data == "sync"
+                assert [r.data for r in client.execute_batch(
+                    [("echo", echo("a")), ("echo", echo("b"))]
+                )] == ["a", "b"]
+                with pytest.raises(ServerError):
+                    client._request({"op": "explode"})
+        finally:
+            asyncio.run_coroutine_threadsafe(server.close(), loop).result(5)
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(5)
+            loop.close()
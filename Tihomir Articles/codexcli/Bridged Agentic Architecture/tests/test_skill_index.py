@@ -0,0 +1,168 @@
+"""
+SkillIndex tests: sorted listing, prefix and tag lookup, suggestions.
+"""
+
+import random
+import string
+
+from core.orchestrator import AgentOrchestrator
+from core.protocols import AgentContext
+from core.skill_index import SkillIndex, bounded_edit_distance
+
+TAGGED = """
+    from core.protocols import AgentContext, AgentResult, ResultStatus
+
+    def get_metadata():
+        return {{"tags": {tags!r}}}
+
+    def execute(context: AgentContext) -> AgentResult:
+        return AgentResult(status=ResultStatus.SUCCESS, message="ok")
+"""
+
+
+def osa_distance(a: str, b: str) -> int:
+    """Unbounded optimal string alignment distance (reference)."""
+    rows = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i in range(len(a) + 1):
+        rows[i][0] = i
+    for j in range(len(b) + 1):
+        rows[0][j] = j
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            rows[i][j] = min(
+                rows[i - 1][j] + 1, rows[i][j - 1] + 1, rows[i - 1][j - 1] + cost
+            )
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                rows[i][j] = min(rows[i][j], rows[i - 2][j - 2] + 1)
+    return rows[-1][-1]
+
+
+class TestSkillIndex:
+    """Listing and lookup."""
+
+    def test_names_stay_sorted_across_adds_and_removes(self):
+        index = SkillIndex(["b", "d"])
+        index.add("a")
+        index.add("c")
+        index.add("e")
+        assert index.names() == ("a", "b", "c", "d", "e")
+
+        assert index.remove("c") and not index.remove("c")
+        assert index.names() == ("a", "b", "d", "e")
+        assert "c" not in index and len(index) == 4
+
+    def test_snapshot_is_shared_until_the_index_changes(self):
+        index = SkillIndex(["a", "b"])
+        snapshot = index.names()
+        assert index.names() is snapshot
+
+        index.add("c")
+        assert index.names() is not snapshot
+
+    def test_prefix_lookup(self):
+        index = SkillIndex(["data_load", "data_save", "database", "dat", "report"])
+        assert index.with_prefix("data_") == ["data_load", "data_save"]
+        assert index.with_prefix("dat", limit=2) == ["dat", "data_load"]
+        assert index.with_prefix("zzz") == []
+
+    def test_tags_are_replaced_on_re_add(self):
+        index = SkillIndex()
+        index.add("load", tags=["io", "data"])
+        index.add("plot", tags=["viz"])
+        assert index.with_tag("io") == ["load"]
+        assert index.tags() == ["data", "io", "viz"]
+
+        index.add("load", tags=["data"])
+        assert index.with_tag("io") == []
+        index.remove("plot")
+        assert index.tags() == ["data"]
+
+
+class TestSuggestions:
+    """Did-you-mean ranking."""
+
+    def test_completions_then_truncations_then_typos(self):
+        index = SkillIndex(["analyze_data", "analyze_text", "echo", "report"])
+        assert index.suggest("analyze") == ["analyze_data", "analyze_text"]
+        assert index.suggest("analyze_data_v2") == ["analyze_data"]
+        assert index.suggest("ecoh") == ["echo"]
+        assert index.suggest("nothing_like_it") == []
+
+    def test_closest_first_and_never_the_query(self):
+        index = SkillIndex(["render", "tender", "gender", "renders"])
+        assert index.suggest("rendr") == ["render"]
+        assert index.suggest("rendr", limit=3, max_distance=2) == [
+            "render", "gender", "renders"
+        ]
+        assert "render" not in index.suggest("render")
+
+    def test_memoized_results_follow_index_changes(self):
+        index = SkillIndex(["alpha"])
+        assert index.suggest("alpah") == ["alpha"]
+        index.add("alpah2")
+        assert index.suggest("alpah") == ["alpah2", "alpha"]
+
+    def test_gram_filter_has_no_false_negatives(self):
+        rng = random.Random(7)
+        alphabet = string.ascii_lowercase[:6] + "_"
+        names = {
+            "".join(rng.choices(alphabet, k=rng.randint(3, 12)))
+            for _ in range(300)
+        }
+        index = SkillIndex(names)
+
+        for _ in range(50):
+            query = "".join(rng.choices(alphabet, k=rng.randint(3, 12)))
+            max_distance = 2
+            expected = {
+                name for name in names
+                if name != query and osa_distance(query, name) <= max_distance
+            }
+            found = set(index._candidates(query, max_distance))
+            assert expected <= found
+
+
+class TestBoundedEditDistance:
+    """Banded distance against the reference."""
+
+    def test_known_distances(self):
+        assert bounded_edit_distance("echo", "ecoh", 2) == 1
+        assert bounded_edit_distance("kitten", "sitting", 3) == 3
+        assert bounded_edit_distance("kitten", "sitting", 2) is None
+        assert bounded_edit_distance("same", "same", 0) == 0
+
+    def test_matches_reference_within_bound(self):
+        rng = random.Random(11)
+        for _ in range(2000):
+            a = "".join(rng.choices("abc", k=rng.randint(0, 8)))
+            b = "".join(rng.choices("abc", k=rng.randint(0, 8)))
+            bound = rng.randint(0, 3)
+            expected = osa_distance(a, b)
+            assert bounded_edit_distance(a, b, bound) == (
+                expected if expected <= bound else None
+            )
+
+
+class TestRegistryLookup:
+    """The index behind SkillRegistry."""
+
+    def test_find_and_suggest_skills(self, make_registry):
+        registry = make_registry(
+            load_csv=TAGGED.format(tags=["io"]),
+            load_json=TAGGED.format(tags=["io", "json"]),
+            plot=TAGGED.format(tags="viz"),
+        )
+        assert registry.list_skills() == ["load_csv", "load_json", "plot"]
+        assert registry.find_skills(prefix="load_") == ["load_csv", "load_json"]
+        assert registry.find_skills(tag="viz") == ["plot"]
+        assert registry.find_skills(prefix="load", tag="json") == ["load_json"]
+        assert registry.suggest_skills("lod_csv") == ["load_csv"]
+
+    def test_not_found_result_carries_suggestions(self, make_registry):
+        orchestrator = AgentOrchestrator(
+            make_registry(plot=TAGGED.format(tags=[]))
+        )
+        result = orchestrator.execute_task("plto", AgentContext(task="t"))
+        assert result.metadata["suggestions"] == ["plot"]
+        assert result.metadata["available_skills"] == ("plot",)
@@ -0,0 +1,133 @@
+"""
+Streaming execution tests: chunk order, backpressure and early exit.
+"""
+
+import asyncio
+
+import pytest
+
+from core.orchestrator import AgentOrchestrator
+from core.protocols import AgentContext, ResultStatus
+
+# Yields parameters["chunks"] chunks, failing after parameters["fail_at"]
+COUNTER = """
+    import asyncio
+    from core.protocols import AgentContext, AgentResult, ResultStatus
+
+    produced = 0
+    closed = False
+
+    async def execute_stream(context: AgentContext):
+        global produced, closed
+        try:
+            for i in range(context.parameters.get("chunks", 3)):
+                if i == context.parameters.get("fail_at"):
+                    raise RuntimeError("stream broke")
+                produced += 1
+                yield AgentResult(status=ResultStatus.PARTIAL, data=i, message="chunk")
+                await asyncio.sleep(0)
+        finally:
+            closed = True
+"""
+
+PLAIN = """
+    from core.protocols import AgentContext, AgentResult, ResultStatus
+
+    def execute(context: AgentContext) -> AgentResult:
+        return AgentResult(status=ResultStatus.SUCCESS, data="whole", message="ok")
+"""
+
+
+def collect(orchestrator, skill_name: str, **parameters) -> list:
+    async def run():
+        context = AgentContext(task="t", parameters=parameters)
+        return [c async for c in orchestrator.execute_stream(skill_name, context)]
+
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def streaming(make_registry):
+    registry = make_registry(counter=COUNTER, plain=PLAIN)
+    return AgentOrchestrator(registry), registry.get_stream_skill("counter").__globals__
+
+
+class TestExecuteStream:
+    """execute_stream."""
+
+    def test_yields_chunks_in_order_with_timing(self, streaming):
+        orchestrator, _ = streaming
+        chunks = collect(orchestrator, "counter", chunks=4)
+
+        assert [c.data for c in chunks] == [0, 1, 2, 3]
+        assert [c.metadata["chunk_index"] for c in chunks] == [0, 1, 2, 3]
+        assert "time_to_first_chunk_ms" in chunks[0].metadata
+        assert "time_to_first_chunk_ms" not in chunks[1].metadata
+
+    def test_skill_exception_becomes_final_failure_chunk(self, streaming):
+        orchestrator, _ = streaming
+        chunks = collect(orchestrator, "counter", chunks=5, fail_at=2)
+
+        assert [c.data for c in chunks[:2]] == [0, 1]
+        assert chunks[-1].status == ResultStatus.FAILURE
+        assert len(chunks) == 3
+
+    def test_producer_waits_for_a_slow_consumer(self, streaming):
+        orchestrator, state = streaming
+
+        async def run():
+            context = AgentContext(task="t", parameters={"chunks": 100})
+            stream = orchestrator.execute_stream("counter", context, buffer_size=4)
+            await stream.__anext__()
+            await asyncio.sleep(0.05)
+            produced = state["produced"]
+            await stream.aclose()
+            return produced
+
+        # One chunk consumed, four buffered, one blocked on put()
+        assert asyncio.run(run()) <= 6
+        assert state["closed"]
+
+    def test_early_exit_stops_the_producer(self, streaming):
+        orchestrator, state = streaming
+
+        async def run():
+            context = AgentContext(task="t", parameters={"chunks": 1000})
+            async for chunk in orchestrator.execute_stream("counter", context):
+                if chunk.data == 2:
+                    break
+            await asyncio.sleep(0.01)
+
+        asyncio.run(run())
+        assert state["closed"]
+        assert state["produced"] < 1000
+
+    def test_stream_middleware_wraps_chunks(self, streaming):
+        orchestrator, _ = streaming
+
+        async def double(context, chunks):
+            async for chunk in chunks:
+                chunk.data *= 2
+                yield chunk
+
+        orchestrator.add_stream_middleware(double)
+        assert [c.data for c in collect(orchestrator, "counter")] == [0, 2, 4]
+
+    def test_non_streaming_skill_yields_one_result(self, streaming):
+        orchestrator, _ = streaming
+        [result] = collect(orchestrator, "plain")
+        assert result.data == "whole"
+
+        [missing] = collect(orchestrator, "nope")
+        assert missing.status == ResultStatus.FAILURE
+
+    def test_rejects_invalid_buffer_size(self, streaming):
+        orchestrator, _ = streaming
+
+        async def run():
+            context = AgentContext(task="t")
+            async for _ in orchestrator.execute_stream("counter", context, 0):
+                pass
+
+        with pytest.raises(ValueError):
+            asyncio.run(run())
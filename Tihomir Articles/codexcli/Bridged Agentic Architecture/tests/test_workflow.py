@@ -0,0 +1,142 @@
+"""
+Workflow tests: dependency order, data flow, pruning and aborts.
+"""
+
+import time
+
+import pytest
+
+from core.orchestrator import AgentOrchestrator
+from core.protocols import AgentContext, ResultStatus, TaskPriority
+from core.workflow import Workflow
+
+# Returns its task name joined to its upstream outputs; parameters pick
+# the status and a delay
+STEP = """
+    import threading
+    import time
+    from core.protocols import AgentContext, AgentResult, ResultStatus
+
+    lock = threading.Lock()
+    events = []
+
+    def execute(context: AgentContext) -> AgentResult:
+        with lock:
+            events.append(("start", context.task))
+        time.sleep(context.parameters.get("delay", 0.0))
+        upstream = context.parameters.get("upstream", {})
+        with lock:
+            events.append(("end", context.task))
+        return AgentResult(
+            status=ResultStatus(context.parameters.get("status", "success")),
+            data="+".join([context.task, *sorted(map(str, upstream.values()))]),
+            message="done"
+        )
+"""
+
+
+def node(name: str, **parameters) -> AgentContext:
+    priority = parameters.pop("priority", TaskPriority.NORMAL)
+    return AgentContext(task=name, parameters=parameters, priority=priority)
+
+
+@pytest.fixture
+def step(make_registry):
+    registry = make_registry(step=STEP)
+    return AgentOrchestrator(registry), registry.get_skill("step").__globals__
+
+
+def position(events: list, kind: str, name: str) -> int:
+    return events.index((kind, name))
+
+
+class TestWorkflow:
+    """Workflow definition and execution."""
+
+    def test_dependencies_finish_before_dependents_start(self, step):
+        orchestrator, state = step
+        workflow = (
+            Workflow("diamond")
+            .add("load", "step", node("load", delay=0.02))
+            .add("left", "step", node("left", delay=0.02), depends_on=["load"])
+            .add("right", "step", node("right"), depends_on=["load"])
+            .add("join", "step", node("join"), depends_on=["left", "right"])
+        )
+        outcome = orchestrator.execute_workflow(workflow, max_workers=4)
+
+        assert outcome.success
+        assert list(outcome.results) == ["load", "left", "right", "join"]
+        assert outcome["join"].data == "join+left+load+right+load"
+
+        events = state["events"]
+        for parent, child in [("load", "left"), ("load", "right"),
+                              ("left", "join"), ("right", "join")]:
+            assert position(events, "end", parent) < position(events, "start", child)
+
+    def test_independent_branches_run_in_parallel(self, step):
+        orchestrator, _ = step
+        workflow = Workflow("fan")
+        for i in range(4):
+            workflow.add(f"n{i}", "step", node(f"n{i}", delay=0.1))
+
+        start = time.perf_counter()
+        assert orchestrator.execute_workflow(workflow, max_workers=4).success
+        assert time.perf_counter() - start < 0.3
+
+    def test_failure_prunes_only_descendants(self, step):
+        orchestrator, state = step
+        workflow = (
+            Workflow("prune")
+            .add("bad", "step", node("bad", status="failure"))
+            .add("child", "step", node("child"), depends_on=["bad"])
+            .add("grandchild", "step", node("grandchild"), depends_on=["child"])
+            .add("other", "step", node("other", delay=0.02))
+        )
+        outcome = orchestrator.execute_workflow(workflow)
+
+        assert outcome.failed == ["bad"]
+        assert outcome.skipped == ["child", "grandchild"]
+        assert outcome["other"].success
+        assert ("start", "child") not in state["events"]
+
+    def test_rejected_node_counts_as_failed(self, step):
+        orchestrator, _ = step
+        workflow = (
+            Workflow("rejected")
+            .add("busy", "step", node("busy", status="rejected"))
+            .add("after", "step", node("after"), depends_on=["busy"])
+        )
+        outcome = orchestrator.execute_workflow(workflow)
+
+        assert not outcome.success
+        assert outcome.failed == ["busy"]
+        assert outcome.skipped == ["after"]
+
+    def test_critical_failure_aborts_the_workflow(self, step):
+        orchestrator, _ = step
+        workflow = (
+            Workflow("abort")
+            .add("fatal", "step", node(
+                "fatal", status="failure", priority=TaskPriority.CRITICAL
+            ))
+            .add("slow", "step", node("slow", delay=0.1))
+            .add("later", "step", node("later"), depends_on=["slow"])
+        )
+        outcome = orchestrator.execute_workflow(workflow, max_workers=2)
+
+        assert outcome.aborted_by == "fatal"
+        assert outcome["slow"].success  # Already running: kept
+        assert outcome["later"].status == ResultStatus.SKIPPED
+
+    def test_rejects_invalid_graphs(self):
+        workflow = Workflow().add("a", "step")
+        with pytest.raises(ValueError):
+            workflow.add("a", "step")
+        with pytest.raises(ValueError):
+            workflow.add("b", "step", depends_on=["missing"])
+        with pytest.raises(ValueError):
+            workflow.add(
+                "c", "step",
+                AgentContext(task="c", parameters={"upstream": 1}),
+                depends_on=["a"]
+            )
@@ -0,0 +1,325 @@
+"""
+Tracing: Low-Overhead Spans Through Orchestrator, Middleware, and Decorators
+
+Records where the time of a single execute_task went—middleware layers,
+decorator layers (validation, cache lookup, retries), and the skill
+itself—as nested spans with trace/parent IDs.
+
+Single Responsibility: This module ONLY creates, nests, and exports
+spans. Instrumentation points (AgentOrchestrator, decorators.py) decide
+what to wrap.
+
+Sampling:
+    Head-based: the decision is made once, when the root span of a trace
+    starts, and inherited by every child. Unsampled requests get a shared
+    no-op span and never touch the context variable, so with
+    sample_rate=0 (the default) tracing costs one attribute check per
+    instrumentation point.
+
+Export:
+    ChromeTraceExporter writes one Chrome trace event (``"ph": "X"``) per
+    line. ``jsonl_to_chrome_trace`` wraps a file into the
+    ``{"traceEvents": [...]}`` document accepted by chrome://tracing and
+    Perfetto.
+
+Usage:
+    from core.tracing import Tracer, ChromeTraceExporter, set_tracer
+
+    set_tracer(Tracer(ChromeTraceExporter("traces.jsonl"), sample_rate=0.01))
+    orchestrator.execute_task("data_processor", context)
+"""
+
+import atexit
+import json
+import os
+import random
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Protocol, runtime_checkable
+
+
+# ============================================================================
+# Span Context
+# ============================================================================
+
+# Innermost sampled span of the current thread/task (None: not tracing)
+_current_span: ContextVar["Span | None"] = ContextVar(
+    "agent_current_span", default=None
+)
+
+# perf_counter_ns() -> epoch nanoseconds, for wall-clock event timestamps
+_EPOCH_OFFSET_NS = time.time_ns() - time.perf_counter_ns()
+
+
+def _new_id() -> str:
+    return f"{random.getrandbits(64):016x}"
+
+
+# ============================================================================
+# Spans
+# ============================================================================
+
+class Span:
+    """
+    One timed operation within a sampled trace.
+
+    Use as a context manager; entering makes it the parent of spans
+    started in the same thread or asyncio task, exiting records the end
+    time and hands the span to the tracer's exporter.
+    """
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "attributes",
+        "start_ns", "end_ns", "thread_id", "_tracer", "_token"
+    )
+
+    sampled = True
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        trace_id: str,
+        parent_id: str | None,
+        attributes: dict[str, Any]
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = _new_id()
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.start_ns = 0
+        self.end_ns = 0
+        self.thread_id = 0
+        self._tracer = tracer
+        self._token = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach a key/value annotation (exported under "args")."""
+        self.attributes[key] = value
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        self.thread_id = threading.get_ident()
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.end_ns = time.perf_counter_ns()
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self.attributes["error"] = f"{exc_type.__name__}: {exc}"
+        self._tracer._export(self)
+
+
+class _NoopSpan:
+    """Shared stand-in for unsampled spans; every operation is a no-op."""
+
+    __slots__ = ()
+
+    sampled = False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+# ============================================================================
+# Exporters
+# ============================================================================
+
+@runtime_checkable
+class SpanExporter(Protocol):
+    """Receives finished spans."""
+
+    def export(self, span: Span) -> None:
+        ...
+
+
+class ChromeTraceExporter:
+    """
+    Appends finished spans to a JSON-lines file of Chrome trace events.
+
+    Each line is a complete event (``"ph": "X"``) with microsecond
+    timestamps; trace, span and parent IDs plus span attributes are
+    stored under ``"args"``. Writes are buffered and serialized by a
+    lock; the file is flushed on close() and at interpreter exit.
+    """
+
+    def __init__(self, path: Path | str, category: str = "agent"):
+        """
+        Args:
+            path: Output file (appended to; parent directories created)
+            category: Chrome trace "cat" field for every event
+        """
+        self.path = Path(path).expanduser()
+        self.category = category
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        atexit.register(self.close)
+
+    def export(self, span: Span) -> None:
+        event = {
+            "name": span.name,
+            "cat": self.category,
+            "ph": "X",
+            "ts": (span.start_ns + _EPOCH_OFFSET_NS) / 1000,
+            "dur": (span.end_ns - span.start_ns) / 1000,
+            "pid": self._pid,
+            "tid": span.thread_id,
+            "args": {
+                "trace_id": span.trace_id,
+                "span_id": span.span_id,
+                "parent_id": span.parent_id,
+                **span.attributes,
+            },
+        }
+        line = json.dumps(event, default=str)
+
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line + "\n")
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class InMemoryExporter:
+    """Collects finished spans in a list (for inspection and debugging)."""
+
+    def __init__(self):
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+
+def jsonl_to_chrome_trace(source: Path | str, destination: Path | str) -> int:
+    """
+    Convert a ChromeTraceExporter file into a chrome://tracing document.
+
+    Returns:
+        Number of events written
+    """
+    with open(source, encoding="utf-8") as f:
+        events = [json.loads(line) for line in f if line.strip()]
+
+    with open(destination, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    return len(events)
+
+
+# ============================================================================
+# Tracer
+# ============================================================================
+
+class Tracer:
+    """
+    Starts spans and applies head-based sampling.
+
+    Design Principles:
+    - Sampling decided once per trace; children follow their root
+    - Near-zero cost when unsampled (shared no-op span, no allocation)
+    - DIP: exports through any SpanExporter
+    """
+
+    def __init__(
+        self,
+        exporter: SpanExporter | None = None,
+        sample_rate: float = 1.0
+    ):
+        """
+        Args:
+            exporter: Destination for finished spans (None: tracing off)
+            sample_rate: Fraction of root spans to record (0.0 - 1.0)
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"sample_rate must be in [0, 1], got {sample_rate}")
+
+        self.exporter = exporter
+        self.sample_rate = sample_rate if exporter is not None else 0.0
+
+    def start_span(self, name: str, **attributes: Any) -> Span | _NoopSpan:
+        """
+        Start a span: a child of the current span if one is active,
+        otherwise the root of a new trace, subject to sampling.
+        """
+        parent = _current_span.get()
+        if parent is not None:
+            return Span(parent._tracer, name, parent.trace_id,
+                        parent.span_id, attributes)
+
+        if self.sample_rate == 0.0 or (
+            self.sample_rate < 1.0 and random.random() >= self.sample_rate
+        ):
+            return NOOP_SPAN
+
+        return Span(self, name, _new_id(), None, attributes)
+
+    def _export(self, span: Span) -> None:
+        if self.exporter is not None:
+            self.exporter.export(span)
+
+
+# ============================================================================
+# Global Tracer and Child Spans
+# ============================================================================
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """The process-wide tracer (disabled until set_tracer is called)."""
+    return _tracer
+
+
+def set_tracer(tracer: Tracer) -> None:
+    """Install the process-wide tracer used by orchestrators and decorators."""
+    global _tracer
+    _tracer = tracer
+
+
+def current_span() -> Span | None:
+    """The innermost active sampled span, if any."""
+    return _current_span.get()
+
+
+def child_span(name: str, **attributes: Any) -> Span | _NoopSpan:
+    """
+    Start a span under the current one, or a no-op when not tracing.
+
+    Never starts a new trace, so instrumentation inside skills and
+    decorators only records work that belongs to a sampled request.
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return NOOP_SPAN
+    return Span(parent._tracer, name, parent.trace_id, parent.span_id,
+                attributes)
@@ -0,0 +1,375 @@
+"""
+Workflow: Dependency-Aware Parallel Execution of Skill DAGs
+
+Runs tasks that consume the outputs of earlier tasks. Independent
+branches execute in parallel; each task starts as soon as all of its
+dependencies have succeeded.
+
+Single Responsibility: This module ONLY orders and wires tasks. Each
+task is still executed by AgentOrchestrator.execute_task, with its
+middleware, metrics and error containment.
+
+Data Flow:
+    Upstream ``AgentResult.data`` is handed to downstream tasks by
+    reference as ``context.parameters[upstream_key][dependency_name]``.
+    Only the downstream parameters dict is rebuilt (shallow); payloads
+    are never copied. Because upstream outputs are parameters, they are
+    part of cache keys.
+
+Failure Handling:
+- A failed task (status FAILURE, REJECTED or SKIPPED) prunes only its
+  descendants, which are reported as SKIPPED; unrelated branches keep
+  running
+- A failed CRITICAL task aborts the whole workflow, like execute_batch
+
+Usage:
+    workflow = (
+        Workflow("report")
+        .add("load", "data_loader", AgentContext(task="load"))
+        .add("stats", "analyze_data", AgentContext(task="stats"),
+             depends_on=["load"])
+        .add("chart", "plot", AgentContext(task="chart"),
+             depends_on=["load"])
+        .add("report", "render", AgentContext(task="report"),
+             depends_on=["stats", "chart"])
+    )
+    outcome = orchestrator.execute_workflow(workflow, max_workers=4)
+    outcome["report"].data
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable
+
+from .protocols import AgentContext, AgentResult, ResultStatus, TaskPriority
+
+if TYPE_CHECKING:
+    from .orchestrator import AgentOrchestrator
+
+
+# ============================================================================
+# Logging Configuration
+# ============================================================================
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Domain Models
+# ============================================================================
+
+@dataclass(frozen=True)
+class WorkflowNode:
+    """One task in a workflow."""
+    name: str
+    skill_name: str
+    context: AgentContext
+    depends_on: tuple[str, ...] = ()
+
+
+@dataclass
+class WorkflowResult:
+    """
+    Outcome of a workflow run.
+
+    results maps every node name to its AgentResult (in topological
+    order); pruned and cancelled nodes have SKIPPED results. failed lists
+    every other unsuccessful node (FAILURE or REJECTED).
+    """
+    results: dict[str, AgentResult]
+    elapsed_ms: float
+    aborted_by: str | None = None
+    failed: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        """True if every node succeeded."""
+        return not self.failed and not self.skipped
+
+    def __getitem__(self, name: str) -> AgentResult:
+        return self.results[name]
+
+
+# ============================================================================
+# Workflow Definition
+# ============================================================================
+
+class Workflow:
+    """
+    A directed acyclic graph of skill invocations.
+
+    Nodes may only depend on nodes that were added before them, so a
+    workflow is acyclic by construction; topological_order() still
+    verifies it.
+    """
+
+    def __init__(self, name: str = "workflow", upstream_key: str = "upstream"):
+        """
+        Args:
+            name: Label used in logs
+            upstream_key: Parameter under which dependency outputs are
+                          passed to downstream tasks
+        """
+        self.name = name
+        self.upstream_key = upstream_key
+        self._nodes: dict[str, WorkflowNode] = {}
+
+    def add(
+        self,
+        name: str,
+        skill_name: str,
+        context: AgentContext | None = None,
+        depends_on: Iterable[str] = ()
+    ) -> "Workflow":
+        """
+        Add a task.
+
+        Args:
+            name: Unique node name (referenced by depends_on and results)
+            skill_name: Skill to execute
+            context: Execution context (default: AgentContext(task=name))
+            depends_on: Names of previously added nodes whose outputs
+                        this task consumes
+
+        Returns:
+            self, for chaining
+
+        Raises:
+            ValueError: Duplicate name, unknown dependency, or a context
+                        that already uses the upstream parameter key
+        """
+        if name in self._nodes:
+            raise ValueError(f"Duplicate workflow node: {name}")
+
+        depends_on = tuple(dict.fromkeys(depends_on))
+        unknown = [dep for dep in depends_on if dep not in self._nodes]
+        if unknown:
+            raise ValueError(
+                f"Node {name!r} depends on unknown node(s): {', '.join(unknown)}"
+            )
+
+        context = context or AgentContext(task=name)
+        if depends_on and self.upstream_key in context.parameters:
+            raise ValueError(
+                f"Node {name!r} parameters already contain reserved key "
+                f"{self.upstream_key!r}"
+            )
+
+        self._nodes[name] = WorkflowNode(name, skill_name, context, depends_on)
+        return self
+
+    @property
+    def nodes(self) -> dict[str, WorkflowNode]:
+        return dict(self._nodes)
+
+    def dependents(self) -> dict[str, list[str]]:
+        """Reverse edges: node -> nodes that depend on it."""
+        edges: dict[str, list[str]] = {name: [] for name in self._nodes}
+        for node in self._nodes.values():
+            for dep in node.depends_on:
+                edges[dep].append(node.name)
+        return edges
+
+    def topological_order(self) -> list[str]:
+        """
+        Kahn's algorithm; ties keep insertion order.
+
+        Raises:
+            ValueError: If the graph contains a cycle
+        """
+        remaining = {
+            name: len(node.depends_on) for name, node in self._nodes.items()
+        }
+        dependents = self.dependents()
+        ready = [name for name, count in remaining.items() if count == 0]
+        order = []
+
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for child in dependents[name]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    ready.append(child)
+
+        if len(order) != len(self._nodes):
+            cyclic = sorted(set(self._nodes) - set(order))
+            raise ValueError(f"Workflow contains a cycle among: {cyclic}")
+
+        return order
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    # ========================================================================
+    # Execution
+    # ========================================================================
+
+    def run(
+        self,
+        orchestrator: AgentOrchestrator,
+        max_workers: int = 8
+    ) -> WorkflowResult:
+        """
+        Execute the workflow on a thread pool.
+
+        Prefer AgentOrchestrator.execute_workflow, which delegates here.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+
+        order = self.topological_order()
+        dependents = self.dependents()
+        waiting = {
+            name: len(node.depends_on) for name, node in self._nodes.items()
+        }
+        results: dict[str, AgentResult] = {}
+        running: dict[Future, str] = {}
+        aborted_by: str | None = None
+        start = time.perf_counter()
+
+        logger.info(f"🚀 Running workflow {self.name!r} ({len(self)} tasks)")
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f"workflow-{self.name}"
+        ) as pool:
+
+            def submit(name: str) -> None:
+                node = self._nodes[name]
+                running[pool.submit(
+                    orchestrator.execute_task,
+                    node.skill_name,
+                    self._bind_upstream(node, results)
+                )] = name
+
+            for name in order:
+                if waiting[name] == 0:
+                    submit(name)
+
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    name = running.pop(future)
+                    node = self._nodes[name]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = orchestrator._create_exception_result(e)
+                    results[name] = result
+
+                    if result.success:
+                        for child in dependents[name]:
+                            waiting[child] -= 1
+                            if waiting[child] == 0 and child not in results:
+                                submit(child)
+                        continue
+
+                    if node.context.priority == TaskPriority.CRITICAL:
+                        aborted_by = name
+                    else:
+                        self._prune(name, dependents, results)
+
+                if aborted_by is not None:
+                    for future in running:
+                        future.cancel()
+                    logger.error(
+                        f"⚠ Critical task failed: {aborted_by}, "
+                        f"aborting workflow {self.name!r}"
+                    )
+                    break
+
+        # Tasks already running at abort time finished before the pool
+        # shut down; keep their real results
+        for future, name in running.items():
+            if not future.cancelled():
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    results[name] = orchestrator._create_exception_result(e)
+
+        # Cancelled or never-started tasks
+        for name in order:
+            if name not in results:
+                results[name] = _skipped_result(
+                    self._nodes[name],
+                    f"workflow aborted by critical task {aborted_by!r}"
+                )
+
+        outcome = WorkflowResult(
+            results={name: results[name] for name in order},
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+            aborted_by=aborted_by,
+            # REJECTED (admission control) and FAILURE both count as failed
+            failed=[n for n in order
+                    if not results[n].success
+                    and results[n].status != ResultStatus.SKIPPED],
+            skipped=[n for n in order
+                     if results[n].status == ResultStatus.SKIPPED],
+        )
+
+        status_symbol = "✓" if outcome.success else "✗"
+        logger.info(
+            f"{status_symbol} Workflow {self.name!r}: "
+            f"{len(order) - len(outcome.failed) - len(outcome.skipped)} ok, "
+            f"{len(outcome.failed)} failed, {len(outcome.skipped)} skipped "
+            f"({outcome.elapsed_ms:.2f}ms)"
+        )
+        return outcome
+
+    # ========================================================================
+    # Implementation (Private)
+    # ========================================================================
+
+    def _bind_upstream(
+        self,
+        node: WorkflowNode,
+        results: dict[str, AgentResult]
+    ) -> AgentContext:
+        """Context with dependency outputs passed by reference."""
+        if not node.depends_on:
+            return node.context
+
+        upstream = {dep: results[dep].data for dep in node.depends_on}
+        return node.context.derive(parameters={self.upstream_key: upstream})
+
+    def _prune(
+        self,
+        failed: str,
+        dependents: dict[str, list[str]],
+        results: dict[str, AgentResult]
+    ) -> None:
+        """Mark every not-yet-run descendant of a failed node SKIPPED."""
+        stack = list(dependents[failed])
+        while stack:
+            name = stack.pop()
+            if name in results:
+                continue
+            results[name] = _skipped_result(
+                self._nodes[name], f"upstream task {failed!r} failed"
+            )
+            stack.extend(dependents[name])
+
+        logger.warning(f"⊝ Pruned descendants of failed task {failed!r}")
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def _skipped_result(node: WorkflowNode, reason: str) -> AgentResult:
+    return AgentResult.trusted(
+        status=ResultStatus.SKIPPED,
+        data=None,
+        message=f"Skipped {node.name}: {reason}",
+        metadata={
+            "skill_name": node.skill_name,
+            "workflow_node": node.name
+        }
+    )